@@ -0,0 +1,210 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: Many games of Focus (Domination) stored as NumPy arrays and stepped together,
+# one move per game per call, following the rules of FocusGame.
+
+import numpy as np
+from FocusGame import RULES, STATUS_INVALID, STATUS_MOVED, STATUS_WON
+
+
+class BatchedFocus:
+    """
+    Holds K games of Focus in NumPy arrays and applies one move to every game in a single call.
+    Player 0 plays the first color of a FocusGame and player 1 the second.
+    pieces has shape (K, 6, 6, 5) and holds the player of each piece, bottom piece first;
+    only the first heights[k, row, column] entries of a stack are pieces.
+    reserves and captured have shape (K, 2), indexed by player.
+    last holds the player who moved last in each game (-1 if no one has), and done/winner hold
+    which games are over and who won them (-1 if no one has).
+    """
+
+    def __init__(self, games):
+        """takes the number of games K, creates K games at the starting position"""
+        self._pieces = np.zeros((games, 6, 6, 5), dtype=np.int8)
+        self._heights = np.zeros((games, 6, 6), dtype=np.int8)
+        self._reserves = np.zeros((games, 2), dtype=np.int16)
+        self._captured = np.zeros((games, 2), dtype=np.int16)
+        self._last = np.zeros(games, dtype=np.int8)
+        self._done = np.zeros(games, dtype=bool)
+        self._winner = np.zeros(games, dtype=np.int8)
+        self.reset()
+
+    def reset(self, mask=None):
+        """
+        takes an optional boolean array of shape (K,), puts the chosen games (all games if no mask)
+        back at the starting position, with the pieces in the same pattern as Board.
+        """
+        if mask is None:
+            mask = np.ones(len(self._done), dtype=bool)
+        rows = np.arange(6)[:, None]
+        columns = np.arange(6)[None, :]
+        start = np.where((rows % 2 == 0) == np.isin(columns, (0, 1, 4, 5)), 0, 1).astype(np.int8)
+        self._pieces[mask] = 0
+        self._pieces[mask, :, :, 0] = start
+        self._heights[mask] = 1
+        self._reserves[mask] = 0
+        self._captured[mask] = 0
+        self._last[mask] = -1
+        self._done[mask] = False
+        self._winner[mask] = -1
+
+    def set_game(self, index, game):
+        """
+        takes the index of a game in the batch and a FocusGame,
+        copies the FocusGame's pieces, reserve and captured counts, last player and state into that game.
+        A stack higher than five keeps only its top five pieces.
+        raises ValueError if the FocusGame is not played with the 6x6 game's Rules.
+        """
+        if game.get_rules() is not RULES:
+            raise ValueError("a BatchedFocus only holds games with the 6x6 rules")
+        players = [game.get_player_a(), game.get_player_b()]
+        colors = [player.get_color() for player in players]
+        for row in range(0, 6):
+            for column in range(0, 6):
+                stack = game.show_pieces((row, column))[-5:]
+                self._pieces[index, row, column] = 0
+                self._pieces[index, row, column, :len(stack)] = [colors.index(piece) for piece in stack]
+                self._heights[index, row, column] = len(stack)
+        self._reserves[index] = [player.get_reserve() for player in players]
+        self._captured[index] = [player.get_captured() for player in players]
+        self._last[index] = -1 if game.get_last_player() is None else players.index(game.get_last_player())
+        self._winner[index] = -1
+        for player in range(0, 2):
+            if game.get_game_state() == players[player].get_name() + " Wins":
+                self._winner[index] = player
+        self._done[index] = game.get_game_state() != "PLAYING"
+
+    def get_pieces(self):
+        """returns the (K, 6, 6, 5) array of pieces"""
+        return self._pieces
+
+    def get_heights(self):
+        """returns the (K, 6, 6) array of stack heights"""
+        return self._heights
+
+    def get_reserves(self):
+        """returns the (K, 2) array of reserve pieces"""
+        return self._reserves
+
+    def get_captured(self):
+        """returns the (K, 2) array of captured pieces"""
+        return self._captured
+
+    def get_last(self):
+        """returns the (K,) array of the player who moved last in each game"""
+        return self._last
+
+    def get_done(self):
+        """returns the (K,) boolean array of games that are over"""
+        return self._done
+
+    def get_winner(self):
+        """returns the (K,) array of the winner of each game, -1 if it has none"""
+        return self._winner
+
+    def get_tops(self):
+        """returns a (K, 6, 6) array of the player controlling each stack, -1 for empty spaces"""
+        top = np.take_along_axis(self._pieces, np.maximum(self._heights - 1, 0)[..., None], axis=3)[..., 0]
+        return np.where(self._heights > 0, top, -1)
+
+    def compute_done(self):
+        """
+        checks every game at once, like check_endgame: a game is over if a player has captured
+        six or more pieces, or if a player who is next to move controls no stack and has no reserve.
+        updates and returns the done array, with the winners in the winner array.
+        """
+        tops = self.get_tops()
+        for player in range(0, 2):
+            stuck = ~(tops == player).any(axis=(1, 2)) & (self._reserves[:, player] == 0) & (self._last == 1 - player)
+            won = ((self._captured[:, 1 - player] >= 6) | stuck) & ~self._done
+            self._winner[won] = 1 - player
+            self._done |= won
+        return self._done
+
+    def step(self, player, src, dst, num_pieces):
+        """
+        takes (K,) arrays of the player moving in each game and of the number of pieces to move,
+        and (K, 2) arrays of source and destination coordinates (row, column).
+        a number of pieces of 0 makes a reserve move onto the destination, and the source is ignored.
+        checks every move with the rules of verify_move, verify_stack_move and reserved_move, then makes
+        all the valid moves at once, including removing pieces from the bottom of stacks higher than five
+        into the mover's reserve or captured pieces, stopping at the sixth capture like move_piece.
+        After a winning capture the stack keeps its top five pieces.
+        returns a (K,) array of STATUS_INVALID, STATUS_MOVED or STATUS_WON for each game.
+        """
+        player = np.asarray(player, dtype=np.int64)
+        src = np.asarray(src, dtype=np.int64)
+        dst = np.asarray(dst, dtype=np.int64)
+        num_pieces = np.asarray(num_pieces, dtype=np.int64)
+        games = np.arange(len(self._done))
+        status = np.full(len(self._done), STATUS_INVALID, dtype=np.int8)
+
+        reserve = num_pieces == 0
+        dst_ok = ((dst >= 0) & (dst < 6)).all(axis=1)
+        src_ok = ((src >= 0) & (src < 6)).all(axis=1)
+        sr = np.clip(src[:, 0], 0, 5)
+        sc = np.clip(src[:, 1], 0, 5)
+        dr = np.clip(dst[:, 0], 0, 5)
+        dc = np.clip(dst[:, 1], 0, 5)
+        src_height = self._heights[games, sr, sc].astype(np.int64)
+        src_top = self.get_tops()[games, sr, sc]
+        straight = (src[:, 0] == dst[:, 0]) | (src[:, 1] == dst[:, 1])
+        distance = np.abs(src[:, 0] - dst[:, 0]) + np.abs(src[:, 1] - dst[:, 1])
+        stack_ok = (src_ok & straight & (distance == num_pieces) & (num_pieces >= 1)
+                    & (num_pieces <= src_height) & (src_top == player))
+        reserve_ok = self._reserves[games, np.clip(player, 0, 1)] >= 1
+        valid = (~self._done & (self._last != player) & dst_ok & (player >= 0) & (player <= 1)
+                 & np.where(reserve, reserve_ok, stack_ok))
+
+        idx = np.nonzero(valid)[0]
+        if len(idx) == 0:
+            return status
+        mover = player[idx]
+        moving = np.where(reserve[idx], 1, num_pieces[idx])
+        sr, sc, dr, dc = sr[idx], sc[idx], dr[idx], dc[idx]
+        levels = np.arange(10)
+
+        dst_height = self._heights[idx, dr, dc].astype(np.int64)
+        dst_pieces = np.zeros((len(idx), 10), dtype=np.int8)
+        dst_pieces[:, :5] = self._pieces[idx, dr, dc]
+        moved_level = levels[None, :] - dst_height[:, None]
+        in_moved = (moved_level >= 0) & (moved_level < moving[:, None])
+        src_level = np.clip(src_height[idx][:, None] - moving[:, None] + moved_level, 0, 4)
+        moved = np.where(reserve[idx][:, None], mover[:, None],
+                         np.take_along_axis(self._pieces[idx, sr, sc], src_level, axis=1))
+        combined = np.where(levels[None, :] < dst_height[:, None], dst_pieces, np.where(in_moved, moved, 0))
+
+        total = dst_height + moving
+        overflow = np.maximum(total - 5, 0)
+        trimmed = levels[None, :] < overflow[:, None]
+        captures = trimmed & (combined != mover[:, None])
+        keeps = trimmed & (combined == mover[:, None])
+        captured_before = self._captured[idx, mover].astype(np.int64)
+        winning = captures & (captured_before[:, None] + np.cumsum(captures, axis=1) >= 6)
+        won = winning.any(axis=1)
+        counted = levels[None, :] <= np.where(won, np.argmax(winning, axis=1), 9)[:, None]
+
+        self._pieces[idx, dr, dc] = np.take_along_axis(combined, np.clip(levels[None, :5] + overflow[:, None], 0, 9),
+                                                       axis=1)
+        self._heights[idx, dr, dc] = total - overflow
+        stack_moves = ~reserve[idx]
+        self._heights[idx[stack_moves], sr[stack_moves], sc[stack_moves]] -= moving[stack_moves].astype(np.int8)
+        self._captured[idx, mover] += (captures & counted).sum(axis=1).astype(np.int16)
+        self._reserves[idx, mover] += (keeps & counted).sum(axis=1).astype(np.int16)
+        spent = reserve[idx] & ~won
+        self._reserves[idx[spent], mover[spent]] -= 1
+
+        status[idx] = np.where(won, STATUS_WON, STATUS_MOVED)
+        self._done[idx[won]] = True
+        self._winner[idx[won]] = mover[won]
+        going_on = idx[~won]
+        self._last[going_on] = mover[~won]
+
+        tops = self.get_tops()[going_on]
+        opponent = 1 - mover[~won]
+        stuck = (~(tops == opponent[:, None, None]).any(axis=(1, 2))
+                 & (self._reserves[going_on, opponent] == 0))
+        self._done[going_on[stuck]] = True
+        self._winner[going_on[stuck]] = mover[~won][stuck]
+        status[going_on[stuck]] = STATUS_WON
+        return status
@@ -0,0 +1,213 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: Benchmarks of the FocusGame engine, from creating a board to playing whole random games,
+# with fixed seeds and positions, saved as JSON and compared against a stored baseline.
+# bench_baseline.json holds the results of the default runs, for use with --baseline bench_baseline.json.
+
+import argparse
+import contextlib
+import io
+import json
+import random
+import sys
+import time
+from FocusGame import Board, PackedBoard, FocusGame
+from FocusPerft import PLAYERS, position_game
+
+BACKENDS = {"board": Board, "packed": PackedBoard}
+SEED = 20201122
+
+
+def new_game(board_class):
+    """takes a board class, returns a FocusGame at the starting position"""
+    return FocusGame(PLAYERS[0], PLAYERS[1], board_class)
+
+
+def bench_create_game(board_class, number):
+    """creates number FocusGames"""
+    start = time.perf_counter()
+    for count in range(0, number):
+        FocusGame(PLAYERS[0], PLAYERS[1], board_class)
+    return time.perf_counter() - start
+
+
+def bench_create_board(board_class, number):
+    """creates number boards"""
+    start = time.perf_counter()
+    for count in range(0, number):
+        board_class("R", "G")
+    return time.perf_counter() - start
+
+
+def bench_single_move(board_class, number):
+    """moves one piece one space in number new games"""
+    games = [new_game(board_class) for count in range(0, number)]
+    start = time.perf_counter()
+    for game in games:
+        game.move_piece("Jim", (0, 0), (0, 1), 1)
+    return time.perf_counter() - start
+
+
+def bench_multi_move(board_class, number):
+    """moves three pieces three spaces in number games"""
+    games = [new_game(board_class) for count in range(0, number)]
+    for game in games:
+        game.get_board().get_stack((0, 0)).add("G")
+        game.get_board().get_stack((0, 0)).add("R")         # sets (0, 0) to RGR
+    start = time.perf_counter()
+    for game in games:
+        game.move_piece("Jim", (0, 0), (0, 3), 3)
+    return time.perf_counter() - start
+
+
+def bench_reserve_move(board_class, number):
+    """places a reserve piece in number games"""
+    games = [new_game(board_class) for count in range(0, number)]
+    for game in games:
+        game.get_player_a().inc_reserve()
+    start = time.perf_counter()
+    for game in games:
+        game.reserved_move("Jim", (0, 2))
+    return time.perf_counter() - start
+
+
+def bench_overflow_capture(board_class, number):
+    """moves three pieces onto a stack of five, trimming and capturing, in number games"""
+    games = [new_game(board_class) for count in range(0, number)]
+    for game in games:
+        for color in ["R", "G", "R", "G"]:
+            game.get_board().get_stack((0, 0)).add("R")     # sets (0, 0) to RRRRR
+            game.get_board().get_stack((0, 3)).add(color)   # sets (0, 3) to GRGRG
+    start = time.perf_counter()
+    for game in games:
+        game.move_piece("Jim", (0, 0), (0, 3), 3)
+    return time.perf_counter() - start
+
+
+def bench_print_board(board_class, number):
+    """prints the board of number games, each printed once before a move, to a discarded output"""
+    games = [new_game(board_class) for count in range(0, number)]
+    with contextlib.redirect_stdout(io.StringIO()) as output:
+        for game in games:
+            game.get_board().print_board()
+            game.move_piece("Jim", (0, 0), (0, 1), 1)
+        output.seek(0)
+        output.truncate()
+        start = time.perf_counter()
+        for game in games:
+            game.get_board().print_board()
+        return time.perf_counter() - start
+
+
+def bench_check_endgame(board_class, number):
+    """checks a test position for the end of the game number times"""
+    game = position_game("reserve", board_class)[0]
+    player = game.get_player_a()
+    start = time.perf_counter()
+    for count in range(0, number):
+        game.check_endgame(player)
+    return time.perf_counter() - start
+
+
+def bench_random_games(board_class, number):
+    """plays number // 1000 + 1 whole games of random legal moves, each from its own fixed seed"""
+    names = (PLAYERS[0][0], PLAYERS[1][0])
+    start = time.perf_counter()
+    for seed in range(0, number // 1000 + 1):
+        rng = random.Random(SEED + seed)
+        game = new_game(board_class)
+        turn = 0
+        while game.get_game_state() == "PLAYING":
+            moves = list(game.legal_moves(names[turn]))
+            if not moves:
+                break
+            move = rng.choice(moves)
+            if move[0] == "move":
+                game.move_piece(names[turn], move[1], move[2], move[3])
+            else:
+                game.reserved_move(names[turn], move[1])
+            turn = 1 - turn
+    return time.perf_counter() - start
+
+
+BENCHMARKS = {"create_game": bench_create_game, "create_board": bench_create_board,
+              "single_move": bench_single_move, "multi_move": bench_multi_move,
+              "reserve_move": bench_reserve_move, "overflow_capture": bench_overflow_capture,
+              "print_board": bench_print_board, "check_endgame": bench_check_endgame,
+              "random_games": bench_random_games}
+
+
+def operations(name, number):
+    """takes the name of a benchmark and its number, returns how many operations one run of it times"""
+    if name == "random_games":
+        return number // 1000 + 1
+    return number
+
+
+def run_benchmarks(number=10000, repeat=3, names=None, backends=None):
+    """
+    takes the number of operations per run, the number of runs and optional lists of benchmark and backend
+    names (all of them if None). runs every benchmark on every backend, keeping the fastest of the runs.
+    returns a dictionary from "benchmark/backend" to the operations, best seconds and operations per second.
+    """
+    results = {}
+    for name in names or list(BENCHMARKS):
+        for backend in backends or sorted(BACKENDS):
+            seconds = min(BENCHMARKS[name](BACKENDS[backend], number) for run in range(0, repeat))
+            count = operations(name, number)
+            results[name + "/" + backend] = {"operations": count, "seconds": seconds,
+                                             "ops_per_second": count / seconds if seconds > 0 else 0.0}
+    return results
+
+
+def compare(results, baseline, tolerance=0.1):
+    """
+    takes results from run_benchmarks, baseline results in the same form and the fraction of slowdown
+    to allow. returns a list of (key, baseline ops/s, ops/s, ratio, slower) for every key in both,
+    slower being True when the ratio of the rates is below 1 - tolerance.
+    """
+    rows = []
+    for key in sorted(results):
+        if key not in baseline or not baseline[key]["ops_per_second"]:
+            continue
+        before = baseline[key]["ops_per_second"]
+        after = results[key]["ops_per_second"]
+        rows.append((key, before, after, after / before, after / before < 1 - tolerance))
+    return rows
+
+
+def main(argv=None):
+    """
+    runs the benchmarks from the command line, prints them, optionally saves them as JSON and compares
+    them against a saved baseline, exiting with status 1 if any benchmark got slower than the tolerance.
+    """
+    parser = argparse.ArgumentParser(description="Benchmarks the Focus game engine.")
+    parser.add_argument("--number", type=int, default=10000, help="operations per run")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark, the fastest is kept")
+    parser.add_argument("--bench", action="append", choices=list(BENCHMARKS))
+    parser.add_argument("--backend", action="append", choices=sorted(BACKENDS))
+    parser.add_argument("--output", help="save the results to this JSON file")
+    parser.add_argument("--baseline", help="compare against the results in this JSON file, "
+                                           "such as bench_baseline.json")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="the fraction of slowdown allowed")
+    args = parser.parse_args(argv)
+
+    results = run_benchmarks(args.number, args.repeat, args.bench, args.backend)
+    for key in results:
+        print("{0:28} {1[operations]:>8} ops {1[seconds]:9.4f}s {1[ops_per_second]:>14.0f} ops/s".format(
+            key, results[key]))
+    if args.output:
+        with open(args.output, "w") as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            rows = compare(results, json.load(baseline), args.tolerance)
+        for key, before, after, ratio, slower in rows:
+            print("{0:28} {1:>14.0f} -> {2:>14.0f} ops/s {3:6.2f}x{4}".format(
+                key, before, after, ratio, "  SLOWER" if slower else ""))
+        if any(row[4] for row in rows):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
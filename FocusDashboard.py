@@ -0,0 +1,100 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: Draws live Focus (Domination) games in a terminal with ANSI escape codes,
+# redrawing only the spaces whose controlling color changed since the last frame.
+
+import sys
+
+CLEAR = "\x1b[2J"
+
+
+def move_to(row, column):
+    """takes a 1-based terminal row and column, returns the escape code that moves the cursor there"""
+    return "\x1b[" + str(row) + ";" + str(column) + "H"
+
+
+class BoardRenderer:
+    """
+    Draws one game's board at a fixed place in the terminal, two characters per space,
+    with a status line of each player's captured and reserve pieces under it.
+    Each frame only redraws the spaces the board reports as changed and the status line if it changed,
+    so watching a game costs a few escape codes per move instead of the whole board.
+    """
+
+    def __init__(self, game, top=1, left=1, title=""):
+        """takes a FocusGame, the 1-based terminal row and column of the board's corner and a title"""
+        self._game = game
+        self._top = top
+        self._left = left
+        self._title = title
+        self._status = None
+        game.get_board().take_changed()         # the first frame draws everything
+
+    def get_width(self):
+        """returns the number of terminal columns the renderer draws in"""
+        return max(2 * self._game.get_rules().get_size(), len(self._title), 20)
+
+    def get_height(self):
+        """returns the number of terminal rows the renderer draws in"""
+        return self._game.get_rules().get_size() + 2
+
+    def status(self):
+        """returns the status line: the game state and each player's captured and reserve pieces"""
+        game = self._game
+        line = game.get_game_state()
+        for player in (game.get_player_a(), game.get_player_b()):
+            line += " " + player.get_color() + ":" + str(player.get_captured()) + "/" + str(player.get_reserve())
+        return line
+
+    def frame(self, full=False):
+        """
+        takes whether to draw everything, returns the escape codes and text that bring the terminal's picture
+        of the game up to date: every space on the first frame or when full is True, else only changed ones.
+        """
+        board = self._game.get_board()
+        colored = board.get_colored_board()
+        changed = board.take_changed()
+        parts = []
+        if full or self._status is None:
+            parts.append(move_to(self._top, self._left) + self._title.ljust(self.get_width()))
+            changed = [coord for row in self._game.get_rules().get_coords() for coord in row]
+            self._status = None
+        for coord in changed:
+            parts.append(move_to(self._top + 1 + coord[0], self._left + 2 * coord[1]) + colored[coord[0]][coord[1]])
+        status = self.status()
+        if status != self._status:
+            parts.append(move_to(self._top + 1 + len(colored), self._left) + status.ljust(self.get_width()))
+            self._status = status
+        return "".join(parts)
+
+
+class Dashboard:
+    """
+    Lays out a BoardRenderer for each of many games in a grid of panels and writes each frame
+    to the terminal in one write.
+    """
+
+    def __init__(self, games, columns=4, stream=None):
+        """takes a list of (title, FocusGame), the number of panels per row and a text stream (standard output)"""
+        self._stream = stream or sys.stdout
+        self._renderers = []
+        top = 1
+        left = 1
+        for index in range(0, len(games)):
+            if index and index % columns == 0:
+                top += self._renderers[-1].get_height() + 1
+                left = 1
+            renderer = BoardRenderer(games[index][1], top, left, games[index][0])
+            self._renderers.append(renderer)
+            left += renderer.get_width() + 2
+        self._first = True
+
+    def draw(self):
+        """writes one frame of every game, clearing the screen first on the first frame, returns its length"""
+        text = "".join(renderer.frame() for renderer in self._renderers)
+        if self._first:
+            text = CLEAR + text
+            self._first = False
+        self._stream.write(text)
+        self._stream.flush()
+        return len(text)
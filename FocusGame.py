@@ -3,6 +3,276 @@
 # Description: Creates a playable "Focus" ("Domination" Game), but on a 6x6 board,
 # for two players, and a player wins if they capture six or more pieces.
 
+import random
+import struct
+from array import array
+
+
+def build_reach(size):
+    """
+    takes the width of a square board
+    returns a table of the spaces a stack can reach, indexed by source coordinate and then by distance.
+    reach[(row, column)][distance] is a list of the coordinates exactly that many spaces away
+    in a straight line up, down, left or right, so a stack of height h can move num_pieces
+    pieces to any space in reach[src][num_pieces] for 1 <= num_pieces <= h.
+    """
+    reach = {}
+    for row in range(0, size):
+        for column in range(0, size):
+            by_distance = [[]]
+            for distance in range(1, size):
+                spaces = []
+                for dst in ((row - distance, column), (row + distance, column),
+                            (row, column - distance), (row, column + distance)):
+                    if 0 <= dst[0] < size and 0 <= dst[1] < size:
+                        spaces.append(dst)
+                by_distance.append(spaces)
+            reach[(row, column)] = by_distance
+    return reach
+
+
+def build_zobrist(squares, levels, seed):
+    """
+    takes the number of spaces on a board, the number of heights a piece can be at and a random seed.
+    returns a table of random 64-bit keys indexed by space, height and piece (0 for the first color,
+    1 for the second). The hash of a position is the exclusive or of the keys of all its pieces.
+    The seed is fixed so every process builds the same keys and positions hash the same everywhere.
+    """
+    rng = random.Random(seed)
+    return [[[rng.getrandbits(64), rng.getrandbits(64)] for level in range(0, levels)]
+            for square in range(0, squares)]
+
+
+ZOBRIST_TURN = build_zobrist(3, 1, 20201123)        # [no one/player a/player b moved last][0][0]
+
+# the piece on top of every 16-bit packed cell (see PackedBoard): 0 if empty, 1 for the first color, 2 for the second.
+# the cells of height h are 2**h to 2**(h+1) - 1, the first half with a piece of the first color on top
+PACKED_TOPS = b"\x00\x00" + b"".join(b"\x01" * (1 << level) + b"\x02" * (1 << level) for level in range(0, 15))
+
+
+def build_packed_keys(zobrist):
+    """
+    takes a Zobrist table from build_zobrist,
+    returns, for every space, the hash of each of the 64 cells that hold at most five pieces.
+    """
+    packed_keys = []
+    for keys in zobrist:
+        by_cell = [0]
+        for cell in range(1, 64):
+            key = 0
+            for level in range(0, cell.bit_length() - 1):
+                key ^= keys[level][(cell >> level) & 1]
+            by_cell.append(key)
+        packed_keys.append(by_cell)
+    return packed_keys
+
+
+def cell_features(cell, tall_height):
+    """
+    takes a packed cell (see PackedBoard) and the height from which a stack is tall,
+    returns the stack's part of the evaluation features: (pieces of the first color buried under the second,
+    pieces of the second color buried under the first, 1 if the stack is tall and the first color controls it
+    else 0, the same for the second color). a buried piece is under a stack the other color controls,
+    so it can be captured.
+    """
+    height = cell.bit_length() - 1
+    if height == 0:
+        return 0, 0, 0, 0
+    tall = int(height >= tall_height)
+    seconds = bin(cell).count("1") - 1          # pieces of the second color, less the marker bit
+    if (cell >> (height - 1)) & 1:
+        return height - seconds, 0, 0, tall
+    return 0, seconds, tall, 0
+
+
+class Rules:
+    """
+    Takes the width of a square board, the most pieces a stack may hold and the number of captures that wins.
+    Holds that configuration with the tables built from it once, so moves never compute them:
+    the coordinates of every space, the set of spaces on the board, the spaces a stack can reach
+    from each space, the Zobrist keys of every piece at every height of every space and the
+    starting position.
+    Boards and games with the same configuration share one Rules object, see rules_for.
+    """
+
+    def __init__(self, size=6, max_height=5, win_captures=6):
+        """
+        takes the width of the board (2 to 64 spaces), the most pieces a stack may hold (1 to 14)
+        and the number of captures that wins, builds the tables for them.
+        a reserve piece is placed before the stack is trimmed, so a stack briefly holds one piece more
+        than the most, which must still fit the fifteen pieces of a packed cell and of the Zobrist table.
+        """
+        if not 2 <= size <= 64:             # encode_move has six bits for each coordinate
+            raise ValueError("the board must be 2 to 64 spaces wide")
+        if not 1 <= max_height <= 14:       # and four bits for the number of pieces moved
+            raise ValueError("a stack must hold 1 to 14 pieces")
+        if not 1 <= win_captures <= 0xFFFFFFFF:     # to_bytes keeps it in four bytes
+            raise ValueError("a win must take 1 to 4294967295 captures")
+        self._size = size
+        self._max_height = max_height
+        self._win_captures = win_captures
+        self._coords = [[(row, column) for column in range(0, size)] for row in range(0, size)]
+        self._squares = [coord for row in self._coords for coord in row]
+        self._spaces = frozenset(self._squares)
+        self._reach = build_reach(size)
+        self._zobrist = build_zobrist(size * size, 15, 20201122)
+        self._count_keys = build_zobrist(4, size * size + 1, 20201124)     # a player holds at most every piece
+        self._packed_keys = build_packed_keys(self._zobrist)
+        self._packed_features = [None] * 64
+        for cell in range(1, 64):
+            self._packed_features[cell] = cell_features(cell, self.get_tall_height())
+        self._start_rows = []
+        for row in range(0, size):              # 0 for a piece of the first color, 1 for the second
+            self._start_rows.append(tuple((int((row % 2 == 0) != (column // 2 % 2 == 0)), self._coords[row][column])
+                                          for column in range(0, size)))
+        self._start_cells = array("H", [0b10 | piece for row in self._start_rows for piece, coord in row])
+        self._start_owned = (sum(1 << index for index in range(0, size * size) if self._start_cells[index] == 0b10),
+                             sum(1 << index for index in range(0, size * size) if self._start_cells[index] == 0b11))
+        self._start_hash = 0
+        start_features = [0, 0, 0, 0]
+        for index in range(0, size * size):
+            self._start_hash ^= self.get_cell_key(index, self._start_cells[index])
+            for feature in range(0, 4):
+                start_features[feature] += self.get_cell_features(self._start_cells[index])[feature]
+        self._start_features = tuple(start_features)
+
+    def get_size(self):
+        """returns the width of the board"""
+        return self._size
+
+    def get_max_height(self):
+        """returns the most pieces a stack may hold after a move"""
+        return self._max_height
+
+    def get_win_captures(self):
+        """returns the number of captured pieces that wins the game"""
+        return self._win_captures
+
+    def get_tall_height(self):
+        """returns the height from which a stack counts as tall in the evaluation features, one below the most"""
+        return max(2, self._max_height - 1)
+
+    def get_coords(self):
+        """returns the list of rows of coordinate tuples, shared by every board with these rules"""
+        return self._coords
+
+    def get_spaces(self):
+        """returns the frozenset of every coordinate on the board"""
+        return self._spaces
+
+    def get_squares(self):
+        """
+        returns the list of every coordinate tuple in row-major order, indexed by square number:
+        the space (row, column) is square row * size + column, and bit row * size + column of a board's masks.
+        """
+        return self._squares
+
+    def get_reach(self):
+        """returns the table of the spaces a stack can reach, see build_reach"""
+        return self._reach
+
+    def get_zobrist(self):
+        """returns the Zobrist keys of the pieces, indexed by space in row-major order, height and piece"""
+        return self._zobrist
+
+    def get_start_rows(self):
+        """
+        returns the starting position as a tuple per row of (piece, coordinates) pairs,
+        the piece 0 for the first color and 1 for the second.
+        """
+        return self._start_rows
+
+    def get_start_cells(self):
+        """returns the array of the packed cells of the starting position (see PackedBoard), in row-major order"""
+        return self._start_cells
+
+    def get_start_owned(self):
+        """returns a tuple of the masks of the squares each color controls at the start, see Board.get_owned_mask"""
+        return self._start_owned
+
+    def get_start_hash(self):
+        """returns the Zobrist hash of the pieces of the starting position, see Board.get_hash"""
+        return self._start_hash
+
+    def get_start_features(self):
+        """returns the evaluation features of the starting position, see Board.get_features"""
+        return self._start_features
+
+    def get_cell_key(self, index, cell):
+        """
+        takes the number of a square and a packed cell (see PackedBoard),
+        returns the exclusive or of the Zobrist keys of the cell's pieces at their heights on that square.
+        """
+        if cell < 64:                               # stacks of up to five pieces have a precomputed key
+            return self._packed_keys[index][cell]
+        keys = self._zobrist[index]
+        key = 0
+        for level in range(0, cell.bit_length() - 1):
+            key ^= keys[level][(cell >> level) & 1]
+        return key
+
+    def get_cell_features(self, cell):
+        """takes a packed cell (see PackedBoard), returns the stack's part of the evaluation features"""
+        if cell < 64:                               # stacks of up to five pieces have precomputed features
+            return self._packed_features[cell]
+        return cell_features(cell, self.get_tall_height())
+
+    def get_count_keys(self):
+        """
+        returns the Zobrist keys of the players' counts, indexed by [a reserve/a captured/b reserve/b captured],
+        count (0 to every piece of the starting position) and 0.
+        """
+        return self._count_keys
+
+    def get_packed_features(self):
+        """returns the evaluation features of each packed cell of up to five pieces, see cell_features"""
+        return self._packed_features
+
+    def get_packed_keys(self):
+        """returns the hash of each packed cell of up to five pieces for every space, see build_packed_keys"""
+        return self._packed_keys
+
+
+RULES_BY_CONFIG = {}
+
+
+def rules_for(size=6, max_height=5, win_captures=6):
+    """
+    takes the width of the board, the most pieces a stack may hold and the number of captures that wins,
+    returns the Rules for them, building them the first time a configuration is asked for.
+    """
+    config = (size, max_height, win_captures)
+    if config not in RULES_BY_CONFIG:
+        RULES_BY_CONFIG[config] = Rules(size, max_height, win_captures)
+    return RULES_BY_CONFIG[config]
+
+
+RULES = rules_for()         # the 6x6 game with five-piece stacks, won by six captures
+
+
+def encode_move(move):
+    """
+    takes a move in the form yielded by FocusGame.legal_moves, returns it packed into one integer:
+    the number of pieces in bits 0-3 (0 for a reserve move), then six bits each for the destination
+    column and row and the source column and row.
+    """
+    if move[0] == "reserve":
+        return (move[1][1] << 4) | (move[1][0] << 10)
+    return move[3] | (move[2][1] << 4) | (move[2][0] << 10) | (move[1][1] << 16) | (move[1][0] << 22)
+
+
+STATUS_INVALID = 0      # the move was not made
+STATUS_MOVED = 1        # the move was made and the game goes on
+STATUS_WON = 2          # the move was made and won the game
+
+
+def decode_move(code):
+    """takes an integer from encode_move, returns the move in the form yielded by FocusGame.legal_moves"""
+    dst = ((code >> 10) & 63, (code >> 4) & 63)
+    if code & 15 == 0:
+        return "reserve", dst
+    return "move", ((code >> 22) & 63, (code >> 16) & 63), dst, code & 15
+
 
 class Player:
     """
@@ -10,6 +280,8 @@ class Player:
     Referenced in the FocusGame class to represent a player.
     """
 
+    __slots__ = ("_name", "_color", "_captured", "_reserve")
+
     def __init__(self, player):
         """
         takes a tuple with two strings (name, color)
@@ -48,26 +320,55 @@ class Player:
         """Decrements the number of pieces player has in reserve"""
         self._reserve -= 1
 
+    def set_captured(self, captured):
+        """Sets the number of pieces player has captured"""
+        self._captured = captured
+
+    def set_reserve(self, reserve):
+        """Sets the number of pieces player has in reserve"""
+        self._reserve = reserve
+
 
 class Stack:
     """
     Represents a stack on the board. May contain 0 to 5 pieces and can be moved by a player
     whose piece is on top.
+    The pieces are kept in a tuple that is replaced when they change, so stacks with the same pieces
+    may share one, as the stacks of a board built from packed cells do.
     Referenced by Board and FocusGame classes to represent a space on the board holding multiple pieces.
     """
 
-    def __init__(self, color):
-        """creates a Stack object containing one piece of the specified color."""
+    __slots__ = ("_color", "_stack", "_height", "_board", "_coord")
+
+    def __init__(self, color, board=None, coord=None):
+        """
+        creates a Stack object containing one piece of the specified color,
+        on the Board and at the coordinates entered, if any (see set_board).
+        """
         self._color = color    # the player allowed to move the stack
-        self._stack = [color]   # the contents of the stack
+        self._stack = (color,)  # the contents of the stack
         self._height = 1             # how many pieces are in a stack
+        self._board = board         # the Board told when the stack changes
+        self._coord = coord         # the stack's coordinates on that board
+
+    def set_board(self, board, coord):
+        """
+        takes a Board and a tuple with the stack's coordinates on it.
+        from then on, the board is told whenever the stack's pieces or controlling color change.
+        """
+        self._board = board
+        self._coord = coord
 
     def get_color(self):
         """returns the color of the player who is allowed to move the stack"""
         return self._color
 
     def get_stack(self):
-        """returns the list of the stack's contents (bottom piece at index 0)"""
+        """returns a list of the stack's contents (bottom piece at index 0)"""
+        return list(self._stack)
+
+    def get_pieces(self):
+        """returns the tuple of the stack's contents (bottom piece at index 0), without copying it"""
         return self._stack
 
     def get_height(self):
@@ -76,7 +377,10 @@ class Stack:
 
     def set_color(self, color):
         """changes the color currently in control of the stack"""
+        old_color = self._color
         self._color = color
+        if self._board is not None and color != old_color:
+            self._board.stack_changed(self._coord, old_color, color)
 
     def inc_height(self):
         """adds one to the height of the stack"""
@@ -91,40 +395,107 @@ class Stack:
         removes a piece from the top of the stack
         if the last piece was removed, changes the color controlling the stack to None.
         """
-        del self._stack[-1]
+        old_color = self._color
+        self._stack = self._stack[:-1]
         self.dec_height()
-        if self._height == 0:
-            self._color = None
-        else:
-            self.set_color(self._stack[-1])
+        self._color = self._stack[-1] if self._height else None
+        if self._board is not None:
+            self._board.stack_changed(self._coord, old_color, self._color)
 
     def off_bottom(self):
-        """removes a piece from the bottom of the stack"""
-        del self._stack[0]
+        """
+        removes a piece from the bottom of the stack
+        if the last piece was removed, changes the color controlling the stack to None.
+        """
+        old_color = self._color
+        self._stack = self._stack[1:]
         self.dec_height()
+        if self._height == 0:
+            self._color = None
+        if self._board is not None:
+            self._board.stack_changed(self._coord, old_color, self._color)
 
     def add(self, color):
         """
         takes a piece's color and adds that colored piece to the top of the stack, giving control of the stack
         to that color.
         """
-        self._stack.append(color)
+        old_color = self._color
+        self._stack += (color,)
         self.inc_height()
-        self.set_color(color)
+        self._color = color
+        if self._board is not None:
+            self._board.stack_changed(self._coord, old_color, color)
+
+    def transfer(self, dst, num_pieces, max_height):
+        """
+        takes the destination Stack, the number of pieces to move and the highest a stack may be.
+        moves the top num_pieces of this stack onto dst in one step, keeping their order, then removes
+        the pieces over max_height from the bottom of dst in one step.
+        returns the list of removed pieces, bottom piece first.
+        """
+        old_color = self._color
+        pieces = self._stack
+        moved = pieces[-num_pieces:]
+        self._stack = pieces[:-num_pieces]
+        self._height -= num_pieces
+        self._color = self._stack[-1] if self._height else None
+        if self._board is not None:
+            self._board.stack_changed(self._coord, old_color, self._color)
+        old_color = dst._color
+        pieces = dst._stack + moved
+        dst._height += num_pieces
+        trimmed = []
+        if dst._height > max_height:
+            trimmed = list(pieces[:dst._height - max_height])
+            pieces = pieces[dst._height - max_height:]
+            dst._height = max_height
+        dst._stack = pieces
+        dst._color = moved[-1]
+        if dst._board is not None:
+            dst._board.stack_changed(dst._coord, old_color, dst._color)
+        return trimmed
+
+    def trim(self, max_height):
+        """
+        takes the highest a stack may be, removes the pieces over that height from the bottom of the stack
+        in one step, returns the list of removed pieces, bottom piece first.
+        """
+        if self._height <= max_height:
+            return []
+        trimmed = list(self._stack[:self._height - max_height])
+        self._stack = self._stack[self._height - max_height:]
+        self._height = max_height
+        if self._board is not None:
+            self._board.stack_changed(self._coord, self._color, self._color)
+        return trimmed
+
+    def set_stack(self, pieces):
+        """
+        takes a sequence of piece colors (bottom piece first) and makes it the contents of the stack,
+        giving control of the stack to the color on top, or None if the sequence is empty.
+        """
+        old_color = self._color
+        self._stack = tuple(pieces)
+        self._height = len(self._stack)
+        self._color = self._stack[-1] if self._height else None
+        if self._board is not None:
+            self._board.stack_changed(self._coord, old_color, self._color)
 
 
 class Board:
     """
-    Takes two colors.
-    Represents a 6x6 board of made up of 36 Stack objects associated with those two colors.
-    Referenced by FocusGame class to represent the 6x6 playing field
+    Takes two colors and optionally the Rules of the game.
+    Represents a 6x6 board (or the size of the Rules) made up of Stack objects associated with those two colors.
+    Referenced by FocusGame class to represent the playing field
     References the Stack class, as each space on the board contains a Stack representing multiple pieces
     in the same space
     """
 
-    def __init__(self, color1, color2):
+    def __init__(self, color1, color2, rules=None, cells=None):
         """
-        Takes two colors, creates a 6x6 board made of six lists within a list.
+        Takes two colors, the Rules of the game (the 6x6 game if None) and optionally a position,
+        creates a 6x6 board made of six lists within a list, or a board of the size of the Rules.
         Each inner list is filled with Stack objects each containing one piece,
         The colors of the pieces are split evenly between to colors in the following pattern:
         X  X  O  O  X  X
@@ -135,24 +506,228 @@ class Board:
         O  O  X  X  O  O
         The board's coordinates are set up so that the upper-left space is (0,0)
         and the lower-right corner is (5,5).
+        Larger boards continue the pattern of pairs along every row.
+        If a sequence of packed cells in the format of get_cells is entered, one per space,
+        the stacks hold those pieces instead, and the board's tracking is built from them once.
         The Stack at each space may be accessed by coordinates.
         An image of the board showing the color controlling each stack can be printed out.
         """
-        self._board = [[], [], [], [], [], []]
-        for row in range(0, 6, 2):
-            self._board[row].append(Stack(color1))
-            self._board[row].append(Stack(color1))
-            self._board[row].append(Stack(color2))
-            self._board[row].append(Stack(color2))
-            self._board[row].append(Stack(color1))
-            self._board[row].append(Stack(color1))
-        for row in range(1, 6, 2):
-            self._board[row].append(Stack(color2))
-            self._board[row].append(Stack(color2))
-            self._board[row].append(Stack(color1))
-            self._board[row].append(Stack(color1))
-            self._board[row].append(Stack(color2))
-            self._board[row].append(Stack(color2))
+        if rules is None:
+            rules = RULES
+        self._rules = rules
+        self._size = size = rules.get_size()
+        self._colors = colors = (color1, color2)
+        if cells is None:
+            self._board = [[Stack(colors[piece], self, coord) for piece, coord in row]
+                           for row in rules.get_start_rows()]
+            self.start_tracking()
+            return
+
+        self._board = []
+
+        self._owned = {color1: 0, color2: 0}
+        pieces_of = {}                          # the pieces of each cell value, shared by its stacks
+        for row in rules.get_coords():
+            self._board.append([])
+            for coord in row:
+                cell = cells[coord[0] * size + coord[1]]
+                pieces = pieces_of.get(cell)
+                if pieces is None:
+                    pieces = tuple(colors[(cell >> level) & 1] for level in range(0, cell.bit_length() - 1))
+                    pieces_of[cell] = pieces
+                stack = Stack(color1)           # the pieces are set before the stack is on the board
+                stack.set_stack(pieces)
+                stack.set_board(self, coord)
+                self._board[-1].append(stack)
+                color = stack.get_color()
+                if color is not None:
+                    self._owned[color] |= 1 << (coord[0] * size + coord[1])
+        self.start_squares()
+        self.reset_squares()
+
+    def get_rules(self):
+        """returns the Rules the board was made with"""
+        return self._rules
+
+    def start_tracking(self):
+        """
+        sets up what reset_tracking rebuilds for a board at the starting position of its Rules,
+        taken from the Rules' tables instead of read from the stacks.
+        """
+        colors = self._colors
+        first, second = self._rules.get_start_owned()
+        self._owned = {colors[0]: first, colors[1]: second}
+        self.start_squares()
+
+    def reset_tracking(self):
+        """
+        rebuilds the mask of the squares controlled by each color from the board, and marks every stack's
+        hash, features and color in the colored board as out of date.
+        they are then kept up to date by stack_changed as the stacks change.
+        """
+        self._owned = dict.fromkeys(self._colors, 0)
+        bit = 1
+        for row in self._rules.get_coords():
+            for coord in row:
+                color = self.get_color(coord)
+                if color is not None:
+                    self._owned[color] = self._owned.get(color, 0) | bit
+                bit <<= 1
+        self.reset_squares()
+
+    def start_squares(self):
+        """
+        sets up what the board brings up to date only when asked for: the hash and evaluation features,
+        those of the starting position of its Rules with the starting cells as the cells they were computed
+        from, no colored board until one is asked for and no tracking of changed spaces until take_changed
+        turns it on. marks no stack as out of date.
+        """
+        rules = self._rules
+        self._hashed = array("H", rules.get_start_cells())
+        self._hash = rules.get_start_hash()
+        self._features = array("i", rules.get_start_features())
+        self._stale = 0
+        self._colored = None
+        self._recolor = 0
+        self._changed = None
+
+    def reset_squares(self):
+        """
+        marks every stack's part of the hash, evaluation features and colored board as out of date,
+        for update_squares to bring up to date the next time they are asked for.
+        """
+        self._stale = (1 << (self._size * self._size)) - 1
+
+    def stack_changed(self, coord, old_color, new_color):
+        """
+        takes a tuple with the coordinates of a stack whose pieces changed, the color that controlled it
+        and the color that now does.
+        sets the square's bit in the mask of stacks whose part of the board's hash and evaluation features
+        is out of date. they are only brought up to date by update_squares when get_hash or get_features
+        asks for them, so moving pieces costs one bit per stack, however many moves are made between two asks.
+        if the controlling color changed, moves the square's bit from one color's mask to the other's.
+        """
+        bit = 1 << (coord[0] * self._size + coord[1])
+        self._stale |= bit
+        if old_color != new_color:
+            owned = self._owned
+            if old_color is not None:
+                owned[old_color] &= ~bit
+            if new_color is not None:
+                owned[new_color] = owned.get(new_color, 0) | bit
+
+    def update_squares(self):
+        """
+        for every stack changed since the last update, swaps the key and evaluation features of the cell
+        they were computed from for those of its cell now, in the board's hash and totals.
+        if there is a colored board, the stacks are passed on to be checked by recolor.
+        """
+        rules = self._rules
+        squares = rules.get_squares()
+        hashed = self._hashed
+        totals = self._features
+        stale = self._stale
+        self._stale = 0
+        if self._colored is not None:
+            self._recolor |= stale
+        while stale:
+            low = stale & -stale
+            stale ^= low
+            index = low.bit_length() - 1
+            cell = self.get_cell(squares[index])
+            old = hashed[index]
+            if cell != old:
+                self._hash ^= rules.get_cell_key(index, old) ^ rules.get_cell_key(index, cell)
+                features = rules.get_cell_features(cell)
+                old = rules.get_cell_features(old)
+                if features != old:
+                    totals[0] += features[0] - old[0]
+                    totals[1] += features[1] - old[1]
+                    totals[2] += features[2] - old[2]
+                    totals[3] += features[3] - old[3]
+                hashed[index] = cell
+
+    def get_features(self):
+        """
+        returns the board's evaluation features, brought up to date for the stacks changed since they were
+        last asked for: an array of the pieces of each color buried under the other color,
+        then the tall stacks each color controls.
+        """
+        if self._stale:
+            self.update_squares()
+        return self._features
+
+    def get_hash(self):
+        """
+        returns the 64-bit Zobrist hash of the pieces on the board,
+        brought up to date for the stacks changed since it was last asked for.
+        """
+        if self._stale:
+            self.update_squares()
+        return self._hash
+
+    def get_colors(self):
+        """returns a tuple of the board's two colors"""
+        return self._colors
+
+    def get_owned_mask(self, color):
+        """
+        takes a color, returns the mask of the squares of the stacks that color controls:
+        bit row * size + column is set for each, so the mask is 0 when the color controls none.
+        """
+        return self._owned.get(color, 0)
+
+    def get_owned(self, color):
+        """
+        takes a color, returns the set of coordinates of the stacks that color controls,
+        built from its mask when asked for.
+        """
+        squares = self._rules.get_squares()
+        mask = self._owned.get(color, 0)
+        owned = set()
+        while mask:
+            low = mask & -mask
+            owned.add(squares[low.bit_length() - 1])
+            mask ^= low
+        return owned
+
+    def count_controlled(self, color):
+        """takes a color, returns the number of stacks that color controls"""
+        return bin(self._owned.get(color, 0)).count("1")
+
+    def get_cells(self):
+        """
+        returns an array with the pieces of each stack packed into one 16-bit cell, in row-major order,
+        in the format PackedBoard keeps its stacks in.
+        """
+        cells = array("H")
+        for row in self._rules.get_coords():
+            for coord in row:
+                cell = self.get_cell(coord)
+                if cell > 0xFFFF:
+                    raise ValueError("a packed stack holds at most " + str(PackedBoard.MAX_PIECES) + " pieces")
+                cells.append(cell)
+        return cells
+
+    def get_cell(self, coord):
+        """takes a tuple with board coordinates, returns the stack there packed into a cell as get_cells does"""
+        color2 = self._colors[1]
+        cell = 1
+        for piece in reversed(self._board[coord[0]][coord[1]].get_pieces()):
+            cell = (cell << 1) | (piece == color2)
+        return cell
+
+    def set_cells(self, cells):
+        """
+        takes a sequence of packed cells in the format of get_cells, one per space,
+        sets the contents of every stack.
+        """
+        colors = self._colors
+        size = self._size
+        for index in range(0, size * size):
+            cell = cells[index]
+            pieces = [colors[(cell >> level) & 1] for level in range(0, cell.bit_length() - 1)]
+            self._board[index // size][index % size].set_stack(pieces)
 
     def get_board(self):
         """returns the board"""
@@ -164,55 +739,491 @@ class Board:
         column = coord[1]
         return self.get_board()[row][column]
 
+    def get_height(self, coord):
+        """takes a tuple with board coordinates, returns the number of pieces in the stack there"""
+        return self._board[coord[0]][coord[1]].get_height()
+
+    def get_pieces(self, coord):
+        """takes a tuple with board coordinates, returns the tuple of the pieces there (bottom piece first)"""
+        return self._board[coord[0]][coord[1]].get_pieces()
+
+    def get_color(self, coord):
+        """takes a tuple with board coordinates, returns the color controlling the stack there, or None"""
+        return self._board[coord[0]][coord[1]].get_color()
+
+    def transfer(self, src, dst, num_pieces, max_height):
+        """
+        takes the source and destination coordinates, the number of pieces to move and the highest a stack
+        may be, moves the pieces as Stack.transfer does, returns the list of removed pieces, bottom piece first.
+        FocusGame moves pieces through the board, so a board may move them without Stack objects.
+        """
+        return self._board[src[0]][src[1]].transfer(self._board[dst[0]][dst[1]], num_pieces, max_height)
+
+    def add(self, coord, color):
+        """takes a tuple with board coordinates and a piece's color, adds the piece on top of the stack there"""
+        self._board[coord[0]][coord[1]].add(color)
+
+    def trim(self, coord, max_height):
+        """
+        takes a tuple with board coordinates and the highest a stack may be, removes the pieces over that
+        height from the bottom of the stack there, returns the list of removed pieces, bottom piece first.
+        """
+        return self._board[coord[0]][coord[1]].trim(max_height)
+
+    def put_under(self, coord, pieces):
+        """
+        takes a tuple with board coordinates and a list of pieces (bottom piece first),
+        puts the pieces back under the stack there, keeping its color.
+        raises ValueError if the stack would hold more pieces than a packed cell and the hash have room for.
+        """
+        stack = self._board[coord[0]][coord[1]]
+        if stack.get_height() + len(pieces) > PackedBoard.MAX_PIECES:
+            raise ValueError("a packed stack holds at most " + str(PackedBoard.MAX_PIECES) + " pieces")
+        stack.set_stack(tuple(pieces) + stack.get_pieces())
+
+    def save_stack(self, coord):
+        """
+        takes a tuple with board coordinates, returns the stack there in a form restore_stack takes back:
+        the tuple of its pieces, which is never changed in place.
+        """
+        return self._board[coord[0]][coord[1]].get_pieces()
+
+    def restore_stack(self, coord, saved):
+        """takes a tuple with board coordinates and a stack saved by save_stack, makes it the stack there again"""
+        self._board[coord[0]][coord[1]].set_stack(saved)
+
     def get_colored_board(self):
         """
-        Created a version of the board that contains the color in control of each space
-        instead of the Stack object in that space.
+        returns a version of the board that contains the color in control of each space
+        instead of the Stack object in that space (" " if no color), as a tuple of row tuples.
+        The board builds it the first time it is asked for and then only replaces the rows of the spaces
+        changed since, so a row that did not change is the same tuple as before.
+        """
+        if self._colored is None:
+            self._colored = tuple(tuple(" " if self.get_color(coord) is None else self.get_color(coord)
+                                        for coord in row) for row in self._rules.get_coords())
+            self._recolor = 0
+            return self._colored
+        if self._stale:
+            self.update_squares()
+        if self._recolor:
+            self.recolor()
+        return self._colored
+
+    def recolor(self):
+        """
+        replaces the rows of the colored board whose spaces changed color among the stacks changed since it
+        was last brought up to date, and marks those spaces as changed if take_changed has turned that on.
+        """
+        squares = self._rules.get_squares()
+        rows = list(self._colored)
+        recolor = self._recolor
+        self._recolor = 0
+        changed = 0
+        while recolor:
+            low = recolor & -recolor
+            recolor ^= low
+            coord = squares[low.bit_length() - 1]
+            color = self.get_color(coord)
+            if color is None:
+                color = " "
+            row = rows[coord[0]]
+            if row[coord[1]] != color:
+                rows[coord[0]] = row[:coord[1]] + (color,) + row[coord[1] + 1:]
+                changed |= low
+        if changed:
+            self._colored = tuple(rows)
+            if self._changed is not None:
+                self._changed |= changed
+
+    def take_changed(self):
         """
-        colored_board = []
-        for row in range(0, 6):
-            colored_row = []
-            for column in range(0,6):
-                space_color = self.get_stack((row, column)).get_color()
-                if space_color is None:
-                    space_color = " "
-                colored_row.append(space_color)
-            colored_board.append(colored_row)
-        return colored_board
+        returns the set of coordinates of the spaces whose controlling color changed since the last call,
+        and starts a new set. The first call returns every space and turns the tracking of changes on,
+        so boards that are never drawn do not pay for it.
+        """
+        self.get_colored_board()
+        changed = self._changed
+        if changed is None:
+            changed = (1 << (self._size * self._size)) - 1
+        self._changed = 0
+        squares = self._rules.get_squares()
+        spaces = set()
+        while changed:
+            low = changed & -changed
+            spaces.add(squares[low.bit_length() - 1])
+            changed ^= low
+        return spaces
 
     def print_board(self):
         """
         prints out a list for each row containing the colors in each space of the row
         if no color, prints " ".
         """
-        for row in range(0, 6):
-            print(self.get_colored_board()[row])
+        for row in self.get_colored_board():
+            print(list(row))
+
+
+class PackedStack:
+    """
+    A view of one space of a PackedBoard that behaves like a Stack.
+    The pieces are not stored in the view, they are read from and written to the board's
+    packed cells, so code written for Stack objects works on a PackedBoard unchanged.
+    """
+
+    __slots__ = ("_board", "_cells", "_colors", "_index", "_coord")
+
+    def __init__(self, board, index):
+        """takes a PackedBoard and the index of a space, creates a view of the stack in that space."""
+        self._board = board
+        self._cells = board.get_cells()
+        self._colors = board.get_colors()
+        self._index = index
+        size = board.get_rules().get_size()
+        self._coord = board.get_rules().get_coords()[index // size][index % size]
+
+    def get_color(self):
+        """returns the color of the player who is allowed to move the stack"""
+        cell = self._cells[self._index]
+        height = cell.bit_length() - 1
+        if height == 0:
+            return None
+        return self._colors[(cell >> (height - 1)) & 1]
+
+    def get_stack(self):
+        """returns a list of the stack's contents (bottom piece at index 0)"""
+        cell = self._cells[self._index]
+        colors = self._colors
+        return [colors[(cell >> level) & 1] for level in range(0, cell.bit_length() - 1)]
+
+    def get_pieces(self):
+        """returns a tuple of the stack's contents (bottom piece at index 0)"""
+        return tuple(self.get_stack())
+
+    def get_height(self):
+        """returns the number of pieces in the stack"""
+        return self._cells[self._index].bit_length() - 1
+
+    def off_top(self):
+        """removes a piece from the top of the stack"""
+        cell = self._cells[self._index]
+        height = cell.bit_length() - 1
+        top = 1 << (height - 1)
+        self._cells[self._index] = (cell & (top - 1)) | top
+        old_color = self._colors[(cell >> (height - 1)) & 1]
+        self._board.stack_changed(self._coord, old_color,
+                                  self._colors[(cell >> (height - 2)) & 1] if height > 1 else None)
+
+    def off_bottom(self):
+        """removes a piece from the bottom of the stack"""
+        cell = self._cells[self._index]
+        self._cells[self._index] = cell >> 1
+        color = self._colors[(cell >> (cell.bit_length() - 2)) & 1]
+        self._board.stack_changed(self._coord, color, color if cell > 0b11 else None)
+
+    def add(self, color):
+        """
+        takes a piece's color and adds that colored piece to the top of the stack, giving control of the stack
+        to that color.
+        """
+        self._board.add(self._coord, color)
+
+    def transfer(self, dst, num_pieces, max_height):
+        """
+        takes the destination PackedStack, the number of pieces to move and the highest a stack may be,
+        moves the pieces with PackedBoard.transfer, returns the list of removed pieces, bottom piece first.
+        """
+        return self._board.transfer(self._coord, dst._coord, num_pieces, max_height)
+
+    def trim(self, max_height):
+        """
+        takes the highest a stack may be, removes the pieces over that height from the bottom of the stack
+        with one shift of its cell, returns the list of removed pieces, bottom piece first.
+        """
+        return self._board.trim(self._coord, max_height)
+
+    def set_stack(self, pieces):
+        """
+        takes a sequence of piece colors (bottom piece first) and makes it the contents of the stack,
+        giving control of the stack to the color on top, or None if the sequence is empty.
+        """
+        old_color = self.get_color()
+        cell = 1
+        for piece in reversed(pieces):
+            cell = (cell << 1) | self._colors.index(piece)
+        if cell >> PackedBoard.MAX_PIECES > 1:
+            raise ValueError("a packed stack holds at most " + str(PackedBoard.MAX_PIECES) + " pieces")
+        self._cells[self._index] = cell
+        self._board.stack_changed(self._coord, old_color, self.get_color())
+
+
+class PackedBoard(Board):
+    """
+    Takes two colors.
+    Represents the same board as Board, but packs each stack into one 16-bit cell of an array
+    instead of keeping Stack objects, so a whole 6x6 position takes 72 bytes.
+    Each cell holds one bit per piece (0 for the first color, 1 for the second, bottom piece in bit 0)
+    with a marker bit set just above the top piece, so an empty stack is 1 and the height of a stack
+    is the position of the marker bit.
+    FocusGame moves and reads pieces with the board's own methods, which work on the cells directly
+    and keep the board's masks from the bits of the cells.
+    get_stack and get_board return PackedStack views, made the first time they are asked for,
+    which behave exactly like Stack objects.
+    """
+
+    MAX_PIECES = 15                 # a 16-bit cell has room for the marker bit and 15 pieces
+
+    def __init__(self, color1, color2, rules=None, cells=None):
+        """
+        Takes two colors, the Rules of the game (the 6x6 game if None) and optionally a sequence of
+        packed cells, one per space. creates a packed board holding those cells, or if None,
+        with the same starting pattern as Board: the pieces alternate in pairs along each row,
+        and each row starts with the opposite color of the row above it.
+        """
+        if rules is None:
+            rules = RULES
+        self._rules = rules
+        self._size = size = rules.get_size()
+        self._colors = (color1, color2)
+        self._board = None
+        if cells is None:
+            self._cells = array("H", rules.get_start_cells())
+            self.start_tracking()
+            return
+
+        self._cells = array("H", cells[0:size * size])
+        self.start_squares()
+        self.reset_tracking()
+
+    def reset_tracking(self):
+        """rebuilds the tracking of the board as Board.reset_tracking does, reading the cells directly"""
+        colors = self._colors
+        cells = self._cells
+        owned = [0, 0]
+        for index in range(0, self._size * self._size):
+            cell = cells[index]
+            if cell != 1:
+                owned[(cell >> (cell.bit_length() - 2)) & 1] |= 1 << index
+        self._owned = {colors[0]: owned[0], colors[1]: owned[1]}
+        self.reset_squares()
+
+    def get_board(self):
+        """returns the rows of PackedStack views of the board, making them the first time"""
+        if self._board is None:
+            size = self._size
+            self._board = [[PackedStack(self, row * size + column) for column in range(0, size)]
+                           for row in range(0, size)]
+        return self._board
+
+    def get_height(self, coord):
+        """takes a tuple with board coordinates, returns the number of pieces in the stack there"""
+        return self._cells[coord[0] * self._size + coord[1]].bit_length() - 1
+
+    def get_color(self, coord):
+        """takes a tuple with board coordinates, returns the color controlling the stack there, or None"""
+        top = PACKED_TOPS[self._cells[coord[0] * self._size + coord[1]]]
+        if top == 0:
+            return None
+        return self._colors[top - 1]
+
+    def transfer(self, src, dst, num_pieces, max_height):
+        """
+        takes the source and destination coordinates, the number of pieces to move and the highest a stack
+        may be. moves the top num_pieces of the source stack onto the destination and removes the pieces
+        over max_height from the bottom of the destination with a few shifts of the two cells,
+        and updates the board's masks from the bits of the two cells.
+        returns the list of removed pieces, bottom piece first.
+        """
+        cells = self._cells
+        colors = self._colors
+        index = src[0] * self._size + src[1]
+        dst_index = dst[0] * self._size + dst[1]
+        cell = cells[index]
+        height = cell.bit_length() - 1
+        dst_cell = cells[dst_index]
+        dst_height = dst_cell.bit_length() - 1
+        if max_height > PackedBoard.MAX_PIECES and dst_height + num_pieces > PackedBoard.MAX_PIECES:
+            raise ValueError("a packed stack holds at most " + str(PackedBoard.MAX_PIECES) + " pieces")
+
+        rest = height - num_pieces
+        moved = cell >> rest                        # the moved pieces with the marker bit above them
+        cells[index] = (cell & ((1 << rest) - 1)) | (1 << rest)
+        combined = (dst_cell ^ (1 << dst_height)) | (moved << dst_height)
+        overflow = dst_height + num_pieces - max_height
+        trimmed = []
+        if overflow > 0:
+            trimmed = [colors[(combined >> level) & 1] for level in range(0, overflow)]
+            combined >>= overflow
+        cells[dst_index] = combined
+
+        bit = 1 << index
+        dst_bit = 1 << dst_index
+        self._stale |= bit | dst_bit
+        top = (cell >> (height - 1)) & 1            # the piece of the color that moved
+        owned = self._owned
+        owned[colors[top]] |= dst_bit
+        owned[colors[1 - top]] &= ~dst_bit
+        if not rest or (cell >> (rest - 1)) & 1 != top:
+            owned[colors[top]] &= ~bit
+            if rest:
+                owned[colors[1 - top]] |= bit
+        return trimmed
+
+    def add(self, coord, color):
+        """takes a tuple with board coordinates and a piece's color, adds the piece on top of the stack there"""
+        index = coord[0] * self._size + coord[1]
+        cell = self._cells[index]
+        height = cell.bit_length() - 1
+        if height >= PackedBoard.MAX_PIECES:
+            raise ValueError("a packed stack holds at most " + str(PackedBoard.MAX_PIECES) + " pieces")
+        piece = self._colors.index(color)
+        self._cells[index] = cell + ((1 + piece) << height)
+        bit = 1 << index
+        self._stale |= bit
+        if not height or (cell >> (height - 1)) & 1 != piece:
+            owned = self._owned
+            owned[color] |= bit
+            owned[self._colors[1 - piece]] &= ~bit
+
+    def trim(self, coord, max_height):
+        """
+        takes a tuple with board coordinates and the highest a stack may be, removes the pieces over that
+        height from the bottom of the stack there with one shift of its cell,
+        returns the list of removed pieces, bottom piece first.
+        """
+        index = coord[0] * self._size + coord[1]
+        cell = self._cells[index]
+        overflow = cell.bit_length() - 1 - max_height
+        if overflow <= 0:
+            return []
+        self._cells[index] = cell >> overflow
+        self._stale |= 1 << index
+        return [self._colors[(cell >> level) & 1] for level in range(0, overflow)]
+
+    def put_under(self, coord, pieces):
+        """
+        takes a tuple with board coordinates and a list of pieces (bottom piece first),
+        shifts the cell there up to put the pieces back under the stack, keeping its color.
+        raises ValueError if the cell would hold more than MAX_PIECES pieces.
+        """
+        index = coord[0] * self._size + coord[1]
+        cell = self._cells[index]
+        if cell.bit_length() - 1 + len(pieces) > PackedBoard.MAX_PIECES:
+            raise ValueError("a packed stack holds at most " + str(PackedBoard.MAX_PIECES) + " pieces")
+        bits = 0
+        for level in range(0, len(pieces)):
+            bits |= self._colors.index(pieces[level]) << level
+        self._cells[index] = (cell << len(pieces)) | bits
+        self._stale |= 1 << index
+
+    def save_stack(self, coord):
+        """takes a tuple with board coordinates, returns the packed cell there for restore_stack"""
+        return self._cells[coord[0] * self._size + coord[1]]
+
+    def restore_stack(self, coord, saved):
+        """
+        takes a tuple with board coordinates and a cell saved by save_stack, puts the cell back
+        and, if the piece on top changed color, moves the square's bit between the board's masks.
+        """
+        index = coord[0] * self._size + coord[1]
+        cells = self._cells
+        old = PACKED_TOPS[cells[index]]
+        cells[index] = saved
+        bit = 1 << index
+        self._stale |= bit
+        top = PACKED_TOPS[saved]
+        if top != old:
+            owned = self._owned
+            if old:
+                owned[self._colors[old - 1]] &= ~bit
+            if top:
+                owned[self._colors[top - 1]] |= bit
+
+    def update_squares(self):
+        """brings the hash and features up to date as Board.update_squares does, reading the cells directly"""
+        rules = self._rules
+        cells = self._cells
+        hashed = self._hashed
+        totals = self._features
+        stale = self._stale
+        self._stale = 0
+        if self._colored is not None:
+            self._recolor |= stale
+        while stale:
+            low = stale & -stale
+            stale ^= low
+            index = low.bit_length() - 1
+            cell = cells[index]
+            old = hashed[index]
+            if cell != old:
+                self._hash ^= rules.get_cell_key(index, old) ^ rules.get_cell_key(index, cell)
+                features = rules.get_cell_features(cell)
+                old = rules.get_cell_features(old)
+                if features != old:
+                    totals[0] += features[0] - old[0]
+                    totals[1] += features[1] - old[1]
+                    totals[2] += features[2] - old[2]
+                    totals[3] += features[3] - old[3]
+                hashed[index] = cell
+
+    def get_pieces(self, coord):
+        """takes a tuple with board coordinates, returns a tuple of the pieces there decoded from their cell"""
+        cell = self._cells[coord[0] * self._size + coord[1]]
+        colors = self._colors
+        return tuple(colors[(cell >> level) & 1] for level in range(0, cell.bit_length() - 1))
+
+    def get_cells(self):
+        """returns the array of packed cells, one per space in row-major order"""
+        return self._cells
+
+    def get_cell(self, coord):
+        """takes a tuple with board coordinates, returns the packed cell of the stack there"""
+        return self._cells[coord[0] * self._size + coord[1]]
+
+    def set_cells(self, cells):
+        """takes a sequence of packed cells, one per space, copies them over the board's cells in one step"""
+        self._cells[0:len(self._cells)] = array("H", cells[0:len(self._cells)])
+        self.reset_tracking()
 
 
 class FocusGame:
     """
     Represents a game of Focus (Domination). Played on a 6x6 board with two players.
     A player wins if they capture six or more pieces, or their opponent is out
-    of valid moves.
+    of valid moves. Other Rules can change the size of the board, the height of stacks
+    and the number of captures that wins.
     References the Player class to keep track of whose turn it is and how many pieces
     each player has captured or in reserve.
     References the Board and Stack classes to keep track of the game board and how many pieces are in each space.
     """
 
-    def __init__(self, player_a, player_b):
+    def __init__(self, player_a, player_b, board_class=Board, rules=None, cells=None):
         """
         takes two tuples each with two string elements (player_name, color)
         creates two players each with the entered name and color
-        initializes a board for the players,
+        initializes a board for the players, a Board unless another board class
+        such as PackedBoard is entered, with the Rules entered or the 6x6 game's,
+        at the starting position or the packed cells entered (see Board.get_cells),
         then allows them to play a focus game until one of them wins.
         **Note: Either player may begin the game. After that, only the player whose turn it is
         may make a move.
         """
         self._playerA = Player(player_a)
         self._playerB = Player(player_b)
-        self._board = Board(player_a[1], player_b[1])
+        self._players = (self._playerA, self._playerB)
+        if rules is None:
+            rules = RULES
+        self._rules = rules
+        self._size = rules.get_size()
+        self._coords = rules.get_coords()
+        self._spaces = rules.get_spaces()
+        self._reach = rules.get_reach()
+        self._max_height = rules.get_max_height()
+        self._win_captures = rules.get_win_captures()
+        self._board = board_class(player_a[1], player_b[1], rules, cells)
         self._last_player = None
         self._game_state = "PLAYING"
+        self._history = []          # undo records of the moves made with make_move
 
     def get_player_a(self):
         """returns the Player object in _playerA"""
@@ -222,6 +1233,10 @@ class FocusGame:
         """returns the Player object in _playerB"""
         return self._playerB
 
+    def get_player(self, index):
+        """takes 0 for player a or 1 for player b, returns that Player object"""
+        return self._players[index]
+
     def get_other_player(self, player):
         """returns the opponent of the player entered"""
         if player == self.get_player_a():
@@ -233,6 +1248,10 @@ class FocusGame:
         """returns the Board object _board"""
         return self._board
 
+    def get_rules(self):
+        """returns the Rules of the game"""
+        return self._rules
+
     def get_last_player(self):
         """returns the player who last made a move"""
         return self._last_player
@@ -268,6 +1287,16 @@ class FocusGame:
         self.set_game_state(player.get_name() + " Wins")
         return player.get_name() + " Wins"
 
+    def on_board(self, coord):
+        """
+        takes board coordinates as a tuple or a list (as the original move_piece accepted),
+        returns True if they are a space on the board, else False.
+        """
+        try:
+            return coord in self._spaces
+        except TypeError:                       # a list cannot be looked up in the set of spaces
+            return tuple(coord) in self._spaces
+
     def verify_move(self, player, dst):
         """
         Takes a player and a destination coordinate.
@@ -280,9 +1309,8 @@ class FocusGame:
         if self.get_game_state() != "PLAYING":  # prevents move if game is won
             return False
 
-        for num in dst:                         # checks destination is on board
-            if num < 0 or num > 5:
-                return False
+        if not self.on_board(dst):              # checks destination is on board
+            return False
 
         if self._last_player == player:         # prevents move by player not on their turn
             return False
@@ -303,19 +1331,18 @@ class FocusGame:
          and not greater than the available pieces.
         If the move is invalid, returns False, otherwise True
         """
-        for num in src:                                  # checks source is on board
-            if num < 0 or num > 5:
-                return False
+        if not self.on_board(src):                       # checks source is on board
+            return False
 
         if src == dst:                                   # checks src and dst are not the same.
             return False
 
-        src_stack = self.get_board().get_stack(src)
+        board = self._board
 
-        if num_pieces < 1 or num_pieces > src_stack.get_height():
+        if num_pieces < 1 or num_pieces > board.get_height(src):
             return False                                # prevents moving too many or too few pieces
 
-        if src_stack.get_color() != player.get_color():  # prevents move of stack that player doesn't control
+        if board.get_color(src) != player.get_color():   # prevents move of stack that player doesn't control
             return False
 
         if src[0] != dst[0] and src[1] != dst[1]:        # prevents diagonal moves
@@ -332,16 +1359,42 @@ class FocusGame:
 
         return True
 
+    def legal_moves(self, player_name):
+        """
+        takes a player_name, yields every legal move that player can make right now.
+        single/multiple moves are yielded as ("move", src, dst, num_pieces) and reserve moves as
+        ("reserve", coord), following the same rules as verify_move, verify_stack_move and
+        reserved_move, so every move yielded can be made with move_piece or reserved_move.
+        yields nothing if the game is over or it is not the player's turn.
+        """
+        player = self.get_player_from_name(player_name)
+        if player is None or self._game_state != "PLAYING" or self._last_player == player:
+            return
+
+        board = self._board
+        squares = self._rules.get_squares()
+        owned = board.get_owned_mask(player.get_color())
+        while owned:                                # the player's stacks in row-major order
+            low = owned & -owned
+            owned ^= low
+            src = squares[low.bit_length() - 1]
+            reach = self._reach[src]
+            for num_pieces in range(1, min(board.get_height(src), len(reach) - 1) + 1):
+                for dst in reach[num_pieces]:
+                    yield "move", src, dst, num_pieces
+
+        if player.get_reserve() > 0:                # a reserve piece may be placed on any space
+            for row in self._rules.get_coords():
+                for coord in row:
+                    yield "reserve", coord
+
     def check_endgame(self, player):
         """
         takes a player and checks if they have any valid moves
         if not, the other player wins.
         """
-        color = player.get_color()              # checks if player make a single/multiple move
-        for row in self._board.get_board():
-            for stack in row:
-                if color == stack.get_color():
-                    return 0
+        if self._board.get_owned_mask(player.get_color()):    # checks if player make a single/multiple move
+            return 0
         if player.get_reserve() > 0:            # checks if player can make a reserve move
             return 0
         return 1                                # returns 1 if player has no valid moves
@@ -354,6 +1407,35 @@ class FocusGame:
         """
         self.set_last_player(player)
 
+    def collect_pieces(self, player, pieces, coord):
+        """
+        takes a player, the list of pieces removed from the bottom of a stack by their move (bottom piece first)
+        and the coordinates of that stack.
+        adds the player's own pieces to their reserve and captures the opponent's, all at once.
+        returns True if the player has captured enough pieces to win (six in the 6x6 game). Like the original
+        move_piece, which stopped at the winning capture, the winning piece and the pieces above it are then
+        put back under the stack, which is left higher than the most.
+        """
+        if not pieces:
+            return False
+        win_captures = self._win_captures
+        own = pieces.count(player.get_color())
+        captured = player.get_captured() + len(pieces) - own
+        if captured >= win_captures:        # counts the pieces one by one up to the winning capture
+            captured = player.get_captured()
+            own = 0
+            for index in range(0, len(pieces)):
+                if pieces[index] == player.get_color():
+                    own += 1
+                else:
+                    captured += 1
+                    if captured >= win_captures:
+                        self._board.put_under(coord, pieces[index:])
+                        break
+        player.set_reserve(player.get_reserve() + own)
+        player.set_captured(captured)
+        return captured >= win_captures
+
     def move_piece(self, player_name, src, dst, num_pieces):
         """
         takes a player_name, two tuples with board coordinates in the format (row, column),
@@ -366,70 +1448,329 @@ class FocusGame:
         returns "successfully moved"
         """
         player = self.get_player_from_name(player_name)
+        return self.status_result(player, self.move_stack(player, src, dst, num_pieces))
 
-        if not self.verify_move(player, dst):
-            return False
-
-        if not self.verify_stack_move(player, src, dst, num_pieces):
-            return False
+    def reserved_move(self, player_name, coord):
+        """
+        takes a player name and a tuple representing a location on the board
+        places a piece from the player's reserve on a stack on the board
+        """
+        player = self.get_player_from_name(player_name)
+        return self.status_result(player, self.place_reserve(player, coord))
 
-        src_stack = self.get_board().get_stack(src)
-        dst_stack = self.get_board().get_stack(dst)
-        pieces_moved = []
+    def status_result(self, player, status):
+        """
+        takes the player who tried a move and its status code,
+        returns what move_piece and reserved_move return for it: False, "successfully moved" or "<name> Wins"
+        """
+        if status == STATUS_MOVED:
+            return "successfully moved"
+        if status == STATUS_WON:
+            return player.get_name() + " Wins"
+        return False
 
-        for piece in range(0, num_pieces):
-            pieces_moved.insert(0, src_stack.get_stack()[-1])   # saves pieces to be moved
-            src_stack.off_top()                     # takes moved pieces off the source stack
+    def play(self, player_index, code):
+        """
+        takes 0 for player a or 1 for player b and a move packed by encode_move,
+        makes the move like move_piece or reserved_move without looking the player up by name
+        or building a result string.
+        returns STATUS_INVALID if the move is not legal, STATUS_WON if it won the game, else STATUS_MOVED.
+        """
+        row = (code >> 10) & 63
+        column = (code >> 4) & 63
+        if row >= self._size or column >= self._size:
+            return STATUS_INVALID
+        dst = self._coords[row][column]
+        if code & 15 == 0:
+            return self.place_reserve(self._players[player_index], dst)
+        row = (code >> 22) & 63
+        column = (code >> 16) & 63
+        if row >= self._size or column >= self._size:
+            return STATUS_INVALID
+        return self.move_stack(self._players[player_index], self._coords[row][column], dst, code & 15)
+
+    def apply_moves(self, moves, player_index=None):
+        """
+        takes a sequence of moves, each in the form yielded by legal_moves or packed by encode_move,
+        and optionally the index of the player making the first one (0 for player a, 1 for player b;
+        if None, the player who did not move last, or player a at the start of a game).
+        makes the moves in one call, the players taking turns, with the same rules as move_piece and
+        reserved_move, stopping at the first move that is not legal or that wins the game.
+        returns the number of moves made and the game state.
+        """
+        if player_index is None:
+            player_index = 1 if self._last_player is self._playerA else 0
+        made = 0
+        for move in moves:
+            player = self._players[player_index]
+            if isinstance(move, int):
+                status = self.play(player_index, move)
+            elif move[0] == "move":
+                status = self.move_stack(player, move[1], move[2], move[3])
+            else:
+                status = self.place_reserve(player, move[1])
+            if status == STATUS_INVALID:
+                break
+            made += 1
+            if status == STATUS_WON:
+                break
+            player_index = 1 - player_index
+        return made, self._game_state
+
+    def move_stack(self, player, src, dst, num_pieces):
+        """
+        takes a Player, the source and destination coordinates and the number of pieces to move,
+        makes the move as move_piece does, returns STATUS_INVALID, STATUS_MOVED or STATUS_WON.
+        """
+        if not self.verify_move(player, dst):
+            return STATUS_INVALID
 
-        for piece in pieces_moved:                  # adds the saved pieces to the destination stack
-            dst_stack.add(piece)
+        if not self.verify_stack_move(player, src, dst, num_pieces):
+            return STATUS_INVALID
 
-        while dst_stack.get_height() > 5:           # removes the bottom piece if stack higher than five
-            if dst_stack.get_stack()[0] == player.get_color():
-                player.inc_reserve()                # reserves removed pieces owned by the player
-            else:
-                player.inc_captured()               # captures removed pieces owned by opponent
-                if player.get_captured() >= 6:
-                    return self.player_win(player)
-            dst_stack.off_bottom()
+        # moves the pieces and removes the bottom pieces of a stack higher than five in one step
+        if self.collect_pieces(player, self._board.transfer(src, dst, num_pieces, self._max_height), dst):
+            self.player_win(player)
+            return STATUS_WON
         self.next_turn(player)
         if self.check_endgame(self.get_other_player(player)) == 1:
-            return self.player_win(player)
-
-        return "successfully moved"
+            self.player_win(player)
+            return STATUS_WON
+        return STATUS_MOVED
 
-    def reserved_move(self, player_name, coord):
+    def place_reserve(self, player, coord):
         """
-        takes a player name and a tuple representing a location on the board
-        places a piece from the player's reserve on a stack on the board
+        takes a Player and the coordinates to place a reserve piece on,
+        makes the move as reserved_move does, returns STATUS_INVALID, STATUS_MOVED or STATUS_WON.
         """
-        player = self.get_player_from_name(player_name)
-        color = player.get_color()
-
         if player.get_reserve() < 1:              # prevents move if no pieces in reserve
-            return False
+            return STATUS_INVALID
 
         if not self.verify_move(player, coord):
-            return False
+            return STATUS_INVALID
 
-        dst_stack = self.get_board().get_stack(coord)
+        self._board.add(coord, player.get_color())
 
-        dst_stack.add(color)
-
-        while dst_stack.get_height() > 5:       # removes the bottom piece if stack higher than five
-            if dst_stack.get_stack()[0] == player.get_color():
-                player.inc_reserve()            # reserves removed pieces owned by the player
-            else:
-                player.inc_captured()           # captures removed pieces owned by opponent
-                if player.get_captured() >= 6:
-                    return self.player_win(player)
-            dst_stack.off_bottom()
+        # removes the bottom pieces if the stack is too high
+        if self.collect_pieces(player, self._board.trim(coord, self._max_height), coord):
+            self.player_win(player)
+            return STATUS_WON
 
         player.dec_reserve()
         self.next_turn(player)
         if self.check_endgame(self.get_other_player(player)) == 1:
-            return self.player_win(player)
-        return "successfully moved"
+            self.player_win(player)
+            return STATUS_WON
+        return STATUS_MOVED
+
+    def __reduce__(self):
+        """pickles the game as its to_bytes snapshot, without the make_move history"""
+        return FocusGame.from_bytes, (self.to_bytes(),)
+
+    def to_bytes(self):
+        """
+        returns a compact snapshot of the game as bytes: the players' names and colors, their reserve and
+        captured counts, the last player, the game state, the board class, the Rules if they are not
+        the 6x6 game's and every stack as a packed cell.
+        the counts take two bytes each, enough for every piece of the largest board, and stacks of up to
+        seven pieces take one byte each, so a game in play takes a few dozen bytes.
+        the make_move history is not included.
+        raises ValueError if a name, color or game state takes more than 255 bytes.
+        """
+        player_a = self._playerA
+        player_b = self._playerB
+        cells = self._board.get_cells()
+        wide = max(cells) > 0xFF
+        if self._last_player is None:
+            flags = 0
+        elif self._last_player == player_a:
+            flags = 1
+        else:
+            flags = 2
+        state = b""
+        if self._game_state == "PLAYING":
+            pass
+        elif self._game_state == player_a.get_name() + " Wins":
+            flags |= 1 << 2
+        elif self._game_state == player_b.get_name() + " Wins":
+            flags |= 2 << 2
+        else:
+            flags |= 3 << 2                         # any other state is stored as text
+            state = self._game_state.encode("utf-8")
+            if len(state) > 0xFF:
+                raise ValueError("a game state must take at most 255 bytes in a snapshot")
+            state = struct.pack("B", len(state)) + state
+        if wide:
+            flags |= 1 << 4
+        if isinstance(self._board, PackedBoard):
+            flags |= 1 << 5
+        rules = b""
+        if self._rules is not RULES:
+            flags |= 1 << 6
+            rules = struct.pack("<2BI", self._rules.get_size(), self._rules.get_max_height(),
+                                self._rules.get_win_captures())
+
+        header = struct.pack("<2sBB4H", b"FG", 1, flags, player_a.get_reserve(), player_a.get_captured(),
+                             player_b.get_reserve(), player_b.get_captured()) + rules
+        text = b""
+        for value in (player_a.get_name(), player_a.get_color(), player_b.get_name(), player_b.get_color()):
+            value = value.encode("utf-8")
+            if len(value) > 0xFF:
+                raise ValueError("a player's name and color must take at most 255 bytes each in a snapshot")
+            text += struct.pack("B", len(value)) + value
+        if wide:
+            return header + text + state + cells.tobytes()
+        return header + text + state + array("B", cells).tobytes()
+
+    @classmethod
+    def from_bytes(cls, data, board_class=None):
+        """
+        takes a snapshot made by to_bytes and optionally the board class to restore it on
+        (the class of the snapshot's board if None), returns a FocusGame in the same position.
+        the board is built straight from the packed cells, without setting up the starting position first.
+        raises ValueError if the data is not a snapshot or is cut short, longer than its fields say or corrupt.
+        """
+        offset = struct.calcsize("<2sBB4H")
+        if len(data) < offset:
+            raise ValueError("not a FocusGame snapshot")
+        magic, version, flags, reserve_a, captured_a, reserve_b, captured_b = struct.unpack_from("<2sBB4H", data)
+        if magic != b"FG" or version != 1:
+            raise ValueError("not a FocusGame snapshot")
+        rules = RULES
+        if flags & (1 << 6):
+            if len(data) < offset + struct.calcsize("<2BI"):
+                raise ValueError("truncated FocusGame snapshot")
+            rules = rules_for(*struct.unpack_from("<2BI", data, offset))
+            offset += struct.calcsize("<2BI")
+        squares = rules.get_size() * rules.get_size()
+        text = []
+        for value in range(0, 5 if (flags >> 2) & 3 == 3 else 4):     # the names and colors, then any state
+            if len(data) <= offset or len(data) < offset + 1 + data[offset]:
+                raise ValueError("truncated FocusGame snapshot")
+            length = data[offset]
+            text.append(bytes(data[offset + 1:offset + 1 + length]).decode("utf-8"))
+            offset += 1 + length
+        state = text[4] if len(text) == 5 else None
+        width = 2 if flags & (1 << 4) else 1
+        if len(data) - offset != width * squares:
+            raise ValueError("a FocusGame snapshot of this board must end with " + str(width * squares)
+                             + " bytes of cells, not " + str(len(data) - offset))
+        if width == 2:
+            cells = array("H")
+            cells.frombytes(bytes(data[offset:]))
+        else:
+            cells = array("B", bytes(data[offset:]))
+        if 0 in cells:                      # every cell has its marker bit, an empty stack is 1
+            raise ValueError("corrupt FocusGame snapshot: a stack has no marker bit")
+        if board_class is None:
+            board_class = PackedBoard if flags & (1 << 5) else Board
+
+        game = cls((text[0], text[1]), (text[2], text[3]), board_class, rules, cells)
+        player_a = game.get_player_a()
+        player_b = game.get_player_b()
+        player_a.set_reserve(reserve_a)
+        player_a.set_captured(captured_a)
+        player_b.set_reserve(reserve_b)
+        player_b.set_captured(captured_b)
+        game.set_last_player([None, player_a, player_b][flags & 3])
+        if (flags >> 2) & 3 == 1:
+            state = player_a.get_name() + " Wins"
+        elif (flags >> 2) & 3 == 2:
+            state = player_b.get_name() + " Wins"
+        elif state is None:
+            state = "PLAYING"
+        game.set_game_state(state)
+        return game
+
+    def get_features(self, player):
+        """
+        takes a Player, returns the position's evaluation features from that player's side, each the
+        player's count less the opponent's: (captured pieces, reserve pieces, stacks controlled,
+        opponent's pieces buried under the player's stacks, tall stacks controlled).
+        the board brings its features up to date for the stacks changed since they were last asked for,
+        so the whole board is not scanned.
+        """
+        other = self.get_other_player(player)
+        board = self._board
+        features = board.get_features()
+        sign = 1 if player.get_color() == board.get_colors()[0] else -1
+        return (player.get_captured() - other.get_captured(),
+                player.get_reserve() - other.get_reserve(),
+                board.count_controlled(player.get_color()) - board.count_controlled(other.get_color()),
+                sign * (features[1] - features[0]),
+                sign * (features[2] - features[3]))
+
+    def get_hash(self):
+        """
+        returns a 64-bit Zobrist hash of the position: every piece at every height of every space,
+        which player moved last, and each player's reserve and captured counts.
+        the board brings the pieces' part up to date for the stacks changed since it was last asked for,
+        the rest is four table lookups, so the hash is never recomputed from the whole board.
+        """
+        player_a = self._playerA
+        player_b = self._playerB
+        if self._last_player is None:
+            turn = 0
+        elif self._last_player == player_a:
+            turn = 1
+        else:
+            turn = 2
+        counts = self._rules.get_count_keys()
+        return (self._board.get_hash() ^ ZOBRIST_TURN[turn][0][0]
+                ^ counts[0][player_a.get_reserve()][0]
+                ^ counts[1][player_a.get_captured()][0]
+                ^ counts[2][player_b.get_reserve()][0]
+                ^ counts[3][player_b.get_captured()][0])
+
+    def make_move(self, player_name, move):
+        """
+        takes a player_name and a move in the form yielded by legal_moves,
+        ("move", src, dst, num_pieces) or ("reserve", coord), and makes it with move_piece or reserved_move.
+        if the move is made, records what it changed so unmake_move can take it back:
+        the stacks it touched as saved by the board, the player's reserve and captured counts,
+        the last player and the game state.
+        returns the result of move_piece or reserved_move, False for a move off the board.
+        """
+        player = self.get_player_from_name(player_name)
+        board = self._board
+        if move[0] == "move":
+            touched = (move[1], move[2])
+        else:
+            touched = (move[1],)
+        for coord in touched:                   # the stacks are saved only once they are known to be on the board
+            if not self.on_board(coord):
+                return False
+        record = (move, player, player.get_reserve(), player.get_captured(), self._last_player,
+                  self._game_state, [(coord, board.save_stack(coord)) for coord in touched])
+
+        if move[0] == "move":
+            result = self.move_piece(player_name, move[1], move[2], move[3])
+        else:
+            result = self.reserved_move(player_name, move[1])
+        if result:
+            self._history.append(record)
+        return result
+
+    def unmake_move(self):
+        """
+        takes back the last move made with make_move, restoring the stacks it touched,
+        the player's reserve and captured counts, the last player and the game state.
+        returns the move taken back, or None if there are no moves to take back.
+        """
+        if not self._history:
+            return None
+        move, player, reserve, captured, last_player, game_state, stacks = self._history.pop()
+        for coord, saved in stacks:
+            self._board.restore_stack(coord, saved)
+        player.set_reserve(reserve)
+        player.set_captured(captured)
+        self._last_player = last_player
+        self._game_state = game_state
+        return move
+
+    def get_history(self):
+        """returns the list of undo records for the moves made with make_move, oldest first"""
+        return self._history
 
     def show_pieces(self, coord):
         """
@@ -437,7 +1778,7 @@ class FocusGame:
         returns a list containing the color of each piece at that position
         index 0 being the bottom of the stack and index 5 the top of the stack.
         """
-        return self.get_board().get_stack(coord).get_stack()
+        return list(self._board.get_pieces(coord))
 
     def show_reserve(self, player_name):
         """takes a player's name, returns the number of pieces in their reserve"""
@@ -0,0 +1,251 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: A Monte Carlo Tree Search player for Focus (Domination) built on FocusGame,
+# running independent search trees in a pool of processes and combining their results.
+
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+
+class MCTSNode:
+    """
+    A position in a Monte Carlo search tree, reached by making move.
+    Keeps the moves not yet tried from the position, its children, and how many playouts
+    went through it and how many of them the player who made move went on to win.
+    """
+
+    __slots__ = ("_move", "_parent", "_children", "_untried", "_visits", "_wins")
+
+    def __init__(self, move, parent, untried):
+        """takes the move that reaches the node, the parent node (None for the root) and a list of legal moves"""
+        self._move = move
+        self._parent = parent
+        self._children = []
+        self._untried = untried
+        self._visits = 0
+        self._wins = 0.0
+
+    def get_move(self):
+        """returns the move that reaches the node"""
+        return self._move
+
+    def get_parent(self):
+        """returns the parent node, or None for the root"""
+        return self._parent
+
+    def get_children(self):
+        """returns the list of child nodes"""
+        return self._children
+
+    def get_untried(self):
+        """returns the list of moves not yet expanded"""
+        return self._untried
+
+    def get_visits(self):
+        """returns the number of playouts through the node"""
+        return self._visits
+
+    def get_wins(self):
+        """returns the playouts won by the player who made the node's move (draws count one half)"""
+        return self._wins
+
+    def add_child(self, move, untried):
+        """takes a move and the legal moves after it, adds and returns the child node it reaches"""
+        child = MCTSNode(move, self, untried)
+        self._children.append(child)
+        return child
+
+    def update(self, result):
+        """takes 1 for a win, 0.5 for a draw or 0 for a loss by the node's mover, records the playout"""
+        self._visits += 1
+        self._wins += result
+
+    def select_child(self, exploration):
+        """takes the exploration constant, returns the child with the highest UCT value"""
+        log_visits = math.log(self._visits)
+        best = None
+        best_value = -1.0
+        for child in self._children:
+            value = child._wins / child._visits + exploration * math.sqrt(log_visits / child._visits)
+            if value > best_value:
+                best = child
+                best_value = value
+        return best
+
+
+def playout_move(game, moves, policy, rng):
+    """
+    takes a FocusGame, a list of legal moves, the playout policy and a random.Random,
+    returns the move to make: any move for "random", or for "greedy" one of the moves that push
+    the most pieces off the bottom of a stack.
+    """
+    if policy == "random":
+        return rng.choice(moves)
+    board = game.get_board()
+    max_height = game.get_rules().get_max_height()
+    best = []
+    best_overflow = 0
+    for move in moves:
+        if move[0] == "move":
+            overflow = board.get_stack(move[2]).get_height() + move[3] - max_height
+        else:
+            overflow = board.get_stack(move[1]).get_height() + 1 - max_height
+        if overflow > best_overflow:
+            best = [move]
+            best_overflow = overflow
+        elif overflow == best_overflow and best_overflow > 0:
+            best.append(move)
+    if best:
+        return rng.choice(best)
+    return rng.choice(moves)
+
+
+def playout_result(game, names):
+    """
+    takes a FocusGame at the end of a playout and the names of the two players,
+    returns the name of the winner: the player who won the game, or if the playout was cut off,
+    the player who captured more pieces. Returns None if neither did.
+    """
+    state = game.get_game_state()
+    for name in names:
+        if state == name + " Wins":
+            return name
+    captured = [game.show_captured(name) for name in names]
+    if captured[0] > captured[1]:
+        return names[0]
+    if captured[1] > captured[0]:
+        return names[1]
+    return None
+
+
+def run_tree(game, player_name, playouts, exploration, max_plies, policy, seed):
+    """
+    takes a FocusGame, the name of the player to move, the number of playouts to run, the UCT
+    exploration constant, the most moves a playout may make, the playout policy and a random seed.
+    grows one search tree from the position, making and taking back moves on the game.
+    returns a dictionary from each root move to a tuple (visits, wins) and the number of playouts run.
+    Run in the worker processes of an MCTSPlayer, and directly when it has one worker.
+    """
+    rng = random.Random(seed)
+    names = (player_name, game.get_other_player(game.get_player_from_name(player_name)).get_name())
+    root = MCTSNode(None, None, list(game.legal_moves(player_name)))
+    rng.shuffle(root.get_untried())
+    for playout in range(0, playouts):
+        node = root
+        made = 0
+        while not node.get_untried() and node.get_children():       # selection
+            node = node.select_child(exploration)
+            game.make_move(names[made % 2], node.get_move())
+            made += 1
+        if node.get_untried():                                      # expansion
+            move = node.get_untried().pop()
+            game.make_move(names[made % 2], move)
+            made += 1
+            untried = list(game.legal_moves(names[made % 2]))
+            rng.shuffle(untried)
+            node = node.add_child(move, untried)
+        depth = made
+        while made - depth < max_plies:                             # playout
+            moves = list(game.legal_moves(names[made % 2]))
+            if not moves:
+                break
+            game.make_move(names[made % 2], playout_move(game, moves, policy, rng))
+            made += 1
+        winner = playout_result(game, names)
+        for undo in range(0, made):
+            game.unmake_move()
+        mover = (depth - 1) % 2                                     # backpropagation
+        while node is not root:
+            if winner is None:
+                node.update(0.5)
+            elif winner == names[mover]:
+                node.update(1.0)
+            else:
+                node.update(0.0)
+            node = node.get_parent()
+            mover = 1 - mover
+        root.update(0.0)
+    return {child.get_move(): (child.get_visits(), child.get_wins()) for child in root.get_children()}, playouts
+
+
+class MCTSPlayer:
+    """
+    Chooses moves for a FocusGame by Monte Carlo Tree Search with UCT selection.
+    Uses root parallelism: each worker process grows its own tree from the position with its own
+    random seed, and the visit and win counts of the root moves are added together, so the number
+    of playouts grows with the number of processes. With one worker the search runs in this process.
+    """
+
+    def __init__(self, workers=1, exploration=1.4, max_plies=100, policy="random", seed=0):
+        """
+        takes the number of worker processes, the UCT exploration constant, the most moves a playout
+        may make before it is scored by captured pieces, the playout policy ("random" or "greedy")
+        and the seed the workers' seeds are derived from.
+        """
+        self._workers = workers
+        self._exploration = exploration
+        self._max_plies = max_plies
+        self._policy = policy
+        self._seed = seed
+        self._searches = 0
+        self._pool = None
+        if workers > 1:
+            self._pool = ProcessPoolExecutor(max_workers=workers)
+        self._stats = {}
+        self._playouts_per_second = 0.0
+
+    def close(self):
+        """shuts down the worker processes"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def get_stats(self):
+        """returns the dictionary from each root move to (visits, wins) of the last search"""
+        return self._stats
+
+    def get_playouts_per_second(self):
+        """returns the number of playouts per second over all workers in the last search"""
+        return self._playouts_per_second
+
+    def search(self, game, player_name, playouts=1000):
+        """
+        takes a FocusGame, the name of the player to move and the number of playouts to run in total,
+        returns the move with the most visits over all the workers' trees,
+        or None if the player has no moves. The game is left as it was.
+        A move that wins the game at once is returned without searching.
+        """
+        for move in list(game.legal_moves(player_name)):
+            won = game.make_move(player_name, move) == player_name + " Wins"
+            game.unmake_move()
+            if won:
+                self._stats = {move: (1, 1.0)}
+                self._playouts_per_second = 0.0
+                return move
+
+        seed = self._seed + self._searches * self._workers
+        self._searches += 1
+        start = time.perf_counter()
+        args = (self._exploration, self._max_plies, self._policy)
+        if self._pool is None:
+            results = [run_tree(game, player_name, playouts, *args, seed)]
+        else:
+            share = -(-playouts // self._workers)
+            futures = [self._pool.submit(run_tree, game, player_name, share, *args, seed + worker)
+                       for worker in range(0, self._workers)]
+            results = [future.result() for future in futures]
+        elapsed = time.perf_counter() - start
+
+        self._stats = {}
+        total = 0
+        for stats, run in results:
+            total += run
+            for move in stats:
+                visits, wins = self._stats.get(move, (0, 0.0))
+                self._stats[move] = (visits + stats[move][0], wins + stats[move][1])
+        self._playouts_per_second = total / elapsed if elapsed > 0 else 0.0
+        if not self._stats:
+            return None
+        return max(sorted(self._stats), key=lambda move: self._stats[move][0])
@@ -0,0 +1,138 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: Counts the leaves of the Focus (Domination) move tree to a fixed depth (perft)
+# from the starting board and from fixed test positions, and benchmarks it on each board backend.
+
+import argparse
+import time
+from FocusGame import Board, PackedBoard, FocusGame
+
+BACKENDS = {"board": Board, "packed": PackedBoard}
+PLAYERS = (("Jim", "R"), ("Gary", "G"))
+
+# test positions, each reached by making these moves from the starting board, Jim moving first
+POSITIONS = {
+    "start": [],
+    "stacks": [("move", (0, 0), (0, 1), 1), ("move", (0, 2), (0, 3), 1),
+               ("move", (0, 1), (0, 3), 2), ("move", (1, 0), (1, 1), 1),
+               ("move", (0, 3), (3, 3), 3), ("move", (1, 1), (1, 3), 2)],
+    "reserve": [("move", (3, 3), (3, 4), 1), ("move", (1, 4), (1, 5), 1),
+                ("move", (4, 1), (5, 1), 1), ("move", (2, 3), (1, 3), 1),
+                ("move", (5, 1), (5, 0), 1), ("move", (1, 3), (1, 5), 2),
+                ("move", (5, 0), (4, 0), 1), ("move", (4, 3), (5, 3), 1),
+                ("move", (0, 5), (1, 5), 1), ("move", (1, 0), (2, 0), 1),
+                ("move", (4, 0), (2, 0), 2), ("move", (3, 0), (2, 0), 1),
+                ("move", (1, 5), (4, 5), 3), ("move", (3, 5), (4, 5), 1),
+                ("move", (4, 4), (4, 5), 1), ("move", (2, 0), (5, 0), 3),
+                ("move", (4, 5), (4, 0), 5), ("move", (5, 0), (4, 0), 1),
+                ("move", (5, 0), (4, 0), 1), ("move", (2, 0), (4, 0), 2),
+                ("move", (2, 5), (3, 5), 1), ("move", (5, 1), (4, 1), 1),
+                ("move", (5, 0), (4, 0), 1), ("move", (4, 1), (4, 0), 1)],
+}
+
+
+def position_game(position, board_class=Board):
+    """
+    takes the name of a test position and a board class,
+    returns a FocusGame at that position and the name of the player to move.
+    """
+    game = FocusGame(PLAYERS[0], PLAYERS[1], board_class)
+    names = (PLAYERS[0][0], PLAYERS[1][0])
+    moves = POSITIONS[position]
+    for ply in range(0, len(moves)):
+        if not game.make_move(names[ply % 2], moves[ply]):
+            raise ValueError("test position " + position + " has an illegal move " + str(moves[ply]))
+    return game, names[len(moves) % 2]
+
+
+def perft(game, player_name, depth):
+    """
+    takes a FocusGame, the name of the player to move and a depth,
+    returns the number of positions reached by every sequence of depth legal moves,
+    the players taking turns. Positions where the game is won before depth moves are not counted.
+    The last move of each sequence is counted, not made.
+    """
+    if depth == 0:
+        return 1
+    if depth == 1:
+        return sum(1 for move in game.legal_moves(player_name))
+    other = game.get_other_player(game.get_player_from_name(player_name)).get_name()
+    nodes = 0
+    for move in list(game.legal_moves(player_name)):
+        game.make_move(player_name, move)
+        nodes += perft(game, other, depth - 1)
+        game.unmake_move()
+    return nodes
+
+
+def reference_moves(game, player_name):
+    """
+    takes a FocusGame and the name of the player to move,
+    returns every legal move found by trying all moves with verify_move, verify_stack_move and
+    the reserve rule of reserved_move, without the reach tables of legal_moves.
+    """
+    player = game.get_player_from_name(player_name)
+    spaces = [coord for row in game.get_rules().get_coords() for coord in row]
+    moves = []
+    for src in spaces:
+        for dst in spaces:
+            if not game.verify_move(player, dst):
+                continue
+            for num_pieces in range(1, game.get_rules().get_max_height() + 1):
+                if game.verify_stack_move(player, src, dst, num_pieces):
+                    moves.append(("move", src, dst, num_pieces))
+    if player.get_reserve() > 0:
+        for dst in spaces:
+            if game.verify_move(player, dst):
+                moves.append(("reserve", dst))
+    return moves
+
+
+def reference_perft(game, player_name, depth):
+    """
+    takes a FocusGame, the name of the player to move and a depth,
+    returns the same count as perft, found with reference_moves instead of legal_moves.
+    """
+    if depth == 0:
+        return 1
+    other = game.get_other_player(game.get_player_from_name(player_name)).get_name()
+    nodes = 0
+    for move in reference_moves(game, player_name):
+        game.make_move(player_name, move)
+        nodes += reference_perft(game, other, depth - 1)
+        game.unmake_move()
+    return nodes
+
+
+def benchmark(depth, positions=None, backends=None):
+    """
+    takes a depth and optional lists of position and backend names (all of them if None),
+    runs perft on each position with each backend, returns a list of dictionaries with the
+    position, backend, depth, nodes counted, seconds taken and nodes per second.
+    """
+    results = []
+    for position in positions or sorted(POSITIONS):
+        for backend in backends or sorted(BACKENDS):
+            game, player_name = position_game(position, BACKENDS[backend])
+            start = time.perf_counter()
+            nodes = perft(game, player_name, depth)
+            seconds = time.perf_counter() - start
+            results.append({"position": position, "backend": backend, "depth": depth, "nodes": nodes,
+                            "seconds": seconds, "nodes_per_second": nodes / seconds if seconds > 0 else 0.0})
+    return results
+
+
+def main(argv=None):
+    """runs the perft benchmark from the command line and prints one line per position and backend"""
+    parser = argparse.ArgumentParser(description="Counts Focus move-tree leaves and reports nodes/sec.")
+    parser.add_argument("--depth", type=int, default=3)
+    parser.add_argument("--position", action="append", choices=sorted(POSITIONS))
+    parser.add_argument("--backend", action="append", choices=sorted(BACKENDS))
+    args = parser.parse_args(argv)
+    for result in benchmark(args.depth, args.position, args.backend):
+        print("{position:8} {backend:7} depth {depth}: {nodes:>10} nodes {seconds:8.3f}s "
+              "{nodes_per_second:>12.0f} nodes/s".format(**result))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,296 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: Search support for Focus (Domination) engines built on FocusGame,
+# a fixed-size transposition table keyed by FocusGame.get_hash() and an alpha-beta engine.
+
+import time
+from array import array
+
+EXACT = 0           # the score is the exact value of the position
+LOWER = 1           # the search failed high, the value is at least the score
+UPPER = 2           # the search failed low, the value is at most the score
+
+
+class TranspositionTable:
+    """
+    A fixed-size table of search results keyed by 64-bit position hashes.
+    The table is split into buckets of two slots: the first keeps the entry searched to the greatest
+    depth (depth-preferred), the second always takes the newest entry that did not go in the first
+    (always-replace), so deep results survive while recent shallow ones are still found.
+    Each entry holds the full key, the depth searched, the score, the bound type and the best move.
+    Counts hits, misses and collisions (a probe that finds the bucket holding other positions).
+    """
+
+    SLOT_BYTES = 22     # key (8) + depth (1) + score (4) + bound (1) + reference to the move (8)
+
+    def __init__(self, memory_bytes=16 * 1024 * 1024):
+        """
+        takes the number of bytes the table may use,
+        creates a table with the largest power of two buckets that fits in that memory.
+        """
+        buckets = 1
+        while buckets * 2 * 2 * self.SLOT_BYTES <= memory_bytes:
+            buckets *= 2
+        self._mask = buckets - 1
+        self._keys = array("Q", [0]) * (buckets * 2)
+        self._depths = array("b", [-1]) * (buckets * 2)    # -1 marks an empty slot
+        self._scores = array("i", [0]) * (buckets * 2)
+        self._bounds = array("b", [0]) * (buckets * 2)
+        self._moves = [None] * (buckets * 2)
+        self._hits = 0
+        self._misses = 0
+        self._collisions = 0
+        self._stores = 0
+
+    def get_size(self):
+        """returns the number of slots in the table"""
+        return len(self._keys)
+
+    def probe(self, key):
+        """
+        takes a position hash,
+        returns a tuple (depth, score, bound, move) stored for that position, or None if there is none.
+        """
+        slot = (key & self._mask) * 2
+        keys = self._keys
+        depths = self._depths
+        for index in (slot, slot + 1):
+            if keys[index] == key and depths[index] >= 0:
+                self._hits += 1
+                return depths[index], self._scores[index], self._bounds[index], self._moves[index]
+        self._misses += 1
+        if depths[slot] >= 0 or depths[slot + 1] >= 0:
+            self._collisions += 1
+        return None
+
+    def store(self, key, depth, score, bound, move):
+        """
+        takes a position hash, the depth it was searched to, its score, the bound type
+        (EXACT, LOWER or UPPER) and the best move found.
+        stores the entry in the depth-preferred slot if the position is already there or the search
+        was at least as deep as the entry there, otherwise in the always-replace slot.
+        """
+        slot = (key & self._mask) * 2
+        if self._keys[slot + 1] == key and self._keys[slot] != key:
+            index = slot + 1                        # keeps one copy of a position in the bucket
+        elif self._keys[slot] == key or depth >= self._depths[slot]:
+            index = slot
+        else:
+            index = slot + 1
+        self._keys[index] = key
+        self._depths[index] = min(depth, 127)
+        self._scores[index] = score
+        self._bounds[index] = bound
+        self._moves[index] = move
+        self._stores += 1
+
+    def clear(self):
+        """empties every slot of the table and resets its statistics"""
+        for index in range(0, len(self._keys)):
+            self._keys[index] = 0
+            self._depths[index] = -1
+            self._moves[index] = None
+        self._hits = 0
+        self._misses = 0
+        self._collisions = 0
+        self._stores = 0
+
+    def get_stats(self):
+        """returns a dictionary with the table's size and its hit, miss, collision and store counts"""
+        return {"slots": len(self._keys), "hits": self._hits, "misses": self._misses,
+                "collisions": self._collisions, "stores": self._stores}
+
+
+WIN_SCORE = 100000      # the score of a won position, less the number of moves it takes to win
+
+
+class SearchTimeout(Exception):
+    """Raised inside Engine.search when the node or time budget runs out, to unwind the search."""
+    pass
+
+
+class Engine:
+    """
+    Plays Focus by negamax alpha-beta search with iterative deepening on a FocusGame.
+    Moves are made and taken back with make_move/unmake_move, so the rules are exactly those of
+    move_piece and reserved_move, and a game is lost when the opponent captures six pieces
+    or the player has no moves left (check_endgame).
+    Results are kept in a TranspositionTable, whose best moves are searched first, followed by
+    moves that push pieces off the bottom of a stack.
+    """
+
+    def __init__(self, table=None):
+        """takes an optional TranspositionTable to share, otherwise creates one of the default size"""
+        if table is None:
+            table = TranspositionTable()
+        self._table = table
+        self._nodes = 0
+        self._depth = 0
+        self._max_nodes = None
+        self._deadline = None
+        self._root_move = None
+
+    def get_table(self):
+        """returns the engine's TranspositionTable"""
+        return self._table
+
+    def get_nodes(self):
+        """returns the number of positions visited by the last search"""
+        return self._nodes
+
+    def get_depth(self):
+        """returns the depth of the last iteration the last search completed"""
+        return self._depth
+
+    def search(self, game, player_name, max_depth=64, max_nodes=None, max_time=None):
+        """
+        takes a FocusGame, the name of the player to move, the greatest depth to search to,
+        and optionally the most positions to visit and the most seconds to spend.
+        searches one move deeper each iteration until the depth or a budget is reached.
+        returns a tuple (best move, score, principal variation) from the deepest completed iteration,
+        where the score is from the player's point of view and the principal variation is the list of
+        moves both players are expected to make. The best move is None if the player has no moves.
+        """
+        names = (player_name, game.get_other_player(game.get_player_from_name(player_name)).get_name())
+        moves = list(game.legal_moves(player_name))
+        self._nodes = 0
+        self._depth = 0
+        self._max_nodes = max_nodes
+        self._deadline = None if max_time is None else time.perf_counter() + max_time
+        if not moves:
+            return None, -WIN_SCORE, []
+
+        best = (moves[0], 0, [moves[0]])
+        for depth in range(1, max_depth + 1):
+            try:
+                score = self.negamax(game, names, depth, 0, -WIN_SCORE - 1, WIN_SCORE + 1)
+            except SearchTimeout:
+                break
+            pv = self.principal_variation(game, names, depth)
+            if not pv or pv[0] != self._root_move:     # the root entry was replaced in the table
+                pv = [self._root_move]
+            best = (self._root_move, score, pv)
+            self._depth = depth
+            if abs(score) >= WIN_SCORE - max_depth:     # a forced win or loss was found
+                break
+        return best
+
+    def negamax(self, game, names, depth, ply, alpha, beta):
+        """
+        takes a FocusGame, a tuple of the names of the player to move and their opponent,
+        the remaining depth, the number of moves made since the root, and the alpha-beta window.
+        returns the score of the position for the player to move.
+        """
+        self._nodes += 1
+        if self._max_nodes is not None and self._nodes > self._max_nodes:
+            raise SearchTimeout()
+        if self._deadline is not None and self._nodes % 256 == 0 and time.perf_counter() > self._deadline:
+            raise SearchTimeout()
+
+        if game.get_game_state() != "PLAYING":       # the opponent's last move won the game
+            return -WIN_SCORE + ply
+        if depth == 0:
+            return self.evaluate(game, names[0])
+
+        key = game.get_hash()
+        entry = self._table.probe(key)
+        tt_move = None
+        if entry is not None:
+            entry_depth, score, bound, tt_move = entry
+            if score > WIN_SCORE - 1000:            # win scores are stored relative to the position
+                score -= ply
+            elif score < -WIN_SCORE + 1000:
+                score += ply
+            if ply > 0 and entry_depth >= depth:
+                if bound == EXACT:
+                    return score
+                if bound == LOWER and score >= beta:
+                    return score
+                if bound == UPPER and score <= alpha:
+                    return score
+
+        moves = self.order_moves(game, list(game.legal_moves(names[0])), tt_move)
+        if not moves:
+            return -WIN_SCORE + ply
+
+        original_alpha = alpha
+        best_score = -WIN_SCORE - 1
+        best_move = None
+        other = (names[1], names[0])
+        for move in moves:
+            game.make_move(names[0], move)
+            try:
+                score = -self.negamax(game, other, depth - 1, ply + 1, -beta, -alpha)
+            finally:
+                game.unmake_move()
+            if score > best_score:
+                best_score = score
+                best_move = move
+                if score > alpha:
+                    alpha = score
+                    if alpha >= beta:
+                        break
+
+        if best_score >= beta:
+            bound = LOWER
+        elif best_score <= original_alpha:
+            bound = UPPER
+        else:
+            bound = EXACT
+        if ply == 0:
+            self._root_move = best_move
+        stored = best_score
+        if stored > WIN_SCORE - 1000:
+            stored += ply
+        elif stored < -WIN_SCORE + 1000:
+            stored -= ply
+        self._table.store(key, depth, stored, bound, best_move)
+        return best_score
+
+    def order_moves(self, game, moves, tt_move):
+        """
+        takes a FocusGame, a list of legal moves and the best move from the transposition table (or None),
+        returns the moves with the table's move first, then the moves that push the most pieces off
+        the bottom of a stack, then the rest, with reserve moves after stack moves that push off as many.
+        """
+        board = game.get_board()
+        max_height = game.get_rules().get_max_height()
+        scored = []
+        for move in moves:
+            if move == tt_move:
+                priority = 1000
+            elif move[0] == "move":
+                priority = (board.get_stack(move[2]).get_height() + move[3] - max_height) * 10 + 5
+            else:
+                priority = (board.get_stack(move[1]).get_height() + 1 - max_height) * 10
+            scored.append((priority, move))
+        scored.sort(key=lambda pair: pair[0], reverse=True)
+        return [move for priority, move in scored]
+
+    def evaluate(self, game, player_name):
+        """
+        takes a FocusGame and a player_name,
+        returns a static score of the position for that player: captured pieces count the most,
+        then pieces in reserve, then stacks controlled, then the opponent's pieces buried under
+        the player's stacks and tall stacks controlled, all read from the game's running features.
+        """
+        captured, reserve, controlled, buried, tall = game.get_features(game.get_player_from_name(player_name))
+        return 100 * captured + 30 * reserve + 10 * controlled + 5 * buried + 5 * tall
+
+    def principal_variation(self, game, names, depth):
+        """
+        takes a FocusGame, the names of the player to move and their opponent, and a depth,
+        returns up to that many moves found by following the best moves in the transposition table.
+        """
+        pv = []
+        made = 0
+        while made < depth and game.get_game_state() == "PLAYING":
+            entry = self._table.probe(game.get_hash())
+            if entry is None or entry[3] is None or entry[3] not in set(game.legal_moves(names[made % 2])):
+                break
+            pv.append(entry[3])
+            game.make_move(names[made % 2], entry[3])
+            made += 1
+        for move in pv:
+            game.unmake_move()
+        return pv
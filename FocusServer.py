@@ -0,0 +1,230 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: An asyncio server hosting many Focus (Domination) games at once over TCP or a Unix socket,
+# with a line protocol naming the FocusGame methods and routing each request by game id.
+
+import argparse
+import asyncio
+from FocusGame import Board, PackedBoard, FocusGame, rules_for
+
+BOARDS = {"board": Board, "packed": PackedBoard}
+MAX_LINE = 1024         # the longest request line, in bytes
+
+
+class FocusServer:
+    """
+    Holds any number of FocusGames by id and answers requests for them, one line per request:
+        new <name a> <color a> <name b> <color b>               OK <game id>
+        move_piece <id> <name> <row> <column> <row> <column> <pieces>
+                                                                OK successfully moved | OK <name> Wins
+        reserved_move <id> <name> <row> <column>                OK successfully moved | OK <name> Wins
+        show_pieces <id> <row> <column>                         OK <color of each piece, bottom first>
+        show_reserve <id> <name>, show_captured <id> <name>     OK <count>
+        state <id>                                              OK <game state>
+        close <id>                                              OK
+    A request that cannot be carried out is answered with ERR and the reason.
+    Every game lives on the one event loop, so no request needs a lock.
+    """
+
+    def __init__(self, board_class=Board, max_games=None, rules=None):
+        """
+        takes the board class and Rules for new games (the 6x6 game's if None)
+        and the most games to hold at once (no limit if None)
+        """
+        self._board_class = board_class
+        self._rules = rules
+        self._max_games = max_games
+        self._games = {}
+        self._next_id = 1
+        self._requests = 0
+        self._commands = {"new": self.new_game, "move_piece": self.move_piece,
+                          "reserved_move": self.reserved_move, "show_pieces": self.show_pieces,
+                          "show_reserve": self.show_reserve, "show_captured": self.show_captured,
+                          "state": self.state, "close": self.close_game}
+
+    def get_games(self):
+        """returns the dictionary of games by id"""
+        return self._games
+
+    def get_requests(self):
+        """returns the number of requests answered"""
+        return self._requests
+
+    def handle(self, line):
+        """takes one request line without its newline, returns the response line without its newline"""
+        self._requests += 1
+        words = line.split()
+        if not words:
+            return "ERR empty request"
+        command = self._commands.get(words[0])
+        if command is None:
+            return "ERR unknown command " + words[0]
+        try:
+            result = command(words[1:])
+        except (KeyError, ValueError) as error:
+            return "ERR " + str(error.args[0])
+        return "OK " + result if result else "OK"
+
+    def get_game(self, game_id):
+        """takes a game id as a string, returns its FocusGame, raises KeyError if there is none"""
+        game = self._games.get(int(game_id))
+        if game is None:
+            raise KeyError("no game " + game_id)
+        return game
+
+    def get_player_name(self, game, player_name):
+        """takes a FocusGame and a player name, returns the name, raises KeyError if no player has it"""
+        if game.get_player_from_name(player_name) is None:
+            raise KeyError("no player " + player_name)
+        return player_name
+
+    def new_game(self, args):
+        """takes [name a, color a, name b, color b], starts a game, returns its id"""
+        if len(args) != 4:
+            raise ValueError("new takes two names and two colors")
+        if args[0] == args[2] or args[1] == args[3]:
+            raise ValueError("the players need different names and colors")
+        if self._max_games is not None and len(self._games) >= self._max_games:
+            raise ValueError("too many games")
+        game_id = self._next_id
+        self._next_id += 1
+        self._games[game_id] = FocusGame((args[0], args[1]), (args[2], args[3]), self._board_class, self._rules)
+        return str(game_id)
+
+    def move_piece(self, args):
+        """takes [id, name, source row, column, destination row, column, pieces], makes the move"""
+        if len(args) != 7:
+            raise ValueError("move_piece takes a game, a name, two coordinates and a number of pieces")
+        game = self.get_game(args[0])
+        numbers = [int(arg) for arg in args[2:]]
+        result = game.move_piece(self.get_player_name(game, args[1]), (numbers[0], numbers[1]),
+                                 (numbers[2], numbers[3]), numbers[4])
+        if not result:
+            raise ValueError("invalid move")
+        return result
+
+    def reserved_move(self, args):
+        """takes [id, name, row, column], places a reserve piece there"""
+        if len(args) != 4:
+            raise ValueError("reserved_move takes a game, a name and a coordinate")
+        game = self.get_game(args[0])
+        result = game.reserved_move(self.get_player_name(game, args[1]), (int(args[2]), int(args[3])))
+        if not result:
+            raise ValueError("invalid move")
+        return result
+
+    def show_pieces(self, args):
+        """takes [id, row, column], returns the colors of the pieces there, bottom piece first"""
+        if len(args) != 3:
+            raise ValueError("show_pieces takes a game and a coordinate")
+        game = self.get_game(args[0])
+        coord = (int(args[1]), int(args[2]))
+        if coord not in game.get_rules().get_spaces():
+            raise ValueError("off the board")
+        return " ".join(game.show_pieces(coord))
+
+    def show_reserve(self, args):
+        """takes [id, name], returns the number of pieces in the player's reserve"""
+        if len(args) != 2:
+            raise ValueError("show_reserve takes a game and a name")
+        game = self.get_game(args[0])
+        return str(game.show_reserve(self.get_player_name(game, args[1])))
+
+    def show_captured(self, args):
+        """takes [id, name], returns the number of pieces the player has captured"""
+        if len(args) != 2:
+            raise ValueError("show_captured takes a game and a name")
+        game = self.get_game(args[0])
+        return str(game.show_captured(self.get_player_name(game, args[1])))
+
+    def state(self, args):
+        """takes [id], returns the game's state"""
+        if len(args) != 1:
+            raise ValueError("state takes a game")
+        return self.get_game(args[0]).get_game_state()
+
+    def close_game(self, args):
+        """takes [id], removes the game"""
+        if len(args) != 1:
+            raise ValueError("close takes a game")
+        self.get_game(args[0])
+        del self._games[int(args[0])]
+        return ""
+
+    async def start(self, host="127.0.0.1", port=0, path=None):
+        """
+        takes a host and port to listen on over TCP, or the path of a Unix socket,
+        starts serving and returns the asyncio Server.
+        """
+        if path is not None:
+            return await asyncio.get_running_loop().create_unix_server(lambda: FocusConnection(self), path)
+        return await asyncio.get_running_loop().create_server(lambda: FocusConnection(self), host, port)
+
+
+class FocusConnection(asyncio.Protocol):
+    """
+    One client connection to a FocusServer. Every request line that arrives in one read is answered
+    and the responses are sent back with a single write, so a client pipelining many requests gets
+    them back in one batch. Reading stops while the client is not keeping up with the responses.
+    """
+
+    def __init__(self, server):
+        """takes the FocusServer answering the requests"""
+        self._server = server
+        self._transport = None
+        self._buffer = b""
+
+    def connection_made(self, transport):
+        """keeps the transport to write responses to"""
+        self._transport = transport
+
+    def data_received(self, data):
+        """answers every complete request line received, with one write for all of them"""
+        lines = (self._buffer + data).split(b"\n")
+        self._buffer = lines.pop()
+        if len(self._buffer) > MAX_LINE:
+            self._transport.write(b"ERR request too long\n")
+            self._transport.close()
+            return
+        if lines:
+            handle = self._server.handle
+            self._transport.write("".join([handle(line.decode("utf-8", "replace")) + "\n"
+                                           for line in lines]).encode("utf-8"))
+
+    def pause_writing(self):
+        """stops reading requests while the responses are not being read"""
+        self._transport.pause_reading()
+
+    def resume_writing(self):
+        """reads requests again once the responses are being read"""
+        self._transport.resume_reading()
+
+
+async def serve(server, host, port, path):
+    """takes a FocusServer and where to listen (see FocusServer.start), serves until cancelled"""
+    listener = await server.start(host, port, path)
+    async with listener:
+        await listener.serve_forever()
+
+
+def main(argv=None):
+    """runs the game server from the command line"""
+    parser = argparse.ArgumentParser(description="Hosts Focus games over a line protocol.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=7600)
+    parser.add_argument("--unix", help="listen on this Unix socket path instead of TCP")
+    parser.add_argument("--board", choices=sorted(BOARDS), default="board")
+    parser.add_argument("--max-games", type=int)
+    parser.add_argument("--size", type=int, default=6, help="the width of the board")
+    parser.add_argument("--max-height", type=int, default=5, help="the most pieces a stack may hold")
+    parser.add_argument("--win-captures", type=int, default=6, help="the captures that win a game")
+    args = parser.parse_args(argv)
+    server = FocusServer(BOARDS[args.board], args.max_games, rules_for(args.size, args.max_height, args.win_captures))
+    try:
+        asyncio.run(serve(server, args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: Opt-in instrumentation for FocusGame: call counts and latency histograms of its hot methods,
+# counts of captured, reserved and trimmed pieces, and a periodic JSON dump of them.
+
+import json
+import sys
+import threading
+import time
+
+METHODS = ("move_piece", "reserved_move", "verify_move", "verify_stack_move", "check_endgame")
+BUCKETS = 24            # bucket b counts calls under 2 ** (b + 8) nanoseconds, the last bucket the rest
+
+
+class GameStats:
+    """
+    Collects the calls and latencies of the methods of instrumented FocusGames, and the pieces their moves
+    captured, put in reserve and trimmed from the bottom of stacks higher than five.
+    Latencies go into power-of-two buckets of nanoseconds, so recording a call is a few integer operations.
+    One GameStats can collect from any number of games.
+    """
+
+    def __init__(self):
+        """creates empty statistics"""
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """clears every count and histogram"""
+        with self._lock:
+            self._calls = {name: 0 for name in METHODS}
+            self._nanoseconds = {name: 0 for name in METHODS}
+            self._histograms = {name: [0] * BUCKETS for name in METHODS}
+            self._captures = 0
+            self._reserves = 0
+            self._trims = 0
+
+    def record_call(self, name, nanoseconds):
+        """takes the name of a method and how long a call to it took in nanoseconds, counts the call"""
+        bucket = max(0, nanoseconds.bit_length() - 8)
+        with self._lock:
+            self._calls[name] += 1
+            self._nanoseconds[name] += nanoseconds
+            self._histograms[name][bucket if bucket < BUCKETS else BUCKETS - 1] += 1
+
+    def record_pieces(self, captured, reserved):
+        """takes the number of pieces a move captured and put in reserve, counts them and the trim, if any"""
+        if captured or reserved:
+            with self._lock:
+                self._captures += captured
+                self._reserves += reserved
+                self._trims += 1
+
+    def percentile(self, name, fraction):
+        """
+        takes the name of a method and a fraction between 0 and 1,
+        returns the upper bound in seconds of the latency bucket holding that fraction of its calls,
+        or 0.0 if it has not been called.
+        """
+        histogram = self._histograms[name]
+        needed = fraction * sum(histogram)
+        seen = 0
+        for bucket in range(0, BUCKETS):
+            seen += histogram[bucket]
+            if seen and seen >= needed:
+                return 2 ** (bucket + 8) / 1e9
+        return 0.0
+
+    def get_stats(self):
+        """
+        returns a dictionary with, for each method, its calls, total seconds, 50th and 99th percentile
+        latencies and histogram, and the counts of captures, reserves and trims.
+        """
+        with self._lock:
+            stats = {"captures": self._captures, "reserves": self._reserves, "trims": self._trims}
+            for name in METHODS:
+                stats[name] = {"calls": self._calls[name], "seconds": self._nanoseconds[name] / 1e9,
+                               "p50": self.percentile(name, 0.5), "p99": self.percentile(name, 0.99),
+                               "histogram": list(self._histograms[name])}
+        return stats
+
+    def dump(self, stream=None):
+        """takes a text stream (standard output if None), writes the statistics to it as one JSON line"""
+        stream = stream or sys.stdout
+        stream.write(json.dumps(self.get_stats()) + "\n")
+        stream.flush()
+
+    def start_dumping(self, interval, stream=None):
+        """
+        takes a number of seconds and a text stream, dumps the statistics to the stream every interval
+        from a background thread. returns a threading.Event that stops the dumps when set.
+        """
+        stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                self.dump(stream)
+
+        threading.Thread(target=run, daemon=True).start()
+        return stop
+
+
+def timed(stats, name, method):
+    """takes a GameStats, the name of a method and the bound method, returns it wrapped to record its calls"""
+    clock = time.perf_counter_ns
+
+    def wrapper(*args):
+        start = clock()
+        result = method(*args)
+        stats.record_call(name, clock() - start)
+        return result
+    return wrapper
+
+
+def counted(stats, game, name, method):
+    """
+    takes a GameStats, a FocusGame, the name of one of its move methods and the bound method,
+    returns it wrapped to record its calls and the pieces the move captured and put in reserve,
+    found from the moving player's counts before and after it.
+    """
+    clock = time.perf_counter_ns
+
+    def wrapper(player_name, *args):
+        player = game.get_player_from_name(player_name)
+        if player is None:
+            return method(player_name, *args)
+        captured = player.get_captured()
+        reserve = player.get_reserve()
+        start = clock()
+        result = method(player_name, *args)
+        stats.record_call(name, clock() - start)
+        if result:
+            reserved = player.get_reserve() - reserve
+            if name == "reserved_move" and player.get_captured() < game.get_rules().get_win_captures():
+                reserved += 1                   # the piece placed came out of the reserve, unless the move won first
+            stats.record_pieces(player.get_captured() - captured, reserved)
+        return result
+    return wrapper
+
+
+def instrument(game, stats=None):
+    """
+    takes a FocusGame and a GameStats (a new one if None),
+    makes the game record its calls and moves into the statistics, returns the GameStats.
+    Only the given game is changed: the wrappers are set on the object and shadow the class's methods,
+    so games that are not instrumented run exactly as before.
+    """
+    if stats is None:
+        stats = GameStats()
+    for name in METHODS:
+        method = getattr(type(game), name).__get__(game)
+        if name in ("move_piece", "reserved_move"):
+            setattr(game, name, counted(stats, game, name, method))
+        else:
+            setattr(game, name, timed(stats, name, method))
+    return stats
+
+
+def uninstrument(game):
+    """takes an instrumented FocusGame, removes its wrappers so it stops recording"""
+    for name in METHODS:
+        game.__dict__.pop(name, None)
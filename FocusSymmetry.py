@@ -0,0 +1,120 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: The symmetries of Focus (Domination) positions, mirroring the board left to right and
+# flipping it top to bottom while swapping the players, with a canonical hash for each class of positions.
+
+from FocusGame import FocusGame, ZOBRIST_TURN
+
+IDENTITY = 0            # the position as it is
+MIRROR = 1              # columns mirrored left to right
+FLIP_SWAP = 2           # rows flipped top to bottom, and the players swapped
+MIRROR_FLIP_SWAP = 3    # both
+SYMMETRIES = (IDENTITY, MIRROR, FLIP_SWAP, MIRROR_FLIP_SWAP)
+
+
+def transform_coord(coord, symmetry, size):
+    """takes a tuple with coordinates, a symmetry and the width of the board, returns the transformed coordinates"""
+    row, column = coord
+    if symmetry & MIRROR:
+        column = size - 1 - column
+    if symmetry & FLIP_SWAP:
+        row = size - 1 - row
+    return row, column
+
+
+def transform_move(move, symmetry, size):
+    """
+    takes a move in the form yielded by legal_moves, a symmetry and the width of the board,
+    returns the same move in the transformed position. Every symmetry is its own inverse, so transforming
+    a move of the transformed position with the same symmetry gives back the original move.
+    With FLIP_SWAP the move is made by the other player in the transformed position.
+    """
+    if move[0] == "reserve":
+        return "reserve", transform_coord(move[1], symmetry, size)
+    return "move", transform_coord(move[1], symmetry, size), transform_coord(move[2], symmetry, size), move[3]
+
+
+def symmetric_hashes(game):
+    """
+    takes a FocusGame, returns a list of the get_hash value the game would have in each transformed position,
+    indexed by symmetry. The board is read once, as packed cells, for all four.
+    """
+    rules = game.get_rules()
+    size = rules.get_size()
+    cells = game.get_board().get_cells()
+    hashes = [0, 0, 0, 0]
+    for row in range(0, size):
+        for column in range(0, size):
+            cell = cells[row * size + column]
+            height = cell.bit_length() - 1
+            swapped = cell ^ ((1 << height) - 1)            # the same stack with the colors swapped
+            for symmetry in SYMMETRIES:
+                index = transform_coord((row, column), symmetry, size)
+                index = index[0] * size + index[1]
+                hashes[symmetry] ^= rules.get_cell_key(index, swapped if symmetry & FLIP_SWAP else cell)
+
+    counts = rules.get_count_keys()
+    players = [game.get_player_a(), game.get_player_b()]
+    turn = 0
+    if game.get_last_player() is not None:
+        turn = players.index(game.get_last_player()) + 1
+    for symmetry in SYMMETRIES:
+        order = players[::-1] if symmetry & FLIP_SWAP else players
+        turned = [0, 2, 1][turn] if symmetry & FLIP_SWAP else turn
+        hashes[symmetry] ^= (ZOBRIST_TURN[turned][0][0]
+                             ^ counts[0][order[0].get_reserve()][0]
+                             ^ counts[1][order[0].get_captured()][0]
+                             ^ counts[2][order[1].get_reserve()][0]
+                             ^ counts[3][order[1].get_captured()][0])
+    return hashes
+
+
+def canonical_hash(game):
+    """
+    takes a FocusGame, returns (canonical hash, symmetry): the smallest hash of the game's symmetric positions
+    and the symmetry that gives it. Every position of a class has the same canonical hash, so tables can
+    store the class once under it, transforming moves with transform_move and the symmetry to and from it.
+    """
+    hashes = symmetric_hashes(game)
+    symmetry = hashes.index(min(hashes))
+    return hashes[symmetry], symmetry
+
+
+def transform_game(game, symmetry):
+    """
+    takes a FocusGame and a symmetry, returns a new FocusGame with the same players, board class and rules
+    in the transformed position. With FLIP_SWAP each player keeps their name and color but takes over
+    the other player's pieces, reserve and captured counts and turn.
+    """
+    rules = game.get_rules()
+    size = rules.get_size()
+    players = [game.get_player_a(), game.get_player_b()]
+    swap = symmetry & FLIP_SWAP
+
+    cells = game.get_board().get_cells()
+    moved = list(cells)
+    for index in range(0, size * size):
+        cell = cells[index]
+        if swap:
+            cell ^= (1 << (cell.bit_length() - 1)) - 1
+        row, column = transform_coord((index // size, index % size), symmetry, size)
+        moved[row * size + column] = cell
+    copy = FocusGame((players[0].get_name(), players[0].get_color()),
+                     (players[1].get_name(), players[1].get_color()), type(game.get_board()), rules, moved)
+    copies = [copy.get_player_a(), copy.get_player_b()]
+
+    for index in range(0, 2):
+        source = players[1 - index] if swap else players[index]
+        copies[index].set_reserve(source.get_reserve())
+        copies[index].set_captured(source.get_captured())
+    last = game.get_last_player()
+    if last is not None:
+        index = players.index(last)
+        copy.set_last_player(copies[1 - index if swap else index])
+    state = game.get_game_state()
+    for index in range(0, 2):
+        if state == players[index].get_name() + " Wins":
+            state = copies[1 - index if swap else index].get_name() + " Wins"
+            break
+    copy.set_game_state(state)
+    return copy
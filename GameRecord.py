@@ -0,0 +1,136 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: An append-only binary log of Focus (Domination) games, with a reader that streams
+# the records back and replays them through FocusGame one move at a time.
+
+import struct
+from FocusGame import Board, FocusGame, encode_move, decode_move
+
+GAME = 0x01             # a game starting from the starting board: the names and colors of both players
+SNAPSHOT = 0x02         # a game starting from a FocusGame.to_bytes snapshot
+MOVE = 0x10             # a move by player a (MOVE) or player b (MOVE | 1), followed by its encode_move code
+
+MOVE_FORMAT = struct.Struct("<BI")
+
+
+class GameRecordWriter:
+    """
+    Appends games to a binary log file. Each game starts with a GAME or SNAPSHOT record and is followed
+    by one five-byte MOVE record per move, so records can be written as they are played and the file
+    can always be appended to.
+    """
+
+    def __init__(self, path):
+        """takes the path of the log, opens it for appending"""
+        self._file = open(path, "ab")
+
+    def __enter__(self):
+        """returns the writer, so it can be used in a with statement"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """closes the log at the end of a with statement"""
+        self.close()
+
+    def begin_game(self, player_a, player_b):
+        """
+        takes the (name, color) tuples of the two players, starts a game from the starting board.
+        raises ValueError, writing nothing, if a name or color takes more than 255 bytes.
+        """
+        record = bytes([GAME])
+        for value in (player_a[0], player_a[1], player_b[0], player_b[1]):
+            value = value.encode("utf-8")
+            if len(value) > 0xFF:
+                raise ValueError("a player's name and color must take at most 255 bytes each in a game log")
+            record += bytes([len(value)]) + value
+        self._file.write(record)
+
+    def begin_snapshot(self, game):
+        """takes a FocusGame, starts a game from its current position"""
+        snapshot = game.to_bytes()
+        self._file.write(struct.pack("<BH", SNAPSHOT, len(snapshot)) + snapshot)
+
+    def write_move(self, player_index, move):
+        """takes 0 for player a or 1 for player b and a move in the form yielded by legal_moves, records it"""
+        self._file.write(MOVE_FORMAT.pack(MOVE | player_index, encode_move(move)))
+
+    def flush(self):
+        """writes any buffered records to the file"""
+        self._file.flush()
+
+    def close(self):
+        """flushes and closes the log"""
+        self._file.close()
+
+
+def read_exactly(log, length, start, path):
+    """
+    takes an open log, a number of bytes, the offset of the record being read and the log's path,
+    returns the next length bytes of the log, raises ValueError if the log ends before them.
+    """
+    data = log.read(length)
+    if len(data) < length:
+        raise ValueError("truncated record at byte " + str(start) + " of game log " + str(path))
+    return data
+
+
+def read_records(path):
+    """
+    takes the path of a log, yields its records one at a time without reading the whole file:
+    ("game", player_a, player_b) with (name, color) tuples, ("snapshot", bytes) and
+    ("move", player_index, move).
+    raises ValueError if a record is unknown or cut short, as the last record is if writing it was interrupted.
+    """
+    with open(path, "rb") as log:
+        while True:
+            start = log.tell()
+            tag = log.read(1)
+            if not tag:
+                return
+            tag = tag[0]
+            if tag & ~1 == MOVE:
+                code = struct.unpack("<I", read_exactly(log, 4, start, path))[0]
+                yield "move", tag & 1, decode_move(code)
+            elif tag == GAME:
+                values = []
+                for value in range(0, 4):
+                    length = read_exactly(log, 1, start, path)[0]
+                    values.append(read_exactly(log, length, start, path).decode("utf-8"))
+                yield "game", (values[0], values[1]), (values[2], values[3])
+            elif tag == SNAPSHOT:
+                length = struct.unpack("<H", read_exactly(log, 2, start, path))[0]
+                yield "snapshot", read_exactly(log, length, start, path)
+            else:
+                raise ValueError("unknown record " + hex(tag) + " at byte " + str(start) + " of game log " + str(path))
+
+
+def replay(path, board_class=Board):
+    """
+    takes the path of a log and a board class, replays every game in it with move_piece and
+    reserved_move, and yields (game number, FocusGame, move, result) after each move, the game
+    numbers counting from 0. The same FocusGame object is updated move after move.
+    raises ValueError if a recorded move is not legal.
+    """
+    number = -1
+    game = None
+    names = None
+    for record in read_records(path):
+        if record[0] == "game":
+            number += 1
+            game = FocusGame(record[1], record[2], board_class)
+            names = (record[1][0], record[2][0])
+        elif record[0] == "snapshot":
+            number += 1
+            game = FocusGame.from_bytes(record[1], board_class)
+            names = (game.get_player_a().get_name(), game.get_player_b().get_name())
+        else:
+            if game is None:
+                raise ValueError("move recorded before any game in game log " + str(path))
+            move = record[2]
+            if move[0] == "move":
+                result = game.move_piece(names[record[1]], move[1], move[2], move[3])
+            else:
+                result = game.reserved_move(names[record[1]], move[1])
+            if not result:
+                raise ValueError("illegal move " + str(move) + " in game " + str(number) + " of game log " + str(path))
+            yield number, game, move, result
@@ -0,0 +1,157 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: An on-disk opening book of Focus (Domination) positions keyed by FocusGame.get_hash(),
+# read through mmap so every process shares one copy of the file through the page cache.
+
+import mmap
+import struct
+from FocusGame import FocusGame, encode_move, decode_move
+from GameRecord import read_records
+
+MAGIC = b"FGBOOK1\0"
+HEADER = struct.Struct("<8sQ")          # magic, number of records
+RECORD = struct.Struct("<QIIII")        # position hash, move code, visits, wins, total plies of the games
+
+
+class OpeningBookBuilder:
+    """
+    Collects move statistics from games and writes them as an opening book file:
+    a header followed by fixed-size records sorted by position hash and move,
+    so the book can be searched in place without reading it into memory.
+    """
+
+    def __init__(self):
+        """creates an empty builder"""
+        self._stats = {}        # (hash, move code) -> [visits, wins, total plies]
+
+    def add(self, key, move, won, plies):
+        """
+        takes a position hash, the move played from it, whether the player who made the move won
+        the game, and how many moves the game lasted, adds one game to the move's statistics.
+        """
+        stats = self._stats.setdefault((key, encode_move(move)), [0, 0, 0])
+        stats[0] += 1
+        stats[1] += 1 if won else 0
+        stats[2] += plies
+
+    def add_log(self, path, depth):
+        """
+        takes the path of a GameRecord log and a number of moves,
+        adds the first depth moves of every game in the log, with each game's result and length.
+        """
+        game = None
+        names = None
+        played = []
+        for record in read_records(path):
+            if record[0] == "move":
+                name = names[record[1]]
+                move = record[2]
+                key = game.get_hash() if len(played) < depth else None
+                if move[0] == "move":
+                    game.move_piece(name, move[1], move[2], move[3])
+                else:
+                    game.reserved_move(name, move[1])
+                played.append((key, name, move))
+                continue
+            if game is not None:
+                self.add_game(game, names, played)
+            if record[0] == "game":
+                game = FocusGame(record[1], record[2])
+            else:
+                game = FocusGame.from_bytes(record[1])
+            names = (game.get_player_a().get_name(), game.get_player_b().get_name())
+            played = []
+        if game is not None:
+            self.add_game(game, names, played)
+
+    def add_game(self, game, names, played):
+        """
+        takes a finished FocusGame, the names of its players and a list of (hash, mover, move) for the moves
+        played (hash None for moves past the book's depth), adds them to the statistics.
+        """
+        winner = None
+        for name in names:
+            if game.get_game_state() == name + " Wins":
+                winner = name
+        for key, name, move in played:
+            if key is not None:
+                self.add(key, move, name == winner, len(played))
+
+    def write(self, path):
+        """takes a path, writes the book there, its records sorted by hash and move"""
+        with open(path, "wb") as book:
+            book.write(HEADER.pack(MAGIC, len(self._stats)))
+            for key, code in sorted(self._stats):
+                visits, wins, plies = self._stats[(key, code)]
+                book.write(RECORD.pack(key, code, visits, wins, plies))
+
+
+class OpeningBook:
+    """
+    Reads an opening book written by OpeningBookBuilder through a read-only memory map.
+    A lookup is a binary search over the sorted records, reading only the records it touches,
+    so nothing is deserialized up front and processes opening the same file share its pages.
+    """
+
+    def __init__(self, path):
+        """takes the path of a book, maps it into memory"""
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError("not an opening book: " + str(path))
+
+    def __enter__(self):
+        """returns the book, so it can be used in a with statement"""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """closes the book at the end of a with statement"""
+        self.close()
+
+    def close(self):
+        """unmaps and closes the book"""
+        self._map.close()
+        self._file.close()
+
+    def get_count(self):
+        """returns the number of (position, move) records in the book"""
+        return self._count
+
+    def lookup(self, key):
+        """
+        takes a position hash, returns a list of (move, visits, wins, average plies) for every move
+        the book has from that position, or an empty list if the position is not in the book.
+        """
+        book = self._map
+        low = 0
+        high = self._count
+        while low < high:                               # finds the first record with the hash
+            middle = (low + high) // 2
+            if struct.unpack_from("<Q", book, HEADER.size + middle * RECORD.size)[0] < key:
+                low = middle + 1
+            else:
+                high = middle
+        moves = []
+        while low < self._count:
+            record_key, code, visits, wins, plies = RECORD.unpack_from(book, HEADER.size + low * RECORD.size)
+            if record_key != key:
+                break
+            moves.append((decode_move(code), visits, wins, plies / visits))
+            low += 1
+        return moves
+
+    def best_move(self, game, player_name, min_visits=1):
+        """
+        takes a FocusGame, the name of the player to move and the fewest games a move needs,
+        returns the legal book move with the most visits from the game's position, or None if there is none.
+        """
+        legal = set(game.legal_moves(player_name))
+        best = None
+        best_visits = min_visits - 1
+        for move, visits, wins, plies in self.lookup(game.get_hash()):
+            if visits > best_visits and move in legal:
+                best = move
+                best_visits = visits
+        return best
@@ -0,0 +1,125 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: Plays many complete Focus (Domination) games between configurable policies
+# in worker processes, streaming each game's result as it finishes.
+
+import argparse
+import json
+import random
+import sys
+from multiprocessing import Pool
+from FocusGame import Board, PackedBoard, FocusGame
+from FocusSearch import Engine, TranspositionTable
+
+POLICIES = ("random", "greedy", "engine")
+BOARDS = {"board": Board, "packed": PackedBoard}
+NAMES = ("A", "B")
+COLORS = ("R", "G")
+
+
+def choose_move(policy, game, player_name, rng, engine, depth):
+    """
+    takes a policy name, a FocusGame, the name of the player to move, a random.Random, an Engine and
+    the engine's search depth, returns the move the policy makes, or None if the player has no moves.
+    "random" picks any legal move, "greedy" the move with the best Engine.evaluate score after it
+    (ties broken at random), and "engine" the best move of an alpha-beta search to the given depth.
+    """
+    moves = list(game.legal_moves(player_name))
+    if not moves:
+        return None
+    if policy == "random":
+        return rng.choice(moves)
+    if policy == "greedy":
+        best = []
+        best_score = None
+        for move in moves:
+            if game.make_move(player_name, move) == player_name + " Wins":
+                game.unmake_move()
+                return move
+            score = engine.evaluate(game, player_name)
+            game.unmake_move()
+            if best_score is None or score > best_score:
+                best = [move]
+                best_score = score
+            elif score == best_score:
+                best.append(move)
+        return rng.choice(best)
+    return engine.search(game, player_name, max_depth=depth)[0]
+
+
+def play_game(settings):
+    """
+    takes a tuple (game number, policy of A, policy of B, seed, most moves, engine depth, board name),
+    plays one game with its own random.Random seeded from the seed and the game number, so every game
+    can be replayed on its own. Player A moves first in even games and player B in odd games.
+    returns a dictionary with the game number, the winner's name (None if the game reached the most
+    moves), the number of moves made, and each player's captured and reserve pieces.
+    """
+    number, policy_a, policy_b, seed, max_plies, depth, board = settings
+    rng = random.Random(seed * 1000003 + number)
+    game = FocusGame((NAMES[0], COLORS[0]), (NAMES[1], COLORS[1]), BOARDS[board])
+    engine = Engine(TranspositionTable(1024 * 1024))
+    policies = {NAMES[0]: policy_a, NAMES[1]: policy_b}
+    turn = number % 2
+    plies = 0
+    while plies < max_plies and game.get_game_state() == "PLAYING":
+        name = NAMES[turn]
+        move = choose_move(policies[name], game, name, rng, engine, depth)
+        if move is None:
+            break
+        if move[0] == "move":
+            game.move_piece(name, move[1], move[2], move[3])
+        else:
+            game.reserved_move(name, move[1])
+        plies += 1
+        turn = 1 - turn
+
+    winner = None
+    for name in NAMES:
+        if game.get_game_state() == name + " Wins":
+            winner = name
+    return {"game": number, "winner": winner, "plies": plies,
+            "captured": [game.show_captured(name) for name in NAMES],
+            "reserve": [game.show_reserve(name) for name in NAMES]}
+
+
+def run_selfplay(games, policy_a="random", policy_b="random", workers=1, seed=0, max_plies=1000,
+                 depth=2, board="board"):
+    """
+    takes the number of games, each player's policy, the number of worker processes, the seed,
+    the most moves per game, the engine's search depth and the board ("board" or "packed").
+    yields each game's result from play_game as soon as it finishes, in the order the games finish.
+    """
+    settings = [(number, policy_a, policy_b, seed, max_plies, depth, board) for number in range(0, games)]
+    if workers <= 1:
+        for setting in settings:
+            yield play_game(setting)
+        return
+    with Pool(workers) as pool:
+        for result in pool.imap_unordered(play_game, settings, chunksize=max(1, games // (workers * 8))):
+            yield result
+
+
+def main(argv=None):
+    """runs self-play from the command line, writing one JSON line per finished game and a summary"""
+    parser = argparse.ArgumentParser(description="Plays Focus games between two policies.")
+    parser.add_argument("--games", type=int, default=100)
+    parser.add_argument("--a", choices=POLICIES, default="random", help="policy of player A")
+    parser.add_argument("--b", choices=POLICIES, default="random", help="policy of player B")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-plies", type=int, default=1000)
+    parser.add_argument("--depth", type=int, default=2, help="search depth of the engine policy")
+    parser.add_argument("--board", choices=sorted(BOARDS), default="board")
+    args = parser.parse_args(argv)
+
+    wins = {NAMES[0]: 0, NAMES[1]: 0, None: 0}
+    for result in run_selfplay(args.games, args.a, args.b, args.workers, args.seed, args.max_plies,
+                               args.depth, args.board):
+        wins[result["winner"]] += 1
+        sys.stdout.write(json.dumps(result) + "\n")
+    sys.stdout.write(json.dumps({"A": wins[NAMES[0]], "B": wins[NAMES[1]], "unfinished": wins[None]}) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: unittests for BatchedFocus.py
+
+import random
+import unittest
+from FocusGame import FocusGame
+
+try:
+    import numpy as np
+    from BatchedFocus import BatchedFocus, STATUS_INVALID, STATUS_MOVED, STATUS_WON
+except ImportError:
+    np = None
+
+
+@unittest.skipIf(np is None, "BatchedFocus needs numpy")
+class BatchedFocusTests(unittest.TestCase):
+    """Includes unittests for BatchedFocus class"""
+
+    def assertSameGame(self, batch, index, game):
+        """checks that a game in the batch has the same pieces and counts as a FocusGame"""
+        colors = ["R", "G"]
+        for row in range(0, 6):
+            for column in range(0, 6):
+                height = batch.get_heights()[index, row, column]
+                pieces = [colors[piece] for piece in batch.get_pieces()[index, row, column, :height]]
+                self.assertEqual(game.show_pieces((row, column)), pieces)
+        self.assertEqual([game.show_reserve("Jim"), game.show_reserve("Gary")], list(batch.get_reserves()[index]))
+        self.assertEqual([game.show_captured("Jim"), game.show_captured("Gary")], list(batch.get_captured()[index]))
+
+    def test_batchStart(self):
+        """tests that every game in a new batch starts with the pieces of a new FocusGame"""
+        batch = BatchedFocus(3)
+
+        for index in range(0, 3):
+            self.assertSameGame(batch, index, FocusGame(("Jim", "R"), ("Gary", "G")))
+        self.assertFalse(batch.get_done().any())
+        self.assertEqual([-1, -1, -1], list(batch.get_winner()))
+
+    def test_batchInvalid(self):
+        """tests that moves breaking the rules of move_piece and reserved_move are not made"""
+        batch = BatchedFocus(6)
+
+        status = batch.step([0, 0, 0, 0, 0, 1],
+                            [(0, 2), (0, 0), (0, 0), (0, 0), (0, 0), (0, 2)],
+                            [(1, 2), (1, 1), (0, 2), (0, 0), (0, 1), (0, 3)],
+                            [1, 1, 1, 1, 0, 1])
+
+        self.assertEqual([STATUS_INVALID] * 5 + [STATUS_MOVED], list(status))
+        self.assertEqual(2, batch.get_heights()[5, 0, 3])
+        self.assertEqual(-1, batch.get_last()[0])
+        self.assertEqual(1, batch.get_last()[5])
+
+    def test_batchMatchesFocusGame(self):
+        """tests that random games stepped together end up the same as the same games played with FocusGame"""
+        rng = random.Random(3)
+        count = 8
+        batch = BatchedFocus(count)
+        games = [FocusGame(("Jim", "R"), ("Gary", "G")) for index in range(0, count)]
+        names = ["Jim", "Gary"]
+
+        for ply in range(0, 600):
+            players = [ply % 2] * count
+            src = [(0, 0)] * count
+            dst = [(0, 0)] * count
+            num_pieces = [1] * count
+            expected = [STATUS_INVALID] * count
+            for index in range(0, count):
+                moves = list(games[index].legal_moves(names[ply % 2]))
+                if not moves:
+                    continue
+                move = rng.choice(moves)
+                if move[0] == "move":
+                    src[index], dst[index], num_pieces[index] = move[1], move[2], move[3]
+                    result = games[index].move_piece(names[ply % 2], move[1], move[2], move[3])
+                else:
+                    dst[index], num_pieces[index] = move[1], 0
+                    result = games[index].reserved_move(names[ply % 2], move[1])
+                expected[index] = STATUS_MOVED if result == "successfully moved" else STATUS_WON
+
+            self.assertEqual(expected, list(batch.step(players, src, dst, num_pieces)))
+            for index in range(0, count):
+                if games[index].get_game_state() == "PLAYING":
+                    self.assertSameGame(batch, index, games[index])
+                else:
+                    self.assertEqual(names[batch.get_winner()[index]] + " Wins", games[index].get_game_state())
+        self.assertTrue(batch.get_done().any())
+
+    def test_batchSetGameComputeDone(self):
+        """tests that set_game copies a FocusGame and compute_done finds games a player has won"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+        for i in range(0, 6):
+            game.get_player_b().inc_captured()
+        batch = BatchedFocus(2)
+
+        batch.set_game(1, game)
+        done = batch.compute_done()
+
+        self.assertEqual([False, True], list(done))
+        self.assertEqual([-1, 1], list(batch.get_winner()))
+        self.assertSameGame(batch, 1, game)
+        batch.reset(np.array([False, True]))
+        self.assertFalse(batch.get_done().any())
@@ -0,0 +1,53 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: unittests for BenchFocusGame.py
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from BenchFocusGame import BENCHMARKS, run_benchmarks, compare, main
+
+
+class BenchFocusGameTests(unittest.TestCase):
+    """Includes unittests for running, saving and comparing the benchmarks"""
+
+    def test_runBenchmarks(self):
+        """tests that every benchmark runs on every backend and reports a rate"""
+        results = run_benchmarks(number=20, repeat=1)
+
+        self.assertEqual(len(BENCHMARKS) * 2, len(results))
+        self.assertEqual(20, results["overflow_capture/packed"]["operations"])
+        self.assertEqual(1, results["random_games/board"]["operations"])
+        for result in results.values():
+            self.assertGreater(result["ops_per_second"], 0)
+
+    def test_compare(self):
+        """tests that compare flags benchmarks slower than the tolerance and skips ones not in the baseline"""
+        baseline = {"a/board": {"ops_per_second": 100.0}, "b/board": {"ops_per_second": 100.0}}
+        results = {"a/board": {"ops_per_second": 95.0}, "b/board": {"ops_per_second": 50.0},
+                   "c/board": {"ops_per_second": 10.0}}
+
+        self.assertEqual([("a/board", 100.0, 95.0, 0.95, False), ("b/board", 100.0, 50.0, 0.5, True)],
+                         compare(results, baseline, 0.1))
+
+    def test_mainBaseline(self):
+        """tests that main saves JSON results that compare against themselves without a slowdown"""
+        with tempfile.TemporaryDirectory() as folder:
+            path = os.path.join(folder, "baseline.json")
+            with contextlib.redirect_stdout(io.StringIO()):
+                main(["--number", "10", "--repeat", "1", "--bench", "single_move", "--output", path])
+            with open(path) as saved:
+                results = json.load(saved)
+
+            self.assertEqual(["single_move/board", "single_move/packed"], sorted(results))
+            self.assertEqual([], [row for row in compare(results, results) if row[4]])
+
+    def test_storedBaseline(self):
+        """tests that the stored baseline has results for every benchmark on every backend"""
+        with open(os.path.join(os.path.dirname(os.path.abspath(__file__)), "bench_baseline.json")) as saved:
+            baseline = json.load(saved)
+
+        self.assertEqual(sorted(run_benchmarks(number=1, repeat=1)), sorted(baseline))
@@ -0,0 +1,87 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: unittests for FocusDashboard.py
+
+import io
+import unittest
+from FocusGame import Board, FocusGame, PackedBoard
+from FocusDashboard import CLEAR, BoardRenderer, Dashboard, move_to
+
+
+class FocusDashboardTests(unittest.TestCase):
+    """Includes unittests for the board renderer and dashboard"""
+
+    def test_frameRedrawsChanges(self):
+        """tests that the first frame draws every space and later frames only the changed spaces"""
+        for board_class in [Board, PackedBoard]:
+            game = FocusGame(("Jim", "R"), ("Gary", "G"), board_class)
+            renderer = BoardRenderer(game, 3, 5, "game 1")
+
+            first = renderer.frame()
+            self.assertEqual(36 + 2, first.count("\x1b["))
+            self.assertIn(move_to(4, 5) + "R", first)
+            self.assertIn(move_to(9, 15) + "G", first)
+
+            game.move_piece("Jim", (0, 1), (0, 2), 1)
+            second = renderer.frame()
+            self.assertEqual(2, second.count("\x1b["))
+            self.assertIn(move_to(4, 7) + " ", second)
+            self.assertIn(move_to(4, 9) + "R", second)
+            self.assertEqual("", renderer.frame())
+
+            game.get_player_b().inc_reserve()
+            self.assertEqual(move_to(10, 5) + "PLAYING R:0/0 G:0/1".ljust(20), renderer.frame())
+            self.assertEqual(36 + 2, renderer.frame(full=True).count("\x1b["))
+
+    def test_coloredBoardCached(self):
+        """
+        tests that the colored board is made of tuples, and that a move replaces the rows it changed
+        and keeps the others, leaving the board returned before it as it was.
+        """
+        for board_class in [Board, PackedBoard]:
+            game = FocusGame(("Jim", "R"), ("Gary", "G"), board_class)
+            colored = game.get_board().get_colored_board()
+            self.assertIs(colored, game.get_board().get_colored_board())
+
+            game.make_move("Jim", ("move", (0, 0), (0, 1), 1))
+            moved = game.get_board().get_colored_board()
+            self.assertEqual((" ", "R", "G", "G", "R", "R"), moved[0])
+            self.assertEqual(("R", "R", "G", "G", "R", "R"), colored[0])
+            self.assertIsInstance(moved, tuple)
+            for row in range(1, 6):
+                self.assertIs(colored[row], moved[row])
+            game.unmake_move()
+            self.assertEqual(colored, game.get_board().get_colored_board())
+
+    def test_coloredBoardAfterReset(self):
+        """tests that the colored board follows stacks changed without the board's move methods"""
+        for board_class in [Board, PackedBoard]:
+            board = board_class("R", "G")
+            colored = board.get_colored_board()
+            self.assertEqual(36, len(board.take_changed()))     # the first call turns the tracking on
+            cells = list(board.get_cells())
+            cells[0] = 1                                # (0, 0) empty
+
+            board.set_cells(cells)
+            board.reset_tracking()
+            self.assertEqual((" ", "R", "G", "G", "R", "R"), board.get_colored_board()[0])
+            self.assertEqual({(0, 0)}, board.take_changed())
+            self.assertIs(colored[1], board.get_colored_board()[1])
+
+            board.get_stack((0, 1)).add("G")
+            self.assertEqual({(0, 1)}, board.take_changed())
+            self.assertEqual(set(), board.take_changed())
+
+    def test_dashboard(self):
+        """tests that the dashboard clears the screen once and writes only changes after the first frame"""
+        games = [("game " + str(number), FocusGame(("Jim", "R"), ("Gary", "G"))) for number in range(0, 5)]
+        stream = io.StringIO()
+        dashboard = Dashboard(games, columns=2, stream=stream)
+
+        dashboard.draw()
+        games[4][1].move_piece("Gary", (0, 2), (0, 1), 1)
+        written = dashboard.draw()
+
+        self.assertTrue(stream.getvalue().startswith(CLEAR))
+        self.assertEqual(1, stream.getvalue().count(CLEAR))
+        self.assertEqual(len(move_to(20, 5) + " " + move_to(20, 3) + "G"), written)
@@ -2,8 +2,11 @@
 # Date: 11/17/2020
 # Description: unittests for FocusGame.py
 
+import pickle
+import random
 import unittest
-from FocusGame import Player, Stack, Board, FocusGame
+from FocusGame import Player, Stack, Board, PackedStack, PackedBoard, FocusGame, Rules, RULES, rules_for, \
+    encode_move, decode_move, STATUS_INVALID, STATUS_MOVED, STATUS_WON
 
 
 class PlayerTests(unittest.TestCase):
@@ -54,6 +57,13 @@ class PlayerTests(unittest.TestCase):
         self.assertEqual(1, reserve2)
         self.assertEqual(0, reserve3)
 
+    def test_playerSlots(self):
+        """tests that players keep their attributes in slots instead of an instance dictionary"""
+        p1 = Player(("Player_1", "R"))
+
+        self.assertFalse(hasattr(p1, "__dict__"))
+        self.assertRaises(AttributeError, setattr, p1, "_score", 0)
+
 
 class StackTests(unittest.TestCase):
     """Includes unittests for Stack class"""
@@ -206,6 +216,62 @@ class StackTests(unittest.TestCase):
         self.assertEqual("R", color2)
         self.assertEqual(2, height2)
 
+    def test_stackTransfer(self):
+        """
+        tests that transfer moves the top pieces of a stack onto another in order,
+        and returns the pieces trimmed from the bottom of a stack higher than the limit.
+        """
+        s1 = Stack("R")
+        s2 = Stack("G")
+        s1.add("G")
+        s1.add("R")
+        s2.add("R")
+        s2.add("G")
+
+        self.assertEqual([], s1.transfer(s2, 1, 5))
+        self.assertEqual(["R", "G"], s1.get_stack())
+        self.assertEqual("G", s1.get_color())
+        self.assertEqual(["G", "R", "G", "R"], s2.get_stack())
+        self.assertEqual("R", s2.get_color())
+        self.assertEqual(4, s2.get_height())
+
+        self.assertEqual(["G"], s1.transfer(s2, 2, 5))
+        self.assertEqual([], s1.get_stack())
+        self.assertIsNone(s1.get_color())
+        self.assertEqual(0, s1.get_height())
+        self.assertEqual(["R", "G", "R", "R", "G"], s2.get_stack())
+        self.assertEqual("G", s2.get_color())
+
+        s2.add("R")
+        s2.add("R")
+        self.assertEqual(["R", "G"], s2.trim(5))
+        self.assertEqual(["R", "R", "G", "R", "R"], s2.get_stack())
+        self.assertEqual(5, s2.get_height())
+        self.assertEqual([], s2.trim(5))
+
+    def test_stackSlots(self):
+        """tests that stacks keep their attributes in slots instead of an instance dictionary"""
+        s1 = Stack("R")
+
+        self.assertFalse(hasattr(s1, "__dict__"))
+        self.assertRaises(AttributeError, setattr, s1, "_pieces", [])
+
+    def test_stackPieces(self):
+        """
+        tests that a stack keeps its pieces in a tuple that get_stack copies into a list,
+        and that the stacks of a board built from cells share one tuple for the same pieces.
+        """
+        s1 = Stack("R")
+        s1.add("G")
+        stack1 = s1.get_stack()
+        stack1.append("R")
+
+        self.assertEqual(("R", "G"), s1.get_pieces())
+        self.assertEqual(["R", "G"], s1.get_stack())
+
+        board = Board("R", "G", None, [0b10] * 36)
+        self.assertIs(board.get_stack((0, 0)).get_pieces(), board.get_stack((5, 5)).get_pieces())
+
 
 class BoardTests(unittest.TestCase):
     """Includes unittests for Board class"""
@@ -336,6 +402,327 @@ class BoardTests(unittest.TestCase):
         self.assertEqual("G", stack5)
         self.assertEqual("G", stack6)
 
+    def test_boardControl(self):
+        """
+        tests that the board keeps the mask of the squares each color controls up to date
+        as pieces are added to and removed from its stacks.
+        """
+        for board in [Board("R", "G"), PackedBoard("R", "G")]:
+            self.assertEqual(18, board.count_controlled("R"))
+            self.assertEqual(18, board.count_controlled("G"))
+            self.assertIn((0, 0), board.get_owned("R"))
+
+            board.get_stack((0, 0)).add("G")
+            board.get_stack((0, 2)).off_top()
+            board.get_stack((0, 1)).add("R")
+
+            self.assertEqual(17, board.count_controlled("R"))
+            self.assertEqual(18, board.count_controlled("G"))
+            self.assertIn((0, 0), board.get_owned("G"))
+            self.assertNotIn((0, 2), board.get_owned("G"))
+
+            board.get_stack((0, 0)).off_top()
+
+            self.assertEqual(18, board.count_controlled("R"))
+            self.assertEqual(17, board.count_controlled("G"))
+
+            board.get_stack((0, 0)).off_bottom()
+
+            self.assertEqual(17, board.count_controlled("R"))
+            self.assertNotIn((0, 0), board.get_owned("R"))
+            self.assertEqual(0, board.count_controlled("B"))
+            self.assertEqual(0, board.get_owned_mask("B"))
+            self.assertEqual(0b110010, board.get_owned_mask("R") & 0b111111)      # (0, 1), (0, 4) and (0, 5)
+            self.assertEqual(board.get_owned("R"), {RULES.get_squares()[index] for index in range(0, 36)
+                                                    if board.get_owned_mask("R") >> index & 1})
+
+    def test_startTracking(self):
+        """tests that a new board's tracking, taken from its Rules, is what rebuilding it from the stacks gives"""
+        for board in [Board("R", "G"), PackedBoard("R", "G"), Board("R", "G", rules_for(8)),
+                      PackedBoard("R", "G", rules_for(7))]:
+            tracked = (board.get_hash(), list(board.get_features()), set(board.get_owned("R")),
+                       set(board.get_owned("G")), board.get_colored_board())
+            board.reset_tracking()
+            self.assertEqual((board.get_hash(), list(board.get_features()), set(board.get_owned("R")),
+                              set(board.get_owned("G")), board.get_colored_board()), tracked)
+            self.assertNotEqual(0, tracked[0])
+
+    def test_staleSquares(self):
+        """tests that changed stacks are marked in a mask and only brought into the hash when it is asked for"""
+        for board in [Board("R", "G"), PackedBoard("R", "G")]:
+            start = board.get_hash()
+            board.add((0, 0), "G")
+            board.transfer((1, 5), (1, 4), 1, 5)
+
+            self.assertEqual((1 << 0) | (1 << 10) | (1 << 11), board._stale)
+            self.assertNotEqual(start, board.get_hash())
+            self.assertEqual(0, board._stale)
+            board.reset_tracking()
+            self.assertEqual((1 << 36) - 1, board._stale)
+            self.assertEqual(board.get_hash(), Board("R", "G", cells=board.get_cells()).get_hash())
+
+    def test_sharedCoords(self):
+        """tests that every board uses the coordinate tuples of its Rules instead of building its own"""
+        coords = RULES.get_coords()
+        for board in [Board("R", "G"), Board("B", "W"), PackedBoard("R", "G")]:
+            for row in range(0, 6):
+                for column in range(0, 6):
+                    self.assertIs(coords[row][column], board.get_stack((row, column))._coord)
+            for coord in board.get_owned(board.get_colors()[0]):
+                self.assertIs(coords[coord[0]][coord[1]], coord)
+
+
+class PackedBoardTests(unittest.TestCase):
+    """Includes unittests for PackedBoard and PackedStack classes"""
+
+    def test_packedBoardStart(self):
+        """tests that a packed board starts with the same pieces as a Board"""
+        board = Board("R", "G")
+        packed = PackedBoard("R", "G")
+
+        self.assertEqual(board.get_colored_board(), packed.get_colored_board())
+        for row in range(0, 6):
+            for column in range(0, 6):
+                self.assertEqual(board.get_stack((row, column)).get_stack(),
+                                 packed.get_stack((row, column)).get_stack())
+        self.assertEqual(36, len(packed.get_cells()))
+
+    def test_packedPiecesWithoutViews(self):
+        """tests that show_pieces and get_pieces decode one cell of a packed board without making its views"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"), PackedBoard)
+        game.move_piece("Jim", (0, 0), (0, 1), 1)
+        packed = game.get_board()
+
+        self.assertEqual(["R", "R"], game.show_pieces((0, 1)))
+        self.assertEqual((), packed.get_pieces((0, 0)))
+        self.assertIsNone(packed._board)
+        self.assertEqual(["R", "R"], packed.get_stack((0, 1)).get_stack())
+
+    def test_packedStackAddOff(self):
+        """tests that add, off_top and off_bottom change a packed stack the same way as a Stack"""
+        packed = PackedBoard("R", "G")
+        stack = packed.get_stack((0, 0))
+        self.assertIsInstance(stack, PackedStack)
+
+        stack.add("G")
+        stack.add("G")
+        stack.add("R")
+
+        self.assertEqual(["R", "G", "G", "R"], stack.get_stack())
+        self.assertEqual("R", stack.get_color())
+        self.assertEqual(4, stack.get_height())
+
+        stack.off_bottom()
+        stack.off_top()
+
+        self.assertEqual(["G", "G"], stack.get_stack())
+        self.assertEqual("G", stack.get_color())
+        self.assertEqual(2, stack.get_height())
+
+        stack.off_top()
+        stack.off_top()
+
+        self.assertFalse(stack.get_stack())
+        self.assertIsNone(stack.get_color())
+        self.assertEqual(0, stack.get_height())
+
+    def test_packedStackTransfer(self):
+        """
+        tests that transfer and trim change packed stacks the same way as Stacks, and keep the board's
+        controlled spaces and hash the same as rebuilding them from the board.
+        """
+        boards = [Board("R", "G"), PackedBoard("R", "G")]
+        results = []
+        for board in boards:
+            for color in ["G", "R", "G"]:
+                board.get_stack((0, 0)).add(color)          # sets (0, 0) to RGRG
+                board.get_stack((0, 3)).add("R")            # sets (0, 3) to GRRR
+            trimmed = [board.get_stack((0, 0)).transfer(board.get_stack((0, 3)), 3, 5),
+                       board.get_stack((0, 3)).transfer(board.get_stack((0, 1)), 1, 5),
+                       board.get_stack((0, 3)).trim(3),
+                       board.get_stack((0, 0)).transfer(board.get_stack((0, 2)), 1, 1)]
+            owned = (set(board.get_owned("R")), set(board.get_owned("G")))
+            key = board.get_hash()
+            board.reset_tracking()
+            self.assertEqual((set(board.get_owned("R")), set(board.get_owned("G"))), owned)
+            self.assertEqual(board.get_hash(), key)
+            results.append((trimmed, board.get_colored_board(),
+                            [board.get_stack(coord).get_stack() for coord in [(0, 0), (0, 1), (0, 2), (0, 3)]]))
+
+        self.assertEqual([["G", "R"], [], ["R"], ["G"]], results[0][0])
+        self.assertEqual([[], ["R", "G"], ["R"], ["R", "G", "R"]], results[0][2])
+        self.assertEqual(results[0], results[1])
+
+    def test_boardMoves(self):
+        """
+        tests that the board's own add, transfer and trim change a PackedBoard the same way as a Board,
+        and that the PackedStack views are only made when they are asked for.
+        """
+        boards = [Board("R", "G"), PackedBoard("R", "G")]
+        results = []
+        for board in boards:
+            board.add((0, 0), "G")                          # sets (0, 0) to RG
+            board.add((0, 3), "R")                          # sets (0, 3) to GR
+            trimmed = [board.transfer((0, 0), (0, 3), 2, 3), board.trim((0, 3), 2)]
+            results.append((trimmed, board.get_height((0, 3)), board.get_color((0, 3)), board.get_color((0, 0)),
+                            board.get_colored_board(), board.get_hash()))
+
+        self.assertEqual([["G"], ["R"]], results[0][0])
+        self.assertEqual((2, "G", None), results[0][1:4])
+        self.assertEqual(results[0], results[1])
+        self.assertIsNone(boards[1]._board)
+        self.assertEqual(["R", "G"], boards[1].get_stack((0, 3)).get_stack())
+
+    def test_packedGameMatchesBoard(self):
+        """tests that FocusGame plays the same game on a PackedBoard as on a Board"""
+        games = [FocusGame(("Jim", "R"), ("Gary", "G")),
+                 FocusGame(("Jim", "R"), ("Gary", "G"), PackedBoard)]
+
+        for game in games:
+            for color in ["R", "G", "R", "G"]:
+                game.get_board().get_stack((0, 0)).add("R")     # sets (0, 0) to RRRRR
+                game.get_board().get_stack((0, 3)).add(color)   # sets (0, 3) to GRGRG
+            results = [game.move_piece("Jim", (0, 0), (0, 3), 3),
+                       game.move_piece("Gary", (1, 0), (1, 1), 1),
+                       game.reserved_move("Jim", (1, 1)),
+                       game.move_piece("Gary", (1, 4), (1, 3), 1)]
+            self.assertEqual(["successfully moved"] * 4, results)
+
+        self.assertEqual(games[0].get_board().get_colored_board(), games[1].get_board().get_colored_board())
+        for row in range(0, 6):
+            for column in range(0, 6):
+                self.assertEqual(games[0].show_pieces((row, column)), games[1].show_pieces((row, column)))
+        self.assertEqual(games[0].show_captured("Jim"), games[1].show_captured("Jim"))
+        self.assertEqual(games[0].show_reserve("Jim"), games[1].show_reserve("Jim"))
+
+
+class RulesTests(unittest.TestCase):
+    """Includes unittests for games with other board sizes, stack heights and winning captures"""
+
+    def test_rulesFor(self):
+        """tests that each configuration is built once and that impossible ones are refused"""
+        self.assertIs(RULES, rules_for())
+        self.assertIs(rules_for(8, 5, 6), rules_for(8, 5, 6))
+        self.assertEqual(64, len(rules_for(8, 5, 6).get_spaces()))
+        self.assertEqual([(0, 3), (3, 0)], sorted(rules_for(8, 5, 6).get_reach()[(0, 0)][3]))
+        self.assertRaises(ValueError, Rules, 65)
+        self.assertRaises(ValueError, Rules, 6, 15)
+        self.assertRaises(ValueError, Rules, 6, 5, 0)
+
+    def test_countKeys(self):
+        """tests that every reserve and captured count a board can reach has its own hash key"""
+        rules = rules_for(10, 5, 80)
+        self.assertEqual(101, len(rules.get_count_keys()[0]))
+
+        game = FocusGame(("Jim", "R"), ("Gary", "G"), Board, rules)
+        hashes = set()
+        for count in [0, 64, 100]:
+            game.get_player_a().set_reserve(count)
+            hashes.add(game.get_hash())
+        self.assertEqual(3, len(hashes))
+
+    def test_largeBoard(self):
+        """tests that an 8x8 board continues the starting pattern and that moves reach its far side"""
+        for board_class in [Board, PackedBoard]:
+            game = FocusGame(("Jim", "R"), ("Gary", "G"), board_class, rules_for(8))
+
+            self.assertEqual(("R", "R", "G", "G", "R", "R", "G", "G"), game.get_board().get_colored_board()[0])
+            self.assertEqual(("G", "G", "R", "R", "G", "G", "R", "R"), game.get_board().get_colored_board()[7])
+            self.assertEqual(32, game.get_board().count_controlled("R"))
+            self.assertEqual(sorted(brute_force_moves(game, "Jim")), sorted(game.legal_moves("Jim")))
+            self.assertEqual("successfully moved", game.move_piece("Jim", (7, 6), (7, 7), 1))
+            self.assertEqual(["R", "R"], game.show_pieces((7, 7)))
+            self.assertFalse(game.move_piece("Gary", (7, 5), (8, 5), 1))
+
+    def test_heightAndCaptures(self):
+        """tests that stacks are trimmed to the rules' height and the rules' captures win"""
+        for board_class in [Board, PackedBoard]:
+            game = FocusGame(("Jim", "R"), ("Gary", "G"), board_class, rules_for(6, 3, 2))
+            game.get_board().get_stack((0, 0)).add("R")         # sets (0, 0) to RR
+            game.get_board().get_stack((0, 2)).add("G")         # sets (0, 2) to GG
+
+            self.assertEqual("successfully moved", game.move_piece("Jim", (0, 0), (0, 2), 2))
+            self.assertEqual(["G", "R", "R"], game.show_pieces((0, 2)))
+            self.assertEqual(1, game.show_captured("Jim"))
+            game.get_board().get_stack((1, 2)).add("G")         # sets (1, 2) to RG
+            self.assertEqual("successfully moved", game.move_piece("Gary", (1, 2), (0, 2), 1))
+            self.assertEqual(["R", "R", "G"], game.show_pieces((0, 2)))
+            self.assertEqual("successfully moved", game.move_piece("Jim", (1, 3), (0, 3), 1))
+            game.get_board().get_stack((0, 4)).add("R")
+            game.get_board().get_stack((0, 4)).add("R")         # sets (0, 4) to RRR
+            self.assertEqual("Gary Wins", game.move_piece("Gary", (0, 2), (0, 4), 2))
+            self.assertEqual(2, game.show_captured("Gary"))
+            self.assertEqual(["R", "R", "R", "G"], game.show_pieces((0, 4)))     # the winning capture stays
+
+    def test_rulesBytesRoundTrip(self):
+        """tests that snapshots keep the rules of the game"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"), PackedBoard, rules_for(8, 4, 9))
+        game.move_piece("Jim", (7, 6), (7, 7), 1)
+
+        copy = FocusGame.from_bytes(game.to_bytes())
+
+        self.assertIs(game.get_rules(), copy.get_rules())
+        self.assertIsInstance(copy.get_board(), PackedBoard)
+        self.assertEqual(game.get_hash(), copy.get_hash())
+        self.assertEqual(game.get_board().get_colored_board(), copy.get_board().get_colored_board())
+
+    def test_tallestRules(self):
+        """tests that a reserve piece can be placed on a full stack of the tallest rules and wide captures are kept"""
+        for board_class in [Board, PackedBoard]:
+            game = FocusGame(("Jim", "R"), ("Gary", "G"), board_class, rules_for(6, 14, 300))
+            for count in range(0, 13):
+                game.get_board().get_stack((0, 2)).add("G")     # sets (0, 2) to fourteen G
+            game.get_player_a().inc_reserve()
+
+            self.assertEqual("successfully moved", game.reserved_move("Jim", (0, 2)))
+            self.assertEqual(13 * ["G"] + ["R"], game.show_pieces((0, 2)))
+            self.assertEqual(1, game.show_captured("Jim"))
+            copy = FocusGame.from_bytes(game.to_bytes())
+            self.assertEqual(300, copy.get_rules().get_win_captures())
+            self.assertEqual(game.get_hash(), copy.get_hash())
+
+
+def brute_force_moves(game, player_name):
+    """returns the set of moves accepted by verify_move/verify_stack_move and reserved_move for a player"""
+    player = game.get_player_from_name(player_name)
+    spaces = [coord for row in game.get_rules().get_coords() for coord in row]
+    moves = set()
+    for src in spaces:
+        if not game.verify_move(player, src):
+            continue
+        if player.get_reserve() > 0:
+            moves.add(("reserve", src))
+        for dst in spaces:
+            for num_pieces in range(1, 8):
+                if game.verify_stack_move(player, src, dst, num_pieces):
+                    moves.add(("move", src, dst, num_pieces))
+    return moves
+
+
+def game_position(game):
+    """returns a tuple of everything that describes a game's position, for comparing two positions"""
+    board = game.get_board()
+    stacks = tuple(tuple(board.get_stack((row, column)).get_stack()) for row in range(0, 6) for column in range(0, 6))
+    players = [game.get_player_a(), game.get_player_b()]
+    counts = tuple((player.get_reserve(), player.get_captured()) for player in players)
+    owned = tuple(tuple(sorted(board.get_owned(player.get_color()))) for player in players)
+    return stacks, counts, owned, game.get_last_player(), game.get_game_state()
+
+
+def play_random(game, plies, seed):
+    """makes up to plies random legal moves with make_move, returns the names of the players who moved"""
+    rng = random.Random(seed)
+    names = ["Jim", "Gary"]
+    movers = []
+    for ply in range(0, plies):
+        name = names[ply % 2]
+        moves = list(game.legal_moves(name))
+        if not moves:
+            break
+        game.make_move(name, rng.choice(moves))
+        movers.append(name)
+    return movers
+
 
 class FocusGameTests(unittest.TestCase):
     """Includes unittests for FocusGame class"""
@@ -362,12 +749,12 @@ class FocusGameTests(unittest.TestCase):
         self.assertEqual("G", colorb)
         self.assertIsNone(last_player)
         self.assertEqual(
-            [["R", "R", "G", "G", "R", "R"],
-             ["G", "G", "R", "R", "G", "G"],
-             ["R", "R", "G", "G", "R", "R"],
-             ["G", "G", "R", "R", "G", "G"],
-             ["R", "R", "G", "G", "R", "R"],
-             ["G", "G", "R", "R", "G", "G"]], board
+            (("R", "R", "G", "G", "R", "R"),
+             ("G", "G", "R", "R", "G", "G"),
+             ("R", "R", "G", "G", "R", "R"),
+             ("G", "G", "R", "R", "G", "G"),
+             ("R", "R", "G", "G", "R", "R"),
+             ("G", "G", "R", "R", "G", "G")), board
         )
 
     def test_get_other_player(self):
@@ -872,6 +1259,18 @@ class FocusGameTests(unittest.TestCase):
         self.assertEqual("successfully moved", result)
         self.assertEqual(game.get_last_player(), playerb)
 
+    def test_move_piece_lists(self):
+        """tests that move_piece and reserved_move take coordinates as lists as well as tuples, on both boards"""
+        for board_class in [Board, PackedBoard]:
+            game = FocusGame(("Jim", "R"), ("Gary", "G"), board_class)
+            game.get_player_b().inc_reserve()
+
+            self.assertEqual("successfully moved", game.move_piece("Jim", [0, 0], [0, 1], 1))
+            self.assertFalse(game.move_piece("Gary", [1, 0], [6, 0], 1))
+            self.assertEqual("successfully moved", game.reserved_move("Gary", [0, 1]))
+            self.assertEqual(["R", "R", "G"], game.show_pieces((0, 1)))
+            self.assertEqual(game.get_hash(), FocusGame.from_bytes(game.to_bytes()).get_hash())
+
     def test_move_piece_alt_turns(self):
         """Tests that players can alternate turns using move_piece method"""
         game = FocusGame(("Jim", "R"), ("Gary", "G"))
@@ -1441,6 +1840,39 @@ class FocusGameTests(unittest.TestCase):
         self.assertEqual("Gary Wins", result)
         self.assertEqual("Gary Wins", game.get_game_state())
 
+    def test_winning_overkill_pieces(self):
+        """
+        tests that a winning move counts the captures only up to the winning one and, like the original
+        move_piece, leaves the winning piece and the pieces above it under the stack.
+        a stack that would then hold more pieces than a packed cell raises ValueError.
+        """
+        for board_class in [Board, PackedBoard]:
+            game = FocusGame(("Jim", "R"), ("Gary", "G"), board_class)
+
+            board = game.get_board()
+
+            for i in range(0, 5):
+                game.get_player_a().inc_captured()      # sets playera to 5 captured
+
+            for color in ["R", "G", "G", "G"]:
+                board.get_stack((0, 3)).add(color)      # sets (0, 3) to GRGGG
+                board.get_stack((0, 0)).add("R")        # sets (0, 0) to RRRRR
+
+            self.assertEqual("Jim Wins", game.move_piece("Jim", (0, 0), (0, 3), 3))
+
+            self.assertEqual(["G", "R", "G", "G", "G", "R", "R", "R"], game.show_pieces((0, 3)))
+            self.assertEqual(6, game.show_captured("Jim"))
+            self.assertEqual(0, game.show_reserve("Jim"))           # the R above the winning G is not kept
+            self.assertEqual(["R", "R"], game.show_pieces((0, 0)))
+            self.assertEqual(game.get_hash(), FocusGame.from_bytes(game.to_bytes()).get_hash())
+
+            game = FocusGame(("Jim", "R"), ("Gary", "G"), board_class, rules_for(16, 14, 1))
+            board = game.get_board()
+            for i in range(0, 13):
+                board.get_stack((0, 0)).add("R")
+                board.get_stack((0, 14)).add("G")
+            self.assertRaises(ValueError, game.move_piece, "Jim", (0, 0), (0, 14), 14)
+
     def test_moveFail_gameOver(self):
         """
         test that move_piece method returns False if game is over.
@@ -1795,3 +2227,327 @@ class FocusGameTests(unittest.TestCase):
 
         result = game.show_captured("Gary")
         self.assertEqual(3, result)
+
+    def test_legal_moves_start(self):
+        """tests that legal_moves yields every single move from the starting board, for either player"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+
+        moves = list(game.legal_moves("Jim"))
+
+        self.assertEqual(len(moves), len(set(moves)))
+        self.assertEqual(brute_force_moves(game, "Jim"), set(moves))
+        self.assertIn(("move", (0, 0), (1, 0), 1), moves)
+        self.assertNotIn(("move", (0, 2), (1, 2), 1), moves)
+        self.assertEqual(brute_force_moves(game, "Gary"), set(game.legal_moves("Gary")))
+
+    def test_legal_moves_stacks_reserve(self):
+        """tests that legal_moves includes multiple moves and reserve moves, matching the verify methods"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+
+        for i in range(0, 4):
+            game.get_board().get_stack((2, 2)).add("R")
+        game.get_board().get_stack((3, 3)).add("G")
+        game.get_player_a().inc_reserve()
+
+        moves = set(game.legal_moves("Jim"))
+
+        self.assertEqual(brute_force_moves(game, "Jim"), moves)
+        self.assertIn(("move", (2, 2), (2, 5), 3), moves)
+        self.assertIn(("reserve", (3, 3)), moves)
+        self.assertEqual(brute_force_moves(game, "Gary"), set(game.legal_moves("Gary")))
+
+    def test_legal_moves_turn_and_game_over(self):
+        """tests that legal_moves yields nothing when it is not the player's turn or the game is over"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+
+        game.move_piece("Jim", (0, 0), (0, 1), 1)
+
+        self.assertEqual([], list(game.legal_moves("Jim")))
+        self.assertTrue(list(game.legal_moves("Gary")))
+
+        game.set_game_state("Jim Wins")
+
+        self.assertEqual([], list(game.legal_moves("Gary")))
+
+    def test_make_unmake_move(self):
+        """tests that unmake_move takes back single, multiple and reserve moves made with make_move"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+
+        for i in range(0, 4):
+            game.get_board().get_stack((0, 0)).add("R")
+            game.get_board().get_stack((0, 3)).add("G")
+        game.get_player_b().inc_reserve()
+        start = game_position(game)
+
+        self.assertEqual("successfully moved", game.make_move("Jim", ("move", (0, 0), (0, 3), 3)))
+        after_capture = game_position(game)
+        self.assertEqual(3, game.show_captured("Jim"))
+        self.assertEqual("successfully moved", game.make_move("Gary", ("reserve", (0, 3))))
+        self.assertFalse(game.make_move("Gary", ("move", (1, 0), (1, 1), 1)))
+        self.assertEqual(2, len(game.get_history()))
+
+        self.assertEqual(("reserve", (0, 3)), game.unmake_move())
+        self.assertEqual(after_capture, game_position(game))
+        self.assertEqual(("move", (0, 0), (0, 3), 3), game.unmake_move())
+        self.assertEqual(start, game_position(game))
+        self.assertIsNone(game.unmake_move())
+
+    def test_make_move_off_board(self):
+        """tests that make_move refuses moves to or from spaces off the board without recording them"""
+        for board_class in [Board, PackedBoard]:
+            game = FocusGame(("Jim", "R"), ("Gary", "G"), board_class)
+            start = game_position(game)
+
+            self.assertFalse(game.make_move("Jim", ("move", (0, 0), (6, 0), 1)))
+            self.assertFalse(game.make_move("Jim", ("move", (-1, 0), (0, 0), 1)))
+            self.assertFalse(game.make_move("Jim", ("reserve", (0, 6))))
+
+            self.assertEqual([], game.get_history())
+            self.assertEqual(start, game_position(game))
+
+    def test_make_unmake_random_games(self):
+        """tests that unmaking every move of random games restores the starting position on both boards"""
+        for board_class in [Board, PackedBoard]:
+            for seed in range(0, 5):
+                game = FocusGame(("Jim", "R"), ("Gary", "G"), board_class)
+                start = game_position(game)
+
+                movers = play_random(game, 1000, seed)
+
+                self.assertEqual(len(movers), len(game.get_history()))
+                while game.unmake_move() is not None:
+                    pass
+                self.assertEqual(start, game_position(game))
+
+    def test_hash_incremental(self):
+        """tests that the hash kept up to date during random games matches one rebuilt from the board"""
+        for board_class in [Board, PackedBoard]:
+            game = FocusGame(("Jim", "R"), ("Gary", "G"), board_class)
+            rng = random.Random(7)
+            names = ["Jim", "Gary"]
+            for ply in range(0, 200):
+                moves = list(game.legal_moves(names[ply % 2]))
+                if not moves:
+                    break
+                game.make_move(names[ply % 2], rng.choice(moves))
+                incremental = game.get_hash()
+                game.get_board().reset_tracking()
+                self.assertEqual(incremental, game.get_hash())
+
+    def test_hash_positions(self):
+        """
+        tests that the hash is the same for the same position reached in different orders or on either board,
+        and differs when the pieces, the last player or the reserve counts differ.
+        """
+        game1 = FocusGame(("Jim", "R"), ("Gary", "G"))
+        game2 = FocusGame(("Jim", "R"), ("Gary", "G"), PackedBoard)
+        start = game1.get_hash()
+        self.assertEqual(start, game2.get_hash())
+
+        game1.make_move("Jim", ("move", (0, 0), (0, 1), 1))
+        game1.make_move("Gary", ("move", (5, 5), (5, 4), 1))
+        game1.make_move("Jim", ("move", (2, 0), (2, 1), 1))
+        game2.make_move("Jim", ("move", (2, 0), (2, 1), 1))
+        game2.make_move("Gary", ("move", (5, 5), (5, 4), 1))
+        game2.make_move("Jim", ("move", (0, 0), (0, 1), 1))
+        self.assertEqual(game1.get_hash(), game2.get_hash())
+
+        game2.set_last_player(game2.get_player_b())
+        self.assertNotEqual(game1.get_hash(), game2.get_hash())
+        game2.set_last_player(game2.get_player_a())
+        game2.get_player_a().inc_reserve()
+        self.assertNotEqual(game1.get_hash(), game2.get_hash())
+
+        game1.unmake_move()
+        game1.unmake_move()
+        game1.unmake_move()
+        self.assertEqual(start, game1.get_hash())
+
+    def test_bytes_round_trip(self):
+        """tests that from_bytes restores the position saved by to_bytes on either board"""
+        for board_class in [Board, PackedBoard]:
+            game = FocusGame(("Jim", "R"), ("Gary", "G"), board_class)
+            play_random(game, 60, 2)
+            game.get_player_b().inc_reserve()
+
+            data = game.to_bytes()
+            restored = FocusGame.from_bytes(data)
+
+            self.assertLess(len(data), 64)
+            self.assertIsInstance(restored.get_board(), board_class)
+            self.assertEqual(game_position(game)[:3], game_position(restored)[:3])
+            self.assertEqual(game.get_game_state(), restored.get_game_state())
+            self.assertEqual("Gary", restored.get_last_player().get_name())
+            self.assertEqual(game.get_hash(), restored.get_hash())
+            self.assertEqual(game.get_hash(), FocusGame.from_bytes(data, PackedBoard).get_hash())
+
+    def test_bytes_tall_stacks_and_states(self):
+        """tests that snapshots keep stacks higher than seven pieces and every kind of game state"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+        for i in range(0, 8):
+            game.get_board().get_stack((2, 2)).add("G")
+        game.set_game_state("Gary Wins")
+
+        restored = FocusGame.from_bytes(game.to_bytes())
+
+        self.assertEqual(game.show_pieces((2, 2)), restored.show_pieces((2, 2)))
+        self.assertEqual("Gary Wins", restored.get_game_state())
+        self.assertIsNone(restored.get_last_player())
+
+        game.set_game_state("PAUSED")
+        self.assertEqual("PAUSED", FocusGame.from_bytes(game.to_bytes()).get_game_state())
+        self.assertRaises(ValueError, FocusGame.from_bytes, b"XX" + game.to_bytes()[2:])
+
+    def test_bytes_large_counts(self):
+        """tests that snapshots keep reserve and captured counts over 255 and build the board's tracking once"""
+        for board_class in [Board, PackedBoard]:
+            game = FocusGame(("Jim", "R"), ("Gary", "G"), board_class, rules_for(32, 5, 600))
+            game.get_player_a().set_reserve(300)
+            game.get_player_b().set_captured(513)
+            game.move_piece("Jim", (0, 0), (0, 1), 1)
+
+            restored = FocusGame.from_bytes(game.to_bytes())
+
+            self.assertEqual(300, restored.show_reserve("Jim"))
+            self.assertEqual(513, restored.show_captured("Gary"))
+            self.assertEqual(game.get_hash(), restored.get_hash())
+            self.assertEqual(game.get_board().get_colored_board(), restored.get_board().get_colored_board())
+            self.assertEqual(game.get_board().count_controlled("R"), restored.get_board().count_controlled("R"))
+
+    def test_bytes_corrupt(self):
+        """tests that truncated, padded or corrupt snapshots and text too long for one raise ValueError"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"), Board, rules_for(8, 4, 9))
+        game.set_game_state("PAUSED")
+        data = game.to_bytes()
+
+        for length in range(0, len(data)):
+            self.assertRaises(ValueError, FocusGame.from_bytes, data[:length])
+        self.assertRaises(ValueError, FocusGame.from_bytes, data + b"\x02")
+        self.assertRaises(ValueError, FocusGame.from_bytes, data[:-1] + b"\x00")
+
+        self.assertRaises(ValueError, FocusGame(("J" * 256, "R"), ("Gary", "G")).to_bytes)
+        self.assertRaises(ValueError, FocusGame(("Jim", "R"), ("Gary", "G" * 256)).to_bytes)
+        game.set_game_state("P" * 256)
+        self.assertRaises(ValueError, game.to_bytes)
+        self.assertEqual("J" * 255, FocusGame.from_bytes(FocusGame(("J" * 255, "R"), ("G", "G")).to_bytes())
+                         .get_player_a().get_name())
+
+    def test_pickle(self):
+        """tests that a pickled game is its to_bytes snapshot and unpickles to the same position"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"), PackedBoard)
+        game.move_piece("Jim", (0, 0), (0, 1), 1)
+
+        restored = pickle.loads(pickle.dumps(game))
+
+        self.assertEqual(game.get_hash(), restored.get_hash())
+        self.assertEqual(["R", "R"], restored.show_pieces((0, 1)))
+        self.assertFalse(restored.move_piece("Jim", (0, 1), (0, 3), 2))
+        self.assertEqual("successfully moved", restored.move_piece("Gary", (0, 2), (0, 1), 1))
+
+    def test_encode_move(self):
+        """tests that every legal move is packed into a different integer and unpacked to the same move"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+        for i in range(0, 4):
+            game.get_board().get_stack((2, 2)).add("R")
+        game.get_player_a().inc_reserve()
+        moves = list(game.legal_moves("Jim"))
+
+        codes = [encode_move(move) for move in moves]
+
+        self.assertEqual(len(moves), len(set(codes)))
+        self.assertEqual(moves, [decode_move(code) for code in codes])
+
+    def test_play(self):
+        """tests that play makes moves from player indexes and move codes and returns status codes"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"), PackedBoard)
+        for i in range(0, 3):
+            game.get_player_a().inc_captured()
+        for color in ["R", "G", "R", "G"]:
+            game.get_board().get_stack((0, 0)).add("R")     # sets (0, 0) to RRRRR
+            game.get_board().get_stack((0, 3)).add(color)   # sets (0, 3) to GRGRG
+            game.get_board().get_stack((2, 2)).add("G")     # sets (2, 2) to GGGGG
+        game.get_player_a().inc_reserve()
+
+        self.assertEqual(STATUS_MOVED, game.play(0, encode_move(("move", (0, 0), (0, 3), 3))))
+        self.assertEqual(5, game.show_captured("Jim"))
+        self.assertEqual(2, game.show_reserve("Jim"))
+        self.assertEqual(STATUS_INVALID, game.play(0, encode_move(("reserve", (1, 1)))))     # not Jim's turn
+        self.assertEqual(STATUS_INVALID, game.play(1, encode_move(("move", (1, 0), (1, 2), 1))))
+        self.assertEqual(STATUS_INVALID, game.play(1, encode_move(("move", (1, 0), (1, 6), 1))))
+        self.assertEqual(STATUS_INVALID, game.play(1, encode_move(("move", (6, 0), (5, 0), 1))))
+        self.assertEqual(STATUS_INVALID, game.play(1, encode_move(("reserve", (1, 1)))))     # Gary has no reserve
+        self.assertEqual(STATUS_MOVED, game.play(1, encode_move(("move", (1, 0), (1, 1), 1))))
+        self.assertEqual(STATUS_WON, game.play(0, encode_move(("reserve", (2, 2)))))
+        self.assertEqual(6, game.show_captured("Jim"))
+        self.assertEqual("Jim Wins", game.get_game_state())
+
+    def test_play_matches_string_api(self):
+        """tests that play and move_piece/reserved_move play a random game the same way"""
+        games = [FocusGame(("Jim", "R"), ("Gary", "G")), FocusGame(("Jim", "R"), ("Gary", "G"))]
+        results = {STATUS_MOVED: "successfully moved", STATUS_WON: "Jim Wins"}
+        rng = random.Random(5)
+        ply = 0
+        while games[0].get_game_state() == "PLAYING":
+            name = ["Jim", "Gary"][ply % 2]
+            move = rng.choice(list(games[0].legal_moves(name)))
+            status = games[1].play(ply % 2, encode_move(move))
+            if move[0] == "move":
+                result = games[0].move_piece(name, move[1], move[2], move[3])
+            else:
+                result = games[0].reserved_move(name, move[1])
+            self.assertEqual(result, results[status].replace("Jim", name))
+            ply += 1
+
+        self.assertEqual(game_position(games[0])[:3], game_position(games[1])[:3])
+        self.assertEqual(games[0].get_hash(), games[1].get_hash())
+
+    def test_apply_moves(self):
+        """tests that apply_moves makes a sequence of moves and stops at an illegal move"""
+        moves = [("move", (0, 0), (0, 1), 1), ("move", (0, 2), (0, 3), 1),
+                 ("move", (0, 1), (0, 3), 2), ("move", (1, 0), (1, 1), 1)]
+        games = [FocusGame(("Jim", "R"), ("Gary", "G")), FocusGame(("Jim", "R"), ("Gary", "G"), PackedBoard)]
+        for ply in range(0, len(moves)):
+            games[0].move_piece(["Jim", "Gary"][ply % 2], moves[ply][1], moves[ply][2], moves[ply][3])
+
+        self.assertEqual((4, "PLAYING"), games[1].apply_moves([encode_move(move) for move in moves[:2]] + moves[2:]))
+        self.assertEqual(game_position(games[0])[:3], game_position(games[1])[:3])
+        self.assertEqual("Gary", games[1].get_last_player().get_name())
+        self.assertEqual((1, "PLAYING"), games[1].apply_moves([("move", (0, 3), (0, 4), 1), ("reserve", (0, 0))]))
+        self.assertEqual((0, "PLAYING"), games[1].apply_moves([("move", (1, 1), (1, 2), 1)], 0))
+
+    def test_apply_moves_win(self):
+        """tests that apply_moves stops at the move that wins the game"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+        for i in range(0, 5):
+            game.get_player_b().inc_captured()
+        for i in range(0, 4):
+            game.get_board().get_stack((0, 4)).add("G")     # sets (0, 4) to RGGGG
+        game.get_player_b().inc_reserve()
+
+        self.assertEqual((2, "Gary Wins"), game.apply_moves([("move", (0, 0), (0, 1), 1), ("reserve", (0, 4)),
+                                                             ("move", (1, 2), (0, 2), 1)]))
+
+    def test_features(self):
+        """tests the evaluation features of a position from each player's side"""
+        for board_class in [Board, PackedBoard]:
+            game = FocusGame(("Jim", "R"), ("Gary", "G"), board_class)
+            for color in ["G", "G", "R"]:
+                game.get_board().get_stack((0, 0)).add(color)   # sets (0, 0) to RGGR
+            game.get_player_a().inc_reserve()
+            game.get_player_b().inc_captured()
+
+            self.assertEqual([0, 2, 1, 0], list(game.get_board().get_features()))
+            self.assertEqual((-1, 1, 0, 2, 1), game.get_features(game.get_player_a()))
+            self.assertEqual((1, -1, 0, -2, -1), game.get_features(game.get_player_b()))
+
+    def test_features_follow_moves(self):
+        """tests that the running features always match the features counted from the whole board"""
+        for board_class in [Board, PackedBoard]:
+            game = FocusGame(("Jim", "R"), ("Gary", "G"), board_class)
+            play_random(game, 60, 9)
+            features = list(game.get_board().get_features())
+            game.get_board().reset_tracking()
+            self.assertEqual(list(game.get_board().get_features()), features)
+            while game.unmake_move():
+                pass
+            self.assertEqual([0, 0, 0, 0], list(game.get_board().get_features()))
@@ -0,0 +1,76 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: unittests for FocusMCTS.py
+
+import unittest
+from FocusGame import FocusGame
+from FocusMCTS import MCTSNode, MCTSPlayer, run_tree
+
+
+class MCTSNodeTests(unittest.TestCase):
+    """Includes unittests for MCTSNode class"""
+
+    def test_nodeSelect(self):
+        """tests that select_child prefers the child with the better UCT value"""
+        root = MCTSNode(None, None, [])
+        good = root.add_child("good", [])
+        bad = root.add_child("bad", [])
+        for i in range(0, 10):
+            root.update(0.0)
+            good.update(1.0)
+            bad.update(0.0)
+
+        self.assertEqual(good, root.select_child(1.4))
+        self.assertEqual(root, good.get_parent())
+        self.assertEqual(10, good.get_visits())
+        self.assertEqual(10.0, good.get_wins())
+
+
+class MCTSPlayerTests(unittest.TestCase):
+    """Includes unittests for MCTSPlayer class and run_tree"""
+
+    def test_runTree(self):
+        """tests that run_tree counts every playout at the root and leaves the game as it found it"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+        start = game.get_hash()
+
+        stats, playouts = run_tree(game, "Jim", 50, 1.4, 20, "random", 1)
+
+        self.assertEqual(50, playouts)
+        self.assertEqual(50, sum(visits for visits, wins in stats.values()))
+        self.assertEqual(start, game.get_hash())
+        self.assertEqual([], game.get_history())
+
+    def test_searchFindsWin(self):
+        """tests that the player chooses the move that captures a sixth piece"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+        for i in range(0, 5):
+            game.get_player_a().inc_captured()
+        for i in range(0, 4):
+            game.get_board().get_stack((4, 2)).add("G")     # sets (4, 2) to GGGGG
+
+        move = MCTSPlayer(policy="greedy").search(game, "Jim", 400)
+
+        self.assertEqual("Jim Wins", game.make_move("Jim", move))
+
+    def test_searchSeeded(self):
+        """tests that searches with the same seed choose the same move and report playouts per second"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+        player1 = MCTSPlayer(max_plies=20, seed=5)
+        player2 = MCTSPlayer(max_plies=20, seed=5)
+
+        self.assertEqual(player1.search(game, "Gary", 60), player2.search(game, "Gary", 60))
+        self.assertEqual(player1.get_stats(), player2.get_stats())
+        self.assertGreater(player1.get_playouts_per_second(), 0)
+
+    def test_searchWorkers(self):
+        """tests that the playouts of several worker processes are added together"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+        player = MCTSPlayer(workers=2, max_plies=10)
+        try:
+            move = player.search(game, "Jim", 40)
+        finally:
+            player.close()
+
+        self.assertIn(move, list(game.legal_moves("Jim")))
+        self.assertEqual(40, sum(visits for visits, wins in player.get_stats().values()))
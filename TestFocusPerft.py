@@ -0,0 +1,48 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: unittests for FocusPerft.py
+
+import unittest
+from FocusGame import PackedBoard
+from FocusPerft import POSITIONS, position_game, perft, reference_perft, benchmark
+
+# perft counts at depths 1, 2 and 3 for each test position
+EXPECTED = {
+    "start": [60, 3452, 204448],
+    "stacks": [57, 3251, 183313],
+    "reserve": [73, 6186, 462911],
+}
+
+
+class PerftTests(unittest.TestCase):
+    """Includes unittests for perft and the test positions"""
+
+    def test_perftCounts(self):
+        """tests that perft gives the known counts for every test position at depths 1 and 2"""
+        for position in POSITIONS:
+            game, player_name = position_game(position)
+            self.assertEqual(EXPECTED[position][:2], [perft(game, player_name, 1), perft(game, player_name, 2)])
+
+    def test_perftMatchesReference(self):
+        """tests that perft counts the same moves as trying every move with the verify methods"""
+        for position in POSITIONS:
+            game, player_name = position_game(position)
+            self.assertEqual(reference_perft(game, player_name, 2), perft(game, player_name, 2))
+
+    def test_perftPackedDepth3(self):
+        """tests that perft gives the known depth 3 count on a PackedBoard and leaves the game as it was"""
+        game, player_name = position_game("stacks", PackedBoard)
+        start = game.get_hash()
+
+        self.assertEqual(EXPECTED["stacks"][2], perft(game, player_name, 3))
+        self.assertEqual(start, game.get_hash())
+        self.assertEqual(len(POSITIONS["stacks"]), len(game.get_history()))
+
+    def test_benchmark(self):
+        """tests that the benchmark reports a count and a rate for each position and backend"""
+        results = benchmark(1, ["start", "reserve"])
+
+        self.assertEqual(4, len(results))
+        for result in results:
+            self.assertEqual(EXPECTED[result["position"]][0], result["nodes"])
+            self.assertGreater(result["nodes_per_second"], 0)
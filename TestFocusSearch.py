@@ -0,0 +1,121 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: unittests for FocusSearch.py
+
+import unittest
+from FocusGame import FocusGame
+from FocusSearch import TranspositionTable, Engine, EXACT, LOWER, UPPER, WIN_SCORE
+
+
+class TranspositionTableTests(unittest.TestCase):
+    """Includes unittests for TranspositionTable class"""
+
+    def test_tableSize(self):
+        """tests that the table uses the largest power of two buckets that fits in its memory"""
+        table = TranspositionTable(1024)
+
+        self.assertEqual(32, table.get_size())
+        self.assertLessEqual(table.get_size() * TranspositionTable.SLOT_BYTES, 1024)
+
+    def test_storeProbe(self):
+        """tests that a stored entry is found by its key and that probes count hits and misses"""
+        table = TranspositionTable(1024)
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+        key = game.get_hash()
+        move = ("move", (0, 0), (0, 1), 1)
+
+        self.assertIsNone(table.probe(key))
+        table.store(key, 3, 25, EXACT, move)
+
+        self.assertEqual((3, 25, EXACT, move), table.probe(key))
+        self.assertEqual(1, table.get_stats()["hits"])
+        self.assertEqual(1, table.get_stats()["misses"])
+        self.assertEqual(1, table.get_stats()["stores"])
+
+    def test_replacement(self):
+        """
+        tests that a deeper entry keeps the depth-preferred slot, a shallower entry for another position
+        goes in the always-replace slot, and a probe of a third position sharing the bucket is a collision.
+        """
+        table = TranspositionTable(1024)
+        buckets = table.get_size() // 2
+
+        table.store(5, 6, 10, LOWER, "deep")
+        table.store(5 + buckets, 2, 20, UPPER, "shallow")
+        table.store(5 + 2 * buckets, 1, 30, EXACT, "newer")
+
+        self.assertEqual((6, 10, LOWER, "deep"), table.probe(5))
+        self.assertIsNone(table.probe(5 + buckets))
+        self.assertEqual((1, 30, EXACT, "newer"), table.probe(5 + 2 * buckets))
+        self.assertEqual(1, table.get_stats()["collisions"])
+
+        table.store(5 + buckets, 8, 40, EXACT, "deeper")
+
+        self.assertEqual((8, 40, EXACT, "deeper"), table.probe(5 + buckets))
+        self.assertIsNone(table.probe(5))
+
+    def test_clear(self):
+        """tests that clear empties the table and resets its statistics"""
+        table = TranspositionTable(1024)
+
+        table.store(9, 2, -5, UPPER, None)
+        table.probe(9)
+        table.clear()
+
+        self.assertIsNone(table.probe(9))
+        self.assertEqual({"slots": 32, "hits": 0, "misses": 1, "collisions": 0, "stores": 0},
+                         table.get_stats())
+
+
+class EngineTests(unittest.TestCase):
+    """Includes unittests for Engine class"""
+
+    def test_engineFindsWin(self):
+        """tests that the engine plays a move that captures a sixth piece and scores it as a win"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+        for i in range(0, 5):
+            game.get_player_a().inc_captured()
+        for i in range(0, 4):
+            game.get_board().get_stack((4, 2)).add("G")     # sets (4, 2) to GGGGG
+
+        move, score, pv = Engine().search(game, "Jim", max_depth=2)
+
+        self.assertEqual("Jim Wins", game.make_move("Jim", move))
+        self.assertEqual(WIN_SCORE - 1, score)
+        self.assertEqual([move], pv)
+
+    def test_engineRestoresGame(self):
+        """tests that a search leaves the game exactly as it found it and returns a legal principal variation"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+        game.move_piece("Gary", (1, 0), (0, 0), 1)
+        start = game.get_hash()
+        engine = Engine(TranspositionTable(1024 * 1024))
+
+        move, score, pv = engine.search(game, "Jim", max_depth=3)
+
+        self.assertEqual(start, game.get_hash())
+        self.assertEqual([], game.get_history())
+        self.assertEqual(3, engine.get_depth())
+        self.assertEqual(move, pv[0])
+        names = ["Jim", "Gary"]
+        for ply in range(0, len(pv)):
+            self.assertIn(pv[ply], list(game.legal_moves(names[ply % 2])))
+            game.make_move(names[ply % 2], pv[ply])
+        self.assertGreater(engine.get_table().get_stats()["hits"], 0)
+
+    def test_engineNodeBudget(self):
+        """tests that the search stops within its node budget and still returns a legal move"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+        engine = Engine()
+
+        move, score, pv = engine.search(game, "Jim", max_nodes=500)
+
+        self.assertLessEqual(engine.get_nodes(), 501)
+        self.assertIn(move, list(game.legal_moves("Jim")))
+
+    def test_engineNoMoves(self):
+        """tests that the search returns no move when it is not the player's turn"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+        game.move_piece("Jim", (0, 0), (0, 1), 1)
+
+        self.assertEqual((None, -WIN_SCORE, []), Engine().search(game, "Jim", max_depth=2))
@@ -0,0 +1,84 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: unittests for FocusServer.py
+
+import asyncio
+import os
+import socket
+import tempfile
+import unittest
+from FocusGame import PackedBoard
+from FocusServer import FocusServer
+
+
+async def exchange(server, lines, path=None):
+    """starts the server, sends all the request lines in one write, returns the response lines"""
+    listener = await server.start(path=path)
+    async with listener:
+        if path is None:
+            reader, writer = await asyncio.open_connection(*listener.sockets[0].getsockname()[:2])
+        else:
+            reader, writer = await asyncio.open_unix_connection(path)
+        writer.write("".join(line + "\n" for line in lines).encode("utf-8"))
+        await writer.drain()
+        responses = [(await reader.readline()).decode("utf-8").rstrip("\n") for line in lines]
+        writer.close()
+        await writer.wait_closed()
+    return responses
+
+
+class FocusServerTests(unittest.TestCase):
+    """Includes unittests for the FocusServer requests and connections"""
+
+    def test_handleGame(self):
+        """tests that requests start games, make moves and show pieces by game id"""
+        server = FocusServer()
+
+        self.assertEqual("OK 1", server.handle("new Jim R Gary G"))
+        self.assertEqual("OK 2", server.handle("new Ann G Bob R"))
+        self.assertEqual("OK successfully moved", server.handle("move_piece 1 Jim 0 0 0 1 1"))
+        self.assertEqual("OK R R", server.handle("show_pieces 1 0 1"))
+        self.assertEqual("OK", server.handle("show_pieces 1 0 0"))
+        self.assertEqual("OK G", server.handle("show_pieces 2 0 1"))
+        self.assertEqual("ERR invalid move", server.handle("move_piece 1 Jim 0 1 0 2 1"))
+        self.assertEqual("ERR invalid move", server.handle("reserved_move 1 Gary 0 0"))
+        self.assertEqual("OK 0", server.handle("show_reserve 1 Gary"))
+        self.assertEqual("OK PLAYING", server.handle("state 1"))
+        self.assertEqual("OK", server.handle("close 2"))
+        self.assertEqual([1], list(server.get_games()))
+
+    def test_handleErrors(self):
+        """tests that bad requests are answered with ERR and leave the games as they were"""
+        server = FocusServer(max_games=1)
+        server.handle("new Jim R Gary G")
+
+        self.assertEqual("ERR empty request", server.handle(""))
+        self.assertEqual("ERR unknown command jump", server.handle("jump 1"))
+        self.assertEqual("ERR no game 7", server.handle("state 7"))
+        self.assertEqual("ERR no player Bob", server.handle("move_piece 1 Bob 0 0 0 1 1"))
+        self.assertTrue(server.handle("move_piece 1 Jim 0 x 0 1 1").startswith("ERR"))
+        self.assertEqual("ERR off the board", server.handle("show_pieces 1 6 0"))
+        self.assertEqual("ERR too many games", server.handle("new Ann R Bob G"))
+        self.assertEqual(["R"], server.get_games()[1].show_pieces((0, 0)))
+
+    def test_tcpPipelined(self):
+        """tests that pipelined requests over TCP are all answered in order"""
+        server = FocusServer(PackedBoard)
+        lines = ["new Jim R Gary G", "move_piece 1 Jim 0 0 0 1 1", "show_pieces 1 0 1", "state 9"]
+
+        responses = asyncio.run(exchange(server, lines))
+
+        self.assertEqual(["OK 1", "OK successfully moved", "OK R R", "ERR no game 9"], responses)
+
+    @unittest.skipIf(not hasattr(socket, "AF_UNIX"), "Unix sockets are not available")
+    def test_unixSocketManyGames(self):
+        """tests that one connection over a Unix socket can play many games at once"""
+        server = FocusServer()
+        lines = ["new Jim R Gary G"] * 500 + ["move_piece " + str(game) + " Jim 0 0 0 1 1" for game in range(1, 501)]
+
+        with tempfile.TemporaryDirectory() as folder:
+            responses = asyncio.run(exchange(server, lines, os.path.join(folder, "focus.sock")))
+
+        self.assertEqual(["OK " + str(game) for game in range(1, 501)], responses[:500])
+        self.assertEqual(["OK successfully moved"] * 500, responses[500:])
+        self.assertEqual(1000, server.get_requests())
@@ -0,0 +1,62 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: unittests for FocusStats.py
+
+import io
+import json
+import unittest
+from FocusGame import FocusGame
+from FocusStats import METHODS, GameStats, instrument, uninstrument
+
+
+class FocusStatsTests(unittest.TestCase):
+    """Includes unittests for instrumenting FocusGame"""
+
+    def test_instrumentCounts(self):
+        """tests that an instrumented game counts its calls, captures, reserves and trims"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+        for color in ["R", "G", "R", "G"]:
+            game.get_board().get_stack((0, 0)).add("R")     # sets (0, 0) to RRRRR
+            game.get_board().get_stack((0, 3)).add(color)   # sets (0, 3) to GRGRG
+        game.get_player_b().inc_reserve()
+        stats = instrument(game)
+
+        self.assertEqual("successfully moved", game.move_piece("Jim", (0, 0), (0, 3), 3))   # trims G, R and G
+        self.assertFalse(game.move_piece("Jim", (0, 0), (0, 1), 1))
+        self.assertEqual("successfully moved", game.reserved_move("Gary", (1, 1)))
+        result = stats.get_stats()
+
+        self.assertEqual(2, result["move_piece"]["calls"])
+        self.assertEqual(1, result["reserved_move"]["calls"])
+        self.assertEqual(3, result["verify_move"]["calls"])
+        self.assertEqual(2, result["check_endgame"]["calls"])
+        self.assertEqual(2, sum(result["move_piece"]["histogram"]))
+        self.assertGreater(result["move_piece"]["p99"], 0)
+        self.assertEqual(2, result["captures"])
+        self.assertEqual(1, result["reserves"])
+        self.assertEqual(1, result["trims"])
+
+    def test_uninstrument(self):
+        """tests that games not instrumented, or no longer instrumented, record nothing"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+        other = FocusGame(("Jim", "R"), ("Gary", "G"))
+        stats = instrument(game)
+        other.move_piece("Jim", (0, 0), (0, 1), 1)
+        uninstrument(game)
+        game.move_piece("Jim", (0, 0), (0, 1), 1)
+
+        self.assertEqual(0, sum(stats.get_stats()[name]["calls"] for name in METHODS))
+        self.assertNotIn("move_piece", vars(other))
+
+    def test_dump(self):
+        """tests that dump writes the statistics as one JSON line and reset clears them"""
+        stats = GameStats()
+        stats.record_call("verify_move", 1000)
+        stream = io.StringIO()
+
+        stats.dump(stream)
+        stats.reset()
+
+        self.assertEqual(1, json.loads(stream.getvalue())["verify_move"]["calls"])
+        self.assertEqual(1024 / 1e9, json.loads(stream.getvalue())["verify_move"]["p50"])
+        self.assertEqual(0, stats.get_stats()["verify_move"]["calls"])
@@ -0,0 +1,62 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: unittests for FocusSymmetry.py
+
+import unittest
+from FocusGame import Board, PackedBoard, FocusGame
+from FocusSymmetry import SYMMETRIES, MIRROR, FLIP_SWAP, transform_coord, transform_move, symmetric_hashes, \
+    canonical_hash, transform_game
+from TestFocusGame import play_random
+
+
+class FocusSymmetryTests(unittest.TestCase):
+    """Includes unittests for transforming positions and moves and for the canonical hash"""
+
+    def test_startSymmetric(self):
+        """tests that the starting position is its own image under every symmetry"""
+        game = FocusGame(("Jim", "R"), ("Gary", "G"))
+
+        self.assertEqual([game.get_hash()] * 4, symmetric_hashes(game))
+        for symmetry in SYMMETRIES:
+            image = transform_game(game, symmetry)
+            self.assertEqual(game.get_board().get_colored_board(), image.get_board().get_colored_board())
+
+    def test_transformCoord(self):
+        """tests that the symmetries move coordinates and are their own inverses"""
+        self.assertEqual((0, 5), transform_coord((0, 0), MIRROR, 6))
+        self.assertEqual((5, 1), transform_coord((0, 1), FLIP_SWAP, 6))
+        self.assertEqual((7, 6), transform_coord((0, 1), MIRROR | FLIP_SWAP, 8))
+        move = ("move", (1, 2), (1, 4), 2)
+        for symmetry in SYMMETRIES:
+            self.assertEqual(move, transform_move(transform_move(move, symmetry, 6), symmetry, 6))
+
+    def test_hashesMatchTransformedGames(self):
+        """tests that the hash of each transformed game is the symmetric hash, and that moves transform"""
+        for board_class in [Board, PackedBoard]:
+            game = FocusGame(("Jim", "R"), ("Gary", "G"), board_class)
+            movers = play_random(game, 31, 3)
+            to_move = "Jim" if movers[-1] == "Gary" else "Gary"
+            hashes = symmetric_hashes(game)
+            for symmetry in SYMMETRIES:
+                image = transform_game(game, symmetry)
+                image_to_move = to_move
+                if symmetry & FLIP_SWAP:
+                    image_to_move = "Jim" if to_move == "Gary" else "Gary"
+                self.assertEqual(hashes[symmetry], image.get_hash())
+                self.assertEqual(sorted(transform_move(move, symmetry, 6) for move in game.legal_moves(to_move)),
+                                 sorted(image.legal_moves(image_to_move)))
+
+    def test_canonicalHash(self):
+        """tests that mirrored positions, and positions flipped with the players swapped, share a canonical hash"""
+        games = [FocusGame(("Jim", "R"), ("Gary", "G")) for i in range(0, 3)]
+        games[0].move_piece("Jim", (0, 0), (0, 1), 1)
+        games[1].move_piece("Jim", (0, 5), (0, 4), 1)
+        games[2].move_piece("Gary", (5, 0), (5, 1), 1)
+
+        keys = [canonical_hash(game)[0] for game in games]
+
+        self.assertEqual(keys[0], keys[1])
+        self.assertEqual(keys[0], keys[2])
+        self.assertNotEqual(games[0].get_hash(), games[1].get_hash())
+        key, symmetry = canonical_hash(games[2])
+        self.assertEqual(key, transform_game(games[2], symmetry).get_hash())
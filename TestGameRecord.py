@@ -0,0 +1,106 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: unittests for GameRecord.py
+
+import os
+import random
+import tempfile
+import unittest
+from FocusGame import FocusGame, PackedBoard
+from GameRecord import GameRecordWriter, read_records, replay
+
+
+class GameRecordTests(unittest.TestCase):
+    """Includes unittests for GameRecordWriter, read_records and replay"""
+
+    def setUp(self):
+        """creates an empty log file for each test"""
+        handle, self.path = tempfile.mkstemp(suffix=".fglog")
+        os.close(handle)
+
+    def tearDown(self):
+        """removes the test's log file"""
+        os.remove(self.path)
+
+    def record_random_game(self, writer, game, plies, seed):
+        """makes and records up to plies random moves, returns the game"""
+        rng = random.Random(seed)
+        names = [game.get_player_a().get_name(), game.get_player_b().get_name()]
+        for ply in range(0, plies):
+            moves = list(game.legal_moves(names[ply % 2]))
+            if not moves:
+                break
+            move = rng.choice(moves)
+            game.make_move(names[ply % 2], move)
+            writer.write_move(ply % 2, move)
+        return game
+
+    def test_recordReplay(self):
+        """tests that replaying a log reaches the same positions as the games that were recorded"""
+        with GameRecordWriter(self.path) as writer:
+            writer.begin_game(("Jim", "R"), ("Gary", "G"))
+            first = self.record_random_game(writer, FocusGame(("Jim", "R"), ("Gary", "G")), 1000, 1)
+            second = FocusGame(("Ann", "B"), ("Bo", "W"))
+            second.move_piece("Bo", (0, 2), (0, 1), 1)
+            writer.begin_snapshot(second)
+            self.record_random_game(writer, second, 50, 2)
+
+        finals = {}
+        moves = {0: 0, 1: 0}
+        for number, game, move, result in replay(self.path, PackedBoard):
+            finals[number] = game.get_hash()
+            moves[number] += 1
+
+        self.assertEqual(first.get_hash(), finals[0])
+        self.assertEqual(second.get_hash(), finals[1])
+        self.assertEqual(len(first.get_history()), moves[0])
+        self.assertEqual(50, moves[1])
+        self.assertNotEqual("PLAYING", first.get_game_state())
+
+    def test_readRecords(self):
+        """tests that the records are read back in order, and that the log is appended to"""
+        with GameRecordWriter(self.path) as writer:
+            writer.begin_game(("Jim", "R"), ("Gary", "G"))
+            writer.write_move(0, ("move", (0, 0), (0, 1), 1))
+        with GameRecordWriter(self.path) as writer:
+            writer.write_move(1, ("reserve", (5, 4)))
+
+        self.assertEqual([("game", ("Jim", "R"), ("Gary", "G")),
+                          ("move", 0, ("move", (0, 0), (0, 1), 1)),
+                          ("move", 1, ("reserve", (5, 4)))], list(read_records(self.path)))
+        self.assertEqual(14 + 2 * 5, os.path.getsize(self.path))
+
+    def test_replayIllegalMove(self):
+        """tests that replay raises ValueError for a recorded move that is not legal"""
+        with GameRecordWriter(self.path) as writer:
+            writer.begin_game(("Jim", "R"), ("Gary", "G"))
+            writer.write_move(0, ("move", (0, 0), (0, 1), 1))
+            writer.write_move(0, ("move", (0, 1), (0, 3), 2))
+
+        replayed = replay(self.path)
+        next(replayed)
+        self.assertRaises(ValueError, next, replayed)
+
+    def test_truncatedRecord(self):
+        """tests that a record cut short raises ValueError naming its offset after the whole records are read"""
+        with GameRecordWriter(self.path) as writer:
+            writer.begin_game(("Jim", "R"), ("Gary", "G"))
+            writer.write_move(0, ("move", (0, 0), (0, 1), 1))
+        for cut in [1, 3]:
+            with open(self.path, "r+b") as log:
+                log.truncate(14 + 5 - cut)
+
+            records = read_records(self.path)
+            self.assertEqual("game", next(records)[0])
+            with self.assertRaises(ValueError) as caught:
+                next(records)
+            self.assertIn("byte 14", str(caught.exception))
+
+    def test_longNames(self):
+        """tests that a name or color over 255 bytes raises ValueError without writing to the log"""
+        with GameRecordWriter(self.path) as writer:
+            self.assertRaises(ValueError, writer.begin_game, ("J" * 256, "R"), ("Gary", "G"))
+            self.assertRaises(ValueError, writer.begin_game, ("Jim", "R"), ("Gary", "é" * 128))
+            writer.begin_game(("J" * 255, "R"), ("Gary", "G"))
+
+        self.assertEqual([("game", ("J" * 255, "R"), ("Gary", "G"))], list(read_records(self.path)))
@@ -0,0 +1,84 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: unittests for OpeningBook.py
+
+import os
+import random
+import tempfile
+import unittest
+from FocusGame import FocusGame
+from GameRecord import GameRecordWriter
+from OpeningBook import OpeningBookBuilder, OpeningBook
+
+
+class OpeningBookTests(unittest.TestCase):
+    """Includes unittests for OpeningBookBuilder and OpeningBook classes"""
+
+    def setUp(self):
+        """creates empty book and log files for each test"""
+        handle, self.path = tempfile.mkstemp(suffix=".fgbook")
+        os.close(handle)
+        handle, self.log = tempfile.mkstemp(suffix=".fglog")
+        os.close(handle)
+
+    def tearDown(self):
+        """removes the test's files"""
+        os.remove(self.path)
+        os.remove(self.log)
+
+    def test_bookLookup(self):
+        """tests that a written book returns each position's moves and statistics, and nothing for others"""
+        start = FocusGame(("Jim", "R"), ("Gary", "G"))
+        first = ("move", (0, 0), (0, 1), 1)
+        second = ("move", (2, 0), (2, 1), 1)
+        builder = OpeningBookBuilder()
+        builder.add(start.get_hash(), first, True, 40)
+        builder.add(start.get_hash(), first, False, 60)
+        builder.add(start.get_hash(), second, True, 30)
+        for key in range(0, 50):
+            builder.add(key, second, False, 10)
+        builder.write(self.path)
+
+        with OpeningBook(self.path) as book:
+            self.assertEqual(52, book.get_count())
+            self.assertEqual([(first, 2, 1, 50.0), (second, 1, 1, 30.0)], book.lookup(start.get_hash()))
+            self.assertEqual([(second, 1, 0, 10.0)], book.lookup(17))
+            self.assertEqual([], book.lookup(start.get_hash() + 1))
+            self.assertEqual(first, book.best_move(start, "Jim"))
+            self.assertIsNone(book.best_move(start, "Jim", min_visits=3))
+
+    def test_bookFromLog(self):
+        """tests that a book built from a game log holds the opening moves of its games"""
+        rng = random.Random(4)
+        openings = set()
+        with GameRecordWriter(self.log) as writer:
+            for number in range(0, 3):
+                game = FocusGame(("Jim", "R"), ("Gary", "G"))
+                writer.begin_game(("Jim", "R"), ("Gary", "G"))
+                names = ["Jim", "Gary"]
+                for ply in range(0, 1000):
+                    moves = list(game.legal_moves(names[ply % 2]))
+                    if not moves:
+                        break
+                    move = rng.choice(moves)
+                    if ply == 0:
+                        openings.add(move)
+                    game.make_move(names[ply % 2], move)
+                    writer.write_move(ply % 2, move)
+        builder = OpeningBookBuilder()
+        builder.add_log(self.log, 2)
+        builder.write(self.path)
+
+        with OpeningBook(self.path) as book:
+            start = FocusGame(("Jim", "R"), ("Gary", "G"))
+            found = book.lookup(start.get_hash())
+            self.assertEqual(openings, set(move for move, visits, wins, plies in found))
+            self.assertEqual(3, sum(visits for move, visits, wins, plies in found))
+            self.assertLessEqual(book.get_count(), 6)
+
+    def test_notABook(self):
+        """tests that opening a file that is not a book raises ValueError"""
+        with open(self.path, "wb") as book:
+            book.write(b"\0" * 64)
+
+        self.assertRaises(ValueError, OpeningBook, self.path)
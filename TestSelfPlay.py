@@ -0,0 +1,43 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: unittests for SelfPlay.py
+
+import random
+import unittest
+from FocusGame import FocusGame
+from FocusSearch import Engine
+from SelfPlay import choose_move, play_game, run_selfplay
+
+
+class SelfPlayTests(unittest.TestCase):
+    """Includes unittests for the self-play functions"""
+
+    def test_choose_move_greedy(self):
+        """tests that the greedy policy takes a move that wins the game"""
+        game = FocusGame(("A", "R"), ("B", "G"))
+        for i in range(0, 5):
+            game.get_player_a().inc_captured()
+        for i in range(0, 4):
+            game.get_board().get_stack((4, 2)).add("G")     # sets (4, 2) to GGGGG
+
+        move = choose_move("greedy", game, "A", random.Random(0), Engine(), 1)
+
+        self.assertEqual("A Wins", game.make_move("A", move))
+
+    def test_play_game(self):
+        """tests that a game is played to the end and replays the same way from its seed"""
+        result = play_game((3, "random", "greedy", 11, 1000, 1, "board"))
+
+        self.assertEqual(3, result["game"])
+        self.assertIn(result["winner"], ["A", "B"])
+        self.assertEqual(6, max(result["captured"]))
+        self.assertEqual(result, play_game((3, "random", "greedy", 11, 1000, 1, "board")))
+        self.assertEqual(result, play_game((3, "random", "greedy", 11, 1000, 1, "packed")))
+
+    def test_run_selfplay_workers(self):
+        """tests that worker processes play the same games as a single process"""
+        single = list(run_selfplay(6, "random", "random", workers=1, seed=4, max_plies=40))
+        pooled = list(run_selfplay(6, "random", "random", workers=2, seed=4, max_plies=40))
+
+        self.assertEqual(single, sorted(pooled, key=lambda result: result["game"]))
+        self.assertEqual([40] * 6, [result["plies"] for result in single])
@@ -0,0 +1,8 @@
+# Author: Justin David Todd
+# Date: 10/18/2026
+# Description: Runs Focus (Domination) self-play from the command line, see SelfPlay.py.
+
+from SelfPlay import main
+
+if __name__ == "__main__":
+    main()